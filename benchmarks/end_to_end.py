@@ -0,0 +1,173 @@
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+from benchmarks import generators
+from benchmarks.fake_server import DEFAULT_VOLUME, ENDPOINTS, FakeHebeServer
+from benchmarks.parsing import MODELS
+from sdk_python.hebe import API, Certificate
+from sdk_python.hebe.client import Client
+from sdk_python.hebe.metrics import MetricsRegistry
+from sdk_python.hebe.session import SessionRegistry
+from sdk_python.hebe.streaming import ijson
+
+REPEAT: int = 3
+PUPIL_ID: int = 1
+PERIOD_ID: int = 1
+DATE_FROM: date = generators.START.date()
+DATE_TO: date = DATE_FROM + timedelta(days=7)
+MODES: dict[str, dict[str, Any]] = {
+    "validated": {},
+    "trusted": {"trusted": True},
+    "lazy": {"lazy": True},
+    "streaming": {"trusted": True, "streaming": True},
+}
+PARSE_MODES: tuple[str, ...] = ("validated", "trusted", "lazy")
+
+Task = Callable[[Client], Awaitable[int]]
+
+
+async def sync_pupil(client: Client) -> int:
+    results: list[list] = await asyncio.gather(
+        client.get_grades_by_pupil_and_period(PUPIL_ID, PERIOD_ID),
+        client.get_schedule_by_pupil(PUPIL_ID, date_from=DATE_FROM, date_to=DATE_TO),
+        client.get_schedule_changes_by_pupil(
+            PUPIL_ID, date_from=DATE_FROM, date_to=DATE_TO
+        ),
+        client.get_homework_by_pupil(PUPIL_ID),
+        client.get_exams_by_pupil(PUPIL_ID),
+        client.get_notes_by_pupil(PUPIL_ID),
+        client.get_meetings_by_pupil(PUPIL_ID, DATE_FROM),
+        client.get_teachers_by_pupil_and_period(PUPIL_ID, PERIOD_ID),
+        client.get_time_slots(),
+    )
+    return sum(map(len, results))
+
+
+async def get_all_grades(client: Client) -> int:
+    return len(
+        await client.api.get_all(
+            "grade//byPupil", {"pupilId": PUPIL_ID, "periodId": PERIOD_ID}
+        )
+    )
+
+
+async def measure(
+    server: FakeHebeServer, task: Task, repeat: int, **api_options
+) -> dict[str, Any]:
+    certificate: Certificate = Certificate.create().copy(
+        update={"rest_url": server.rest_url}
+    )
+    best: float = float("inf")
+    items: int = 0
+    requests: int = 0
+    metrics: MetricsRegistry = MetricsRegistry()
+    async with SessionRegistry(trace_configs=[metrics.trace_config()]) as registry:
+        for _ in range(repeat):
+            metrics.clear()
+            server.requests = 0
+            async with API(
+                certificate, session_registry=registry, metrics=metrics, **api_options
+            ) as api, Client(api) as client:
+                api.dictionary_cache.invalidate(server.rest_url)
+                start: float = time.perf_counter()
+                items = await task(client)
+                elapsed: float = time.perf_counter() - start
+            if elapsed < best:
+                best = elapsed
+                requests = server.requests
+    received: float = sum(
+        metrics.counters.get("hebe_response_bytes_total", {}).values()
+    )
+    return {
+        "elapsed": best,
+        "items": items,
+        "requests": requests,
+        "items_per_second": items / best,
+        "requests_per_second": requests / best,
+        "response_bytes": int(received),
+    }
+
+
+def measure_parsing(server: FakeHebeServer, repeat: int) -> dict[str, Any]:
+    certificate: Certificate = Certificate.create()
+    results: dict[str, Any] = {}
+    for endpoint, name in ENDPOINTS.items():
+        page: list[dict] = server.items[endpoint]
+        if not page:
+            continue
+        for mode in PARSE_MODES:
+            api: API = API(certificate, rest_url=server.rest_url, **MODES[mode])
+            best: float = float("inf")
+            for _ in range(repeat):
+                start: float = time.perf_counter()
+                api.parse_many(MODELS[name], page)
+                best = min(best, time.perf_counter() - start)
+            results[f"parse.{name}.{mode}"] = {
+                "elapsed": best,
+                "items": len(page),
+                "items_per_second": len(page) / best,
+            }
+    return results
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(volume: int, repeat: int, latency: float) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    async with FakeHebeServer(volume, latency=latency) as server:
+        for mode, api_options in MODES.items():
+            if api_options.get("streaming") and not ijson:
+                continue
+            results[f"client.sync_pupil.{mode}"] = await measure(
+                server, sync_pupil, repeat, **api_options
+            )
+        results["api.get_all.grade"] = await measure(
+            server, get_all_grades, repeat, trusted=True
+        )
+        results.update(measure_parsing(server, repeat))
+    return {
+        "commit": get_commit(),
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "volume": volume,
+        "repeat": repeat,
+        "latency": latency,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument("--volume", type=int, default=DEFAULT_VOLUME)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--output", default="benchmark-results.json")
+    args: argparse.Namespace = parser.parse_args()
+    report: dict[str, Any] = asyncio.run(run(args.volume, args.repeat, args.latency))
+    print(f"{'benchmark':40} {'items/s':>10} {'requests/s':>11} {'ms':>9}")
+    for name, result in report["results"].items():
+        print(
+            f"{name:40} {result['items_per_second']:10.0f}"
+            f" {result.get('requests_per_second', 0):11.0f}"
+            f" {result['elapsed'] * 1000:9.1f}"
+        )
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import asyncio
+import json
+from bisect import bisect_right
+from typing import Optional, Union
+from aiohttp import web
+
+from benchmarks import generators
+
+DEFAULT_VOLUME: int = 2000
+DEFAULT_SYMBOL: str = "powiatwulkanowy"
+TIME_SLOTS: int = 10
+
+ENDPOINTS: dict[str, str] = {
+    "grade//byPupil": "grade",
+    "schedule/byPupil": "schedule_entry",
+    "schedule/changes/byPupil": "schedule_change",
+    "homework/byPupil": "homework",
+    "exam/byPupil": "exam",
+    "note/byPupil": "note",
+    "meetings/byPupil": "meeting",
+    "teacher/byPeriod": "teacher",
+}
+DATE_FIELDS: dict[str, str] = {
+    "schedule/byPupil": "Date",
+    "schedule/changes/byPupil": "LessonDate",
+    "meetings/byPupil": "When",
+}
+STATUS_MESSAGES: dict[int, str] = {
+    100: "Brak uprawnień",
+    108: "Nieautoryzowany certyfikat",
+    200: "Nie znaleziono obiektu",
+}
+
+
+def get_date(request: web.Request, name: str) -> Optional[str]:
+    value: Optional[str] = request.query.get(name)
+    return value[:10] if value else None
+
+
+class FakeHebeServer:
+    def __init__(
+        self,
+        volume: Union[int, dict[str, int]] = DEFAULT_VOLUME,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        symbol: str = DEFAULT_SYMBOL,
+        latency: float = 0,
+        statuses: dict[str, int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.symbol = symbol
+        self.latency = latency
+        self.statuses: dict[str, int] = statuses or {}
+        self.requests: int = 0
+        self.items: dict[str, list[dict]] = {
+            endpoint: [
+                generators.GENERATORS[name](item_id)
+                for item_id in range(
+                    1,
+                    (volume.get(name, 0) if isinstance(volume, dict) else volume) + 1,
+                )
+            ]
+            for endpoint, name in ENDPOINTS.items()
+        }
+        self.items["dictionary/timeslot"] = [
+            generators.time_slot(position) for position in range(1, TIME_SLOTS + 1)
+        ]
+        self._ids: dict[str, list[int]] = {
+            endpoint: [item["Id"] for item in items]
+            for endpoint, items in self.items.items()
+        }
+        self._bodies: dict[tuple, bytes] = {}
+        self._runner: web.AppRunner = None
+
+    @property
+    def rest_url(self) -> str:
+        return f"http://{self.host}:{self.port}/{self.symbol}/api"
+
+    def get_page(
+        self,
+        endpoint: str,
+        page_size: int,
+        last_id: int,
+        date_from: str = None,
+        date_to: str = None,
+    ) -> list[dict]:
+        start: int = bisect_right(self._ids[endpoint], last_id)
+        items: list[dict] = self.items[endpoint][start:]
+        field: Optional[str] = DATE_FIELDS.get(endpoint)
+        if field and (date_from or date_to):
+            items = [
+                item
+                for item in items
+                if (not date_from or item[field]["Date"] >= date_from)
+                and (not date_to or item[field]["Date"] <= date_to)
+            ]
+        return items[:page_size]
+
+    def _get_body(
+        self,
+        endpoint: str,
+        page_size: int,
+        last_id: int,
+        date_from: str = None,
+        date_to: str = None,
+    ) -> bytes:
+        key: tuple = (endpoint, page_size, last_id, date_from, date_to)
+        body: bytes = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = json.dumps(
+                generators.response(
+                    self.get_page(endpoint, page_size, last_id, date_from, date_to)
+                )
+            ).encode("utf-8")
+        return body
+
+    def _get_status_body(self, status_code: int) -> bytes:
+        return json.dumps(
+            generators.response(
+                None,
+                "IEnumerable`1",
+                status_code,
+                STATUS_MESSAGES.get(status_code, "Błąd"),
+            )
+        ).encode("utf-8")
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        endpoint: str = request.match_info["endpoint"]
+        status_code: Optional[int] = self.statuses.get(endpoint)
+        if status_code is None and endpoint not in self.items:
+            raise web.HTTPNotFound()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if status_code is not None:
+            return web.Response(
+                body=self._get_status_body(status_code),
+                content_type="application/json",
+                charset="utf-8",
+            )
+        try:
+            page_size: int = int(
+                request.query.get("pageSize", len(self.items[endpoint]))
+            )
+            last_id: int = int(request.query.get("lastId", -(2**31)))
+        except ValueError:
+            raise web.HTTPBadRequest()
+        return web.Response(
+            body=self._get_body(
+                endpoint,
+                page_size,
+                last_id,
+                get_date(request, "dateFrom") or get_date(request, "from"),
+                get_date(request, "dateTo"),
+            ),
+            content_type="application/json",
+            charset="utf-8",
+        )
+
+    def create_app(self) -> web.Application:
+        app: web.Application = web.Application()
+        app.router.add_get("/{symbol}/api/mobile/{endpoint:.+}", self.handle)
+        return app
+
+    async def start(self) -> str:
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site: web.TCPSite = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self.rest_url
+
+    async def close(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeHebeServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+
+async def serve(volume: int = DEFAULT_VOLUME, port: int = 8080) -> None:
+    async with FakeHebeServer(volume, port=port) as server:
+        print(f"Serving {volume} items per endpoint on {server.rest_url}")
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(serve())
@@ -0,0 +1,259 @@
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+START: datetime = datetime(2022, 9, 1, 8)
+
+
+def timestamp(value: datetime) -> dict[str, Any]:
+    return {
+        "Timestamp": int(value.timestamp() * 1000),
+        "Date": value.strftime("%Y-%m-%d"),
+        "DateDisplay": value.strftime("%d.%m.%Y"),
+        "Time": value.strftime("%H:%M:%S"),
+    }
+
+
+def subject(subject_id: int) -> dict[str, Any]:
+    return {
+        "Id": subject_id,
+        "Key": str(uuid.UUID(int=subject_id)),
+        "Name": f"Przedmiot {subject_id}",
+        "Kod": f"P{subject_id}",
+        "Position": subject_id,
+    }
+
+
+def employee(employee_id: int) -> dict[str, Any]:
+    return {
+        "Id": employee_id,
+        "Name": "Jan",
+        "Surname": f"Nauczyciel {employee_id}",
+        "DisplayName": f"Jan Nauczyciel {employee_id}",
+    }
+
+
+def grade_column(column_id: int, subject_id: int, period_id: int) -> dict[str, Any]:
+    return {
+        "Id": column_id,
+        "Key": str(uuid.UUID(int=column_id)),
+        "PeriodId": period_id,
+        "Name": f"Kolumna {column_id}",
+        "Code": f"K{column_id}",
+        "Group": "",
+        "Number": column_id % 20,
+        "Color": 0,
+        "Weight": float(column_id % 3 + 1),
+        "Subject": subject(subject_id),
+        "Category": None,
+    }
+
+
+def grade(grade_id: int, pupil_id: int = 1, period_id: int = 1) -> dict[str, Any]:
+    random.seed(grade_id)
+    subject_id: int = grade_id % 15 + 1
+    value: int = random.randint(1, 6)
+    created: datetime = START + timedelta(hours=grade_id)
+    return {
+        "Id": grade_id,
+        "Key": str(uuid.UUID(int=grade_id)),
+        "PupilId": pupil_id,
+        "ContentRaw": str(value),
+        "Content": str(value),
+        "Comment": None,
+        "Value": float(value),
+        "Numerator": None,
+        "Denominator": None,
+        "Nominator": None,
+        "DateCreated": timestamp(created),
+        "DateModify": timestamp(created),
+        "Creator": employee(subject_id + 100),
+        "Modifier": employee(subject_id + 100),
+        "Column": grade_column(grade_id % 60 + 1, subject_id, period_id),
+    }
+
+
+def time_slot(position: int) -> dict[str, Any]:
+    start: datetime = START + timedelta(minutes=55 * (position - 1))
+    end: datetime = start + timedelta(minutes=45)
+    return {
+        "Id": position,
+        "Position": position,
+        "Start": start.strftime("%H:%M"),
+        "End": end.strftime("%H:%M"),
+        "Display": f"{start:%H:%M}-{end:%H:%M}",
+    }
+
+
+def room(room_id: int) -> dict[str, Any]:
+    return {"Id": room_id, "Code": str(room_id)}
+
+
+def team(team_id: int) -> dict[str, Any]:
+    return {
+        "Id": team_id,
+        "Key": str(uuid.UUID(int=team_id)),
+        "DisplayName": f"{team_id}A",
+        "Symbol": f"{team_id}A",
+    }
+
+
+def schedule_entry(entry_id: int, days: int = 5) -> dict[str, Any]:
+    position: int = entry_id % 8 + 1
+    day: datetime = START + timedelta(days=entry_id // 8 % days)
+    subject_id: int = entry_id % 15 + 1
+    return {
+        "Id": entry_id,
+        "MergeChangeId": None,
+        "Event": None,
+        "Date": timestamp(day),
+        "Room": room(position + 10),
+        "TimeSlot": time_slot(position),
+        "Subject": subject(subject_id),
+        "TeacherPrimary": employee(subject_id + 100),
+        "TeacherAbsenceEffectName": None,
+        "TeacherSecondary": None,
+        "TeacherSecondary2": None,
+        "Clazz": team(1),
+        "Distribution": None,
+        "PupilAlias": None,
+        "Visible": True,
+        "Change": None,
+        "Parent": None,
+    }
+
+
+def schedule_change(change_id: int, entry_id: int) -> dict[str, Any]:
+    entry: dict[str, Any] = schedule_entry(entry_id)
+    change_type: int = change_id % 4 + 1
+    return {
+        "Id": change_id,
+        "UnitId": 1,
+        "ScheduleId": entry_id,
+        "LessonDate": entry["Date"],
+        "Note": None,
+        "Reason": "Nieobecność nauczyciela",
+        "TimeSlot": entry["TimeSlot"] if change_type == 3 else None,
+        "Room": None,
+        "TeacherPrimary": employee(200) if change_type == 2 else None,
+        "TeacherSecondary": None,
+        "Subject": None,
+        "Event": None,
+        "Change": {
+            "Id": change_id,
+            "Type": change_type,
+            "IsMerge": False,
+            "Separation": False,
+        },
+        "ChangeDate": entry["Date"] if change_type == 3 else None,
+        "Clazz": team(1),
+        "Distribution": None,
+    }
+
+
+def homework(homework_id: int, pupil_id: int = 1) -> dict[str, Any]:
+    created: datetime = START + timedelta(days=homework_id % 180)
+    subject_id: int = homework_id % 15 + 1
+    return {
+        "Id": homework_id,
+        "Key": str(uuid.UUID(int=homework_id)),
+        "IdPupil": pupil_id,
+        "IdHomework": homework_id,
+        "Content": f"Zadanie {homework_id}",
+        "IsAnswerRequired": False,
+        "DateCreated": timestamp(created),
+        "Date": timestamp(created),
+        "AnswerDate": None,
+        "Deadline": timestamp(created + timedelta(days=7)),
+        "Creator": employee(subject_id + 100),
+        "Subject": subject(subject_id),
+        "Attachments": [],
+    }
+
+
+def exam(exam_id: int, pupil_id: int = 1) -> dict[str, Any]:
+    created: datetime = START + timedelta(days=exam_id % 180)
+    subject_id: int = exam_id % 15 + 1
+    return {
+        "Id": exam_id,
+        "Key": str(uuid.UUID(int=exam_id)),
+        "Type": ("Kartkówka", "Sprawdzian", "Praca klasowa")[exam_id % 3],
+        "TypeId": exam_id % 3 + 1,
+        "Content": f"Sprawdzian {exam_id}",
+        "DateCreated": timestamp(created),
+        "DateModify": timestamp(created),
+        "Deadline": timestamp(created + timedelta(days=7)),
+        "Creator": employee(subject_id + 100),
+        "Subject": subject(subject_id),
+        "PupilId": pupil_id,
+    }
+
+
+def note(note_id: int, pupil_id: int = 1) -> dict[str, Any]:
+    created: datetime = START + timedelta(days=note_id % 180)
+    return {
+        "Id": note_id,
+        "Key": str(uuid.UUID(int=note_id)),
+        "IdPupil": pupil_id,
+        "Positive": note_id % 2 == 0,
+        "DateValid": timestamp(created),
+        "DateModify": timestamp(created),
+        "Creator": employee(note_id % 15 + 101),
+        "Category": None,
+        "Content": f"Uwaga {note_id}",
+        "Points": None,
+    }
+
+
+def meeting(meeting_id: int) -> dict[str, Any]:
+    return {
+        "Id": meeting_id,
+        "Why": f"Zebranie {meeting_id}",
+        "When": timestamp(START + timedelta(days=meeting_id * 30)),
+        "Where": "Sala 1",
+        "Agenda": "",
+        "Online": None,
+        "AdditionalInfo": None,
+    }
+
+
+def teacher(teacher_id: int) -> dict[str, Any]:
+    return {
+        "Id": teacher_id,
+        "Name": "Jan",
+        "Surname": f"Nauczyciel {teacher_id}",
+        "DisplayName": f"Jan Nauczyciel {teacher_id}",
+        "Position": 1,
+        "Description": f"Przedmiot {teacher_id % 15 + 1}",
+    }
+
+
+GENERATORS: dict[str, Any] = {
+    "grade": grade,
+    "schedule_entry": schedule_entry,
+    "schedule_change": lambda change_id: schedule_change(change_id, change_id * 3),
+    "homework": homework,
+    "exam": exam,
+    "note": note,
+    "meeting": meeting,
+    "teacher": teacher,
+}
+
+
+def response(
+    envelope: Any,
+    envelope_type: str = "IEnumerable`1",
+    status_code: int = 0,
+    message: str = "OK",
+) -> dict[str, Any]:
+    now: datetime = datetime.now()
+    return {
+        "Envelope": envelope,
+        "EnvelopeType": envelope_type,
+        "InResponseTo": None,
+        "RequestId": str(uuid.uuid4()),
+        "Status": {"Code": status_code, "Message": message},
+        "Timestamp": int(now.timestamp() * 1000),
+        "TimestampFormatted": now.strftime("%Y-%m-%d %H:%M:%S"),
+    }
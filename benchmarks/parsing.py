@@ -0,0 +1,65 @@
+import time
+import tracemalloc
+
+from benchmarks import generators
+from sdk_python.hebe.data.exam import Exam
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.data.homework import Homework
+from sdk_python.hebe.data.meeting import Meeting
+from sdk_python.hebe.data.note import Note
+from sdk_python.hebe.data.schedule import ScheduleChange, ScheduleEntry
+from sdk_python.hebe.data.teacher import Teacher
+from sdk_python.hebe.parsing import parse_many
+
+MODELS: dict[str, type] = {
+    "grade": Grade,
+    "schedule_entry": ScheduleEntry,
+    "schedule_change": ScheduleChange,
+    "homework": Homework,
+    "exam": Exam,
+    "note": Note,
+    "meeting": Meeting,
+    "teacher": Teacher,
+}
+PAGE_SIZE: int = 1000
+REPEAT: int = 5
+
+
+def measure(model: type, page: list[dict], **kwargs) -> float:
+    best: float = float("inf")
+    for _ in range(REPEAT):
+        start: float = time.perf_counter()
+        parse_many(model, page, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return len(page) / best
+
+
+def measure_memory(model: type, page: list[dict], **kwargs) -> int:
+    tracemalloc.start()
+    models: list = parse_many(model, page, **kwargs)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return size
+
+
+def main() -> None:
+    print(
+        f"{'model':16} {'validated/s':>12} {'trusted/s':>12} {'speed-up':>9}"
+        f" {'validated KiB':>14} {'trusted KiB':>12}"
+    )
+    for name, model in MODELS.items():
+        page: list[dict] = [
+            generators.GENERATORS[name](item_id) for item_id in range(1, PAGE_SIZE + 1)
+        ]
+        validated: float = measure(model, page)
+        trusted: float = measure(model, page, trusted=True)
+        print(
+            f"{name:16} {validated:12.0f} {trusted:12.0f} {trusted / validated:8.1f}x"
+            f" {measure_memory(model, page) / 1024:14.0f}"
+            f" {measure_memory(model, page, trusted=True) / 1024:12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import json
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable
+
+from sdk_python.hebe import Certificate
+from sdk_python.hebe.json_backend import get_json_backend
+from sdk_python.hebe.models.request import RequestHeaders, RequestPayload
+
+URL: str = "http://127.0.0.1/powiatwulkanowy/api/mobile/messages/send"
+REPEAT: int = 50
+ENVELOPE_SIZES: tuple[int, ...] = (1, 30, 300)
+
+
+def envelope(size: int) -> dict:
+    return {
+        "Messages": [
+            {"Id": index, "Subject": f"Temat {index}", "Content": "x" * 100}
+            for index in range(size)
+        ]
+    }
+
+
+def prepare(certificate: Certificate, body: dict) -> tuple[dict[str, str], bytes]:
+    payload: RequestPayload = RequestPayload.build(body, certificate.firebase_token)
+    data: bytes = payload.serialize(get_json_backend().dumps)
+    now: datetime = datetime.now(timezone.utc)
+    headers: dict[str, str] = RequestHeaders.render(
+        certificate, now, certificate.signer.sign(URL, data, now)
+    )
+    return headers, data
+
+
+def prepare_legacy(
+    certificate: Certificate, body: dict
+) -> tuple[dict[str, str], bytes]:
+    payload: RequestPayload = RequestPayload.build(body, certificate.firebase_token)
+    envelope: dict = payload.dict(by_alias=True, exclude_none=True)
+    headers: dict[str, str] = RequestHeaders.build(
+        certificate, URL, json.dumps(envelope)
+    ).dict(by_alias=True, exclude_none=True)
+    data: bytes = json.dumps(envelope).encode("utf-8")
+    return headers, data
+
+
+PATHS: dict[str, Callable[[Certificate, dict], tuple[dict[str, str], bytes]]] = {
+    "legacy": prepare_legacy,
+    "current": prepare,
+}
+
+
+def main() -> None:
+    certificate: Certificate = Certificate.create()
+    print(
+        f"{'path':>8} {'messages':>8} {'ms/request':>11} {'peak KiB':>9}"
+        f" {'body KiB':>9}"
+    )
+    for size in ENVELOPE_SIZES:
+        body: dict = envelope(size)
+        for name, function in PATHS.items():
+            _, data = function(certificate, body)
+            start: float = time.perf_counter()
+            for _ in range(REPEAT):
+                function(certificate, body)
+            elapsed: float = (time.perf_counter() - start) / REPEAT
+            tracemalloc.start()
+            function(certificate, body)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{name:>8} {size:8} {elapsed * 1000:11.2f} {peak / 1024:9.0f}"
+                f" {len(data) / 1024:9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
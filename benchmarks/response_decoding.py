@@ -0,0 +1,50 @@
+import json
+import timeit
+
+from benchmarks import generators
+from sdk_python.hebe.api import API
+from sdk_python.hebe.json_backend import ORJSON_BACKEND, STDLIB_BACKEND
+from sdk_python.hebe.models.response import Response
+
+PAGE_SIZES: tuple[int, ...] = (1, 100, 1000)
+REPEAT: int = 5
+
+
+def decode_legacy(body: bytes):
+    response: Response = Response.parse_raw(body.decode("utf-8"))
+    API._check_response_status_code(response.status.code)
+    return response.envelope, response.envelope_type
+
+
+def decode_with(backend):
+    def decode(body: bytes):
+        return API._parse_response(backend.loads(body))
+
+    return decode
+
+
+def measure(decode, body: bytes, number: int) -> float:
+    return (
+        min(timeit.repeat(lambda: decode(body), number=number, repeat=REPEAT)) / number
+    )
+
+
+def main() -> None:
+    decoders: dict = {
+        "legacy (text + Response.parse_raw)": decode_legacy,
+        "json + envelope check": decode_with(STDLIB_BACKEND),
+    }
+    if ORJSON_BACKEND:
+        decoders["orjson + envelope check"] = decode_with(ORJSON_BACKEND)
+    for page_size in PAGE_SIZES:
+        body: bytes = json.dumps(
+            generators.response([generators.grade(i) for i in range(page_size)])
+        ).encode("utf-8")
+        number: int = max(1, 2000 // page_size)
+        print(f"page size {page_size} ({len(body)} bytes)")
+        for name, decode in decoders.items():
+            print(f"  {name:40} {measure(decode, body, number) * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
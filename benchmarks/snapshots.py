@@ -0,0 +1,36 @@
+import time
+
+from benchmarks import generators
+from benchmarks.parsing import MODELS, PAGE_SIZE, REPEAT
+from sdk_python.hebe import binary
+from sdk_python.hebe.parsing import parse_many
+
+
+def measure(function, *args) -> float:
+    best: float = float("inf")
+    for _ in range(REPEAT):
+        start: float = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    print(
+        f"{'model':16} {'parse_obj ms':>13} {'load ms':>8} {'speed-up':>9} {'KiB':>6}"
+    )
+    for name, model in MODELS.items():
+        page: list[dict] = [
+            generators.GENERATORS[name](item_id) for item_id in range(1, PAGE_SIZE + 1)
+        ]
+        data: bytes = binary.dumps(parse_many(model, page))
+        parsed: float = measure(parse_many, model, page)
+        loaded: float = measure(binary.loads, data)
+        print(
+            f"{name:16} {parsed:13.1f} {loaded:8.1f} {parsed / loaded:8.1f}x"
+            f" {len(data) / 1024:6.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import time
+
+from benchmarks import generators
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.data.schedule import ScheduleChange, ScheduleEntry
+from sdk_python.hebe.timestamps import convert_timestamps, get_timestamp_fields
+
+MODELS: dict[str, type] = {
+    "grade": Grade,
+    "schedule_entry": ScheduleEntry,
+    "schedule_change": ScheduleChange,
+}
+PAGE_SIZE: int = 10000
+REPEAT: int = 5
+
+
+def convert_each(items: list[dict], fields: dict[str, type]) -> None:
+    for item in items:
+        for alias, type_ in fields.items():
+            value = item.get(alias)
+            if isinstance(value, dict):
+                item[alias] = type_.fromtimestamp(value["Timestamp"] / 1000)
+
+
+def measure(convert, page: list[dict], fields: dict[str, type]) -> float:
+    best: float = float("inf")
+    for _ in range(REPEAT):
+        items: list[dict] = [dict(item) for item in page]
+        start: float = time.perf_counter()
+        convert(items, fields)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    print(f"{'model':16} {'per-record ms':>14} {'batch ms':>9} {'speed-up':>9}")
+    for name, model in MODELS.items():
+        page: list[dict] = [
+            generators.GENERATORS[name](item_id) for item_id in range(1, PAGE_SIZE + 1)
+        ]
+        fields: dict[str, type] = get_timestamp_fields(model)
+        each: float = measure(convert_each, page, fields)
+        batch: float = measure(convert_timestamps, page, fields)
+        print(f"{name:16} {each:14.2f} {batch:9.2f} {each / batch:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
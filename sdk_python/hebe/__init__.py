@@ -1,3 +1,4 @@
 from .api import API
 from .certificate import Certificate
 from .client import Client
+from .session import SessionRegistry
@@ -1,9 +1,27 @@
-import json
-from typing import Any
-from aiohttp import ClientSession
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Iterable,
+    Mapping,
+    Optional,
+)
+from aiohttp import ClientError, ClientResponse, ClientSession
 
+from sdk_python.hebe.session import SessionRegistry, default_session_registry
+from sdk_python.hebe.json_backend import JSONBackend, get_json_backend
 from sdk_python.hebe.models.request import RequestHeaders, RequestPayload
-from sdk_python.hebe.models.response import Response
+from sdk_python.hebe.dictionary import DictionaryCache, default_dictionary_cache
+from sdk_python.hebe.interning import InternPool
+from sdk_python.hebe.lazy import parse_lazy
+from sdk_python.hebe.metrics import NULL_SINK, MetricsSink
+from sdk_python.hebe.parsing import parse_many
+from sdk_python.hebe.retry import RetryPolicy
+from sdk_python.hebe.scheduler import RequestScheduler
+from sdk_python.hebe.streaming import StreamedResponse, iter_envelope_items
 from sdk_python.hebe.error import (
     InvalidResponseContentTypeException,
     InvalidResponseContentException,
@@ -24,44 +42,245 @@ from sdk_python.hebe.error import (
 )
 
 PAGE_SIZE: int = 1000
+THREADED_PARSE_MIN_ITEMS: int = 100
+STREAM_PARSE_CHUNK_SIZE: int = 100
+
+
+@asynccontextmanager
+async def _no_slot() -> AsyncIterator[None]:
+    yield
+
+
+def _get_trace_context(context: Any, labels: dict[str, str]) -> Any:
+    if context is None:
+        return labels
+    if isinstance(context, Mapping):
+        return {**context, **labels}
+    return context
 
 
 class API:
-    def __init__(self, certificate, rest_url: str = None):
+    def __init__(
+        self,
+        certificate,
+        rest_url: str = None,
+        session_registry: SessionRegistry = None,
+        json_backend: JSONBackend = None,
+        retry_policy: RetryPolicy = None,
+        scheduler: RequestScheduler = None,
+        trusted: bool = False,
+        validation_sample_rate: float = 0,
+        intern_pool: InternPool = None,
+        lazy: bool = False,
+        dictionary_cache: DictionaryCache = None,
+        streaming: bool = False,
+        metrics: MetricsSink = None,
+    ):
         self._certificate = certificate
         self._rest_url = rest_url or certificate.rest_url
-        self._session = ClientSession()
+        self._session_registry = session_registry or default_session_registry
+        self._session: Optional[ClientSession] = None
+        self._json_backend = json_backend
+        self._retry_policy = retry_policy
+        self._scheduler = scheduler
+        self.trusted = trusted
+        self.validation_sample_rate = validation_sample_rate
+        self.intern_pool = intern_pool
+        self.lazy = lazy
+        self.dictionary_cache = dictionary_cache or default_dictionary_cache
+        self.streaming = streaming
+        self.metrics = metrics or NULL_SINK
+
+    @property
+    def certificate(self):
+        return self._certificate
+
+    @property
+    def rest_url(self) -> str:
+        return self._rest_url
+
+    def _get_json_backend(self) -> JSONBackend:
+        return self._json_backend or get_json_backend()
+
+    async def _get_session(self) -> ClientSession:
+        if self._session and not self._session.closed:
+            return self._session
+        if self._session:
+            await self._session_registry.release(self._rest_url, self._session)
+        self._session = await self._session_registry.acquire(self._rest_url)
+        return self._session
 
     async def send_request(
         self, method: str, endpoint: str, **kwargs
     ) -> tuple[Any, str]:
         url: str = f"{self._rest_url}/mobile/{endpoint}"
-        headers: RequestHeaders = RequestHeaders.build(
-            self._certificate,
-            url,
-            json.dumps(kwargs.get("json")) if kwargs.get("json") else None,
-        )
+        if "json" in kwargs:
+            kwargs["data"] = self._get_json_backend().dumps(kwargs.pop("json"))
+        labels: dict[str, str] = {"endpoint": endpoint, "method": method}
         try:
-            response = await self._session.request(
-                method,
-                url,
-                headers=headers.dict(by_alias=True, exclude_none=True),
-                **kwargs,
+            with self.metrics.time("hebe_request_duration_seconds", labels):
+                if method == "GET" and self._retry_policy:
+                    return await self._retry_policy.run(
+                        lambda: self._send_request_once(method, url, endpoint, **kwargs)
+                    )
+                return await self._send_request_once(method, url, endpoint, **kwargs)
+        except Exception as exception:
+            self._count_error(endpoint, exception)
+            raise
+
+    def _count_error(self, endpoint: str, exception: Exception) -> None:
+        self.metrics.increment(
+            "hebe_errors_total",
+            labels={"endpoint": endpoint, "error": type(exception).__name__},
+        )
+
+    async def _send_request_once(
+        self, method: str, url: str, endpoint: str, **kwargs
+    ) -> tuple[Any, str]:
+        labels: dict[str, str] = {"endpoint": endpoint}
+        with self.metrics.time("hebe_sign_duration_seconds", labels):
+            headers: dict[str, str] = await RequestHeaders.render_async(
+                self._certificate, url, kwargs.get("data")
             )
+        kwargs["trace_request_ctx"] = _get_trace_context(
+            kwargs.get("trace_request_ctx"), labels
+        )
+        session: ClientSession = await self._get_session()
+        if self._scheduler:
+            async with self._scheduler.slot(url, self._certificate.fingerprint):
+                status, content_type, body = await self._exchange(
+                    session, method, url, headers, **kwargs
+                )
+        else:
+            status, content_type, body = await self._exchange(
+                session, method, url, headers, **kwargs
+            )
+        self._check_response(status, content_type)
+        try:
+            with self.metrics.time("hebe_decode_duration_seconds", labels):
+                data: Any = self._get_json_backend().loads(body)
         except:
+            raise InvalidResponseContentException()
+        return self._parse_response(data)
+
+    @staticmethod
+    async def _exchange(
+        session: ClientSession,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        **kwargs,
+    ) -> tuple[int, Optional[str], bytes]:
+        try:
+            async with session.request(
+                method, url, headers=headers, **kwargs
+            ) as response:
+                return (
+                    response.status,
+                    response.headers.get("Content-Type"),
+                    await response.read(),
+                )
+        except Exception:
             raise FailedRequestException()
-        if response.status == 404:
+
+    @staticmethod
+    def _check_response(status: int, content_type: Optional[str]) -> None:
+        if status == 404:
             raise NotFoundEndpointException()
-        if response.status == 405:
+        if status == 405:
             raise MethodNotAllowedException()
-        if response.headers["Content-Type"] != "application/json; charset=utf-8":
+        if content_type != "application/json; charset=utf-8":
             raise InvalidResponseContentTypeException()
+
+    def _get_slot(self, url: str) -> AsyncContextManager:
+        if self._scheduler:
+            return self._scheduler.slot(url, self._certificate.fingerprint)
+        return _no_slot()
+
+    async def _open_stream(
+        self, url: str, endpoint: str, params: dict, **kwargs
+    ) -> ClientResponse:
+        labels: dict[str, str] = {"endpoint": endpoint}
+        with self.metrics.time("hebe_sign_duration_seconds", labels):
+            headers: dict[str, str] = await RequestHeaders.render_async(
+                self._certificate, url
+            )
+        kwargs["trace_request_ctx"] = _get_trace_context(
+            kwargs.get("trace_request_ctx"), labels
+        )
+        session: ClientSession = await self._get_session()
         try:
-            response = Response.parse_raw(await response.text())
+            http_response: ClientResponse = await session.request(
+                "GET", url, headers=headers, params=params, **kwargs
+            )
+        except Exception:
+            raise FailedRequestException()
+        try:
+            self._check_response(
+                http_response.status, http_response.headers.get("Content-Type")
+            )
         except:
+            http_response.release()
+            raise
+        return http_response
+
+    async def stream_page(
+        self, endpoint: str, params: dict, **kwargs
+    ) -> AsyncIterator[Any]:
+        labels: dict[str, str] = {"endpoint": endpoint, "method": "GET"}
+        try:
+            with self.metrics.time("hebe_request_duration_seconds", labels):
+                async for item in self._stream_page(endpoint, params, **kwargs):
+                    yield item
+        except Exception as exception:
+            self._count_error(endpoint, exception)
+            raise
+
+    async def _stream_page(
+        self, endpoint: str, params: dict, **kwargs
+    ) -> AsyncIterator[Any]:
+        url: str = f"{self._rest_url}/mobile/{endpoint}"
+        response: StreamedResponse = StreamedResponse()
+        async with self._get_slot(url):
+            if self._retry_policy:
+                http_response: ClientResponse = await self._retry_policy.run(
+                    lambda: self._open_stream(url, endpoint, params, **kwargs)
+                )
+            else:
+                http_response = await self._open_stream(url, endpoint, params, **kwargs)
+            async with http_response:
+                items: AsyncIterator[Any] = iter_envelope_items(
+                    http_response.content, response
+                )
+                busy: float = 0
+                try:
+                    while True:
+                        start: float = time.perf_counter()
+                        try:
+                            item: Any = await items.__anext__()
+                        except StopAsyncIteration:
+                            break
+                        finally:
+                            busy += time.perf_counter() - start
+                        yield item
+                except (SDKException, ImportError):
+                    raise
+                except (ClientError, asyncio.TimeoutError):
+                    raise FailedRequestException()
+                except Exception:
+                    raise InvalidResponseContentException()
+                finally:
+                    await items.aclose()
+                self.metrics.observe(
+                    "hebe_decode_duration_seconds",
+                    max(0.0, busy - response.read_duration),
+                    {"endpoint": endpoint},
+                )
+        if response.status_code is None or response.envelope_type is None:
             raise InvalidResponseContentException()
-        self._check_response_status_code(response.status.code)
-        return response.envelope, response.envelope_type
+        self._check_response_status_code(response.status_code)
+        if response.envelope_type != "IEnumerable`1":
+            raise InvalidResponseEnvelopeTypeException()
 
     async def post(self, endpoint: str, envelope: Any, **kwargs) -> tuple[Any, str]:
         payload: RequestPayload = RequestPayload.build(
@@ -70,7 +289,7 @@ class API:
         return await self.send_request(
             "POST",
             endpoint,
-            json=payload.dict(by_alias=True, exclude_none=True),
+            data=payload.serialize(self._get_json_backend().dumps),
             **kwargs,
         )
 
@@ -78,17 +297,116 @@ class API:
         return await self.send_request("GET", endpoint, **kwargs)
 
     async def get_all(self, endpoint: str, params: dict, **kwargs) -> list[Any]:
-        data: list[Any] = []
-        params["pageSize"]: int = PAGE_SIZE
+        return [
+            item
+            async for page in self.iter_all(endpoint, params, **kwargs)
+            for item in page
+        ]
+
+    async def get_page(self, endpoint: str, params: dict, **kwargs) -> list[Any]:
+        envelope, envelope_type = await self.get(endpoint, params=params, **kwargs)
+        if envelope_type != "IEnumerable`1":
+            raise InvalidResponseEnvelopeTypeException()
+        return envelope
+
+    async def iter_all(
+        self, endpoint: str, params: dict, **kwargs
+    ) -> AsyncIterator[list[Any]]:
+        params: dict = {**params, "pageSize": PAGE_SIZE}
+        page: asyncio.Task = asyncio.ensure_future(
+            self.get_page(endpoint, params, **kwargs)
+        )
+        try:
+            while page:
+                envelope: list[Any] = await page
+                page = None
+                if len(envelope) == PAGE_SIZE:
+                    params = {**params, "lastId": envelope[-1]["Id"]}
+                    page = asyncio.ensure_future(
+                        self.get_page(endpoint, params, **kwargs)
+                    )
+                    await asyncio.sleep(0)
+                yield envelope
+        finally:
+            if page:
+                page.cancel()
+
+    async def iter_models(
+        self, endpoint: str, params: dict, model, **kwargs
+    ) -> AsyncIterator[list[Any]]:
+        pool: InternPool = self.get_intern_pool()
+        if self.streaming:
+            async for page in self._iter_streamed_models(
+                endpoint, params, model, pool, **kwargs
+            ):
+                yield page
+            return
+        async for envelope in self.iter_all(endpoint, params, **kwargs):
+            yield await self.parse_page(model, envelope, pool)
+
+    async def _iter_streamed_models(
+        self, endpoint: str, params: dict, model, pool: InternPool, **kwargs
+    ) -> AsyncIterator[list[Any]]:
+        params: dict = {**params, "pageSize": PAGE_SIZE}
         while True:
-            envelope, envelope_type = await self.get(endpoint, params=params, **kwargs)
-            if envelope_type != "IEnumerable`1":
-                raise InvalidResponseEnvelopeTypeException()
-            data += envelope
-            if len(envelope) != PAGE_SIZE:
-                break
-            params["lastId"]: int = envelope[-1]["Id"]
-        return data
+            models: list[Any] = []
+            chunk: list[Any] = []
+            last_id: Any = None
+            async for item in self.stream_page(endpoint, params, **kwargs):
+                last_id = item["Id"]
+                chunk.append(item)
+                if len(chunk) >= STREAM_PARSE_CHUNK_SIZE:
+                    models.extend(self.parse_many(model, chunk, pool))
+                    chunk = []
+            if chunk:
+                models.extend(self.parse_many(model, chunk, pool))
+            yield models
+            if len(models) < PAGE_SIZE:
+                return
+            params = {**params, "lastId": last_id}
+
+    def get_intern_pool(self) -> InternPool:
+        if self.intern_pool is not None:
+            return self.intern_pool
+        return InternPool(self.dictionary_cache.get_shared(self._rest_url))
+
+    def parse_many(
+        self, model, items: Iterable[Any], pool: InternPool = None, lazy: bool = None
+    ) -> list[Any]:
+        if lazy is None:
+            lazy = self.lazy
+        if pool is None:
+            pool = self.get_intern_pool()
+        with self.metrics.time(
+            "hebe_parse_duration_seconds", {"model": model.__name__}
+        ):
+            if lazy:
+                return parse_lazy(model, items, pool)
+            return parse_many(
+                model, items, self.trusted, self.validation_sample_rate, pool
+            )
+
+    async def parse_page(
+        self, model, items: list[Any], pool: InternPool = None
+    ) -> list[Any]:
+        if len(items) < THREADED_PARSE_MIN_ITEMS:
+            return self.parse_many(model, items, pool)
+        return await asyncio.to_thread(self.parse_many, model, items, pool)
+
+    def parse(self, model, item: Any) -> Any:
+        return self.parse_many(model, (item,), lazy=False)[0]
+
+    @staticmethod
+    def _parse_response(data: Any) -> tuple[Any, str]:
+        try:
+            status_code: int = data["Status"]["Code"]
+            envelope_type: str = data["EnvelopeType"]
+        except (KeyError, TypeError):
+            raise InvalidResponseContentException()
+        if not isinstance(status_code, int) or not isinstance(envelope_type, str):
+            raise InvalidResponseContentException()
+        API._check_response_status_code(status_code)
+        return data.get("Envelope"), envelope_type
 
     @staticmethod
     def _check_response_status_code(status_code: int) -> None:
@@ -114,5 +432,15 @@ class API:
             raise ExpiredTokenException()
         raise SDKException(status_code)
 
-    async def __aexit__(self):
-        await self._session.close()
+    async def close(self) -> None:
+        if not self._session:
+            return
+        session: ClientSession = self._session
+        self._session = None
+        await self._session_registry.release(self._rest_url, session)
+
+    async def __aenter__(self) -> "API":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
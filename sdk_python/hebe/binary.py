@@ -0,0 +1,107 @@
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import pkgutil
+import struct
+from types import GenericAlias
+from typing import Any, BinaryIO, Optional, Type
+from pydantic import BaseModel
+from pydantic.typing import display_as_type
+
+from sdk_python.hebe.error import InvalidSnapshotException, SnapshotVersionException
+
+MAGIC: bytes = b"HEBE"
+FORMAT_VERSION: int = 1
+MODEL_PACKAGES: tuple[str, ...] = ("sdk_python.hebe.data", "sdk_python.hebe.models")
+HEADER: struct.Struct = struct.Struct("<4sH8sI")
+BUFFER_LENGTH: struct.Struct = struct.Struct("<Q")
+
+
+def get_models() -> list[Type[BaseModel]]:
+    models: dict[str, Type[BaseModel]] = {}
+    for package in MODEL_PACKAGES:
+        path: str = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), *package.split(".")[1:]
+        )
+        for module_info in pkgutil.iter_modules([path]):
+            module = importlib.import_module(f"{package}.{module_info.name}")
+            for name, value in inspect.getmembers(module, inspect.isclass):
+                if (
+                    not isinstance(value, GenericAlias)
+                    and issubclass(value, BaseModel)
+                    and value.__module__ == module.__name__
+                ):
+                    models[f"{value.__module__}.{name}"] = value
+    return [models[name] for name in sorted(models)]
+
+
+def get_schema_hash(models: list[Type[BaseModel]] = None) -> bytes:
+    digest: "hashlib._Hash" = hashlib.sha256()
+    for model in models if models is not None else get_models():
+        digest.update(f"{model.__module__}.{model.__qualname__}\n".encode())
+        for name, field in model.__fields__.items():
+            digest.update(
+                f"{name}:{field.alias}:{field.required}:"
+                f"{display_as_type(field.outer_type_)}\n".encode()
+            )
+    return digest.digest()[:8]
+
+
+_schema_hash: Optional[bytes] = None
+
+
+def _get_schema_hash() -> bytes:
+    global _schema_hash
+    if _schema_hash is None:
+        _schema_hash = get_schema_hash()
+    return _schema_hash
+
+
+def dumps(obj: Any) -> bytes:
+    buffers: list[pickle.PickleBuffer] = []
+    payload: bytes = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    parts: list[Any] = [
+        HEADER.pack(MAGIC, FORMAT_VERSION, _get_schema_hash(), len(buffers))
+    ]
+    for buffer in buffers:
+        view: memoryview = buffer.raw()
+        parts.append(BUFFER_LENGTH.pack(view.nbytes))
+        parts.append(view)
+    parts.append(payload)
+    return b"".join(parts)
+
+
+def loads(data: bytes) -> Any:
+    view: memoryview = memoryview(data)
+    if len(view) < HEADER.size:
+        raise InvalidSnapshotException()
+    magic, version, schema_hash, buffers_count = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise InvalidSnapshotException()
+    if version != FORMAT_VERSION or schema_hash != _get_schema_hash():
+        raise SnapshotVersionException()
+    offset: int = HEADER.size
+    buffers: list[memoryview] = []
+    for _ in range(buffers_count):
+        if offset + BUFFER_LENGTH.size > len(view):
+            raise InvalidSnapshotException()
+        (length,) = BUFFER_LENGTH.unpack_from(view, offset)
+        offset += BUFFER_LENGTH.size
+        if offset + length > len(view):
+            raise InvalidSnapshotException()
+        buffers.append(view[offset : offset + length])
+        offset += length
+    try:
+        return pickle.loads(view[offset:], buffers=buffers)
+    except Exception:
+        raise InvalidSnapshotException()
+
+
+def dump(obj: Any, file: BinaryIO) -> None:
+    file.write(dumps(obj))
+
+
+def load(file: BinaryIO) -> Any:
+    return loads(file.read())
@@ -1,9 +1,13 @@
-from pydantic import BaseModel, Field
+import asyncio
+from pydantic import BaseModel, Field, PrivateAttr
 from uonet_request_signer_hebe import generate_key_pair
 from uuid import uuid5, NAMESPACE_X500
 from sdk_python.hebe.api import API
 
 from sdk_python.hebe.error import InvalidResponseEnvelopeTypeException
+from sdk_python.hebe.key_pool import KeyPairPool
+from sdk_python.hebe.session import SessionRegistry
+from sdk_python.hebe.signer import Signer
 from sdk_python.hebe.utils import get_server_url_by_token
 
 DEFAULT_NAME: str = "wulkanowy/sdk-python"
@@ -35,6 +39,20 @@ class Certificate(BaseModel):
     rest_url: str = None
     login_id: int = None
     firebase_token: str = None
+    _signer: Signer = PrivateAttr(default=None)
+
+    @property
+    def signer(self) -> Signer:
+        if not self._signer:
+            self._signer = Signer(self.fingerprint, self.private_key)
+        elif (
+            self._signer.fingerprint != self.fingerprint
+            or self._signer.private_key != self.private_key
+        ):
+            self._signer = Signer(
+                self.fingerprint, self.private_key, self._signer.executor
+            )
+        return self._signer
 
     @staticmethod
     def create(
@@ -44,9 +62,12 @@ class Certificate(BaseModel):
         type: str = DEFAULT_TYPE,
         os: str = DEFAULT_OS,
         name: str = DEFAULT_NAME,
+        key_pool: KeyPairPool = None,
     ) -> "Certificate":
         if not pem or not fingerprint or not private_key:
-            pem, fingerprint, private_key = generate_key_pair()
+            pem, fingerprint, private_key = (
+                key_pool.get() if key_pool else generate_key_pair()
+            )
             type = DEFAULT_TYPE
         return Certificate(
             pem=pem,
@@ -57,6 +78,27 @@ class Certificate(BaseModel):
             name=name,
         )
 
+    @staticmethod
+    async def create_async(
+        pem: str = None,
+        fingerprint: str = None,
+        private_key: str = None,
+        type: str = DEFAULT_TYPE,
+        os: str = DEFAULT_OS,
+        name: str = DEFAULT_NAME,
+        key_pool: KeyPairPool = None,
+    ) -> "Certificate":
+        if not pem or not fingerprint or not private_key:
+            pem, fingerprint, private_key = (
+                await key_pool.get_async()
+                if key_pool
+                else await asyncio.get_running_loop().run_in_executor(
+                    None, generate_key_pair
+                )
+            )
+            type = DEFAULT_TYPE
+        return Certificate.create(pem, fingerprint, private_key, type, os, name)
+
     async def register(
         self,
         token: str,
@@ -65,6 +107,7 @@ class Certificate(BaseModel):
         firebase_token: str = None,
         server_url: str = None,
         self_identifier: str = None,
+        session_registry: SessionRegistry = None,
     ) -> None:
         if not server_url:
             server_url = await get_server_url_by_token(token)
@@ -83,10 +126,10 @@ class Certificate(BaseModel):
                 self_identifier=self_identifier,
             )
         )
-        api: API = API(self, rest_url)
-        response_envelope, response_envelope_type = await api.post(
-            "register/new", request_envelope
-        )
+        async with API(self, rest_url, session_registry) as api:
+            response_envelope, response_envelope_type = await api.post(
+                "register/new", request_envelope
+            )
         if response_envelope_type != "AccountPayload":
             raise InvalidResponseEnvelopeTypeException()
         self.firebase_token: str = firebase_token
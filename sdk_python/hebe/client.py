@@ -1,4 +1,6 @@
+import asyncio
 from datetime import date
+from typing import Any, AsyncIterator, Awaitable, Optional
 
 from sdk_python.hebe import Certificate
 from sdk_python.hebe.api import API
@@ -9,15 +11,35 @@ from sdk_python.hebe.data.homework import Homework
 from sdk_python.hebe.data.lucky_number import LuckyNumber
 from sdk_python.hebe.data.meeting import Meeting
 from sdk_python.hebe.data.note import Note
-from sdk_python.hebe.data.pupil import PupilInfo, Pupil
+from sdk_python.hebe.data.pupil import PupilInfo, Pupil, Period
 from sdk_python.hebe.data.schedule import ScheduleEntry, ScheduleChange
+from sdk_python.hebe.data.snapshot import PupilSnapshot
 from sdk_python.hebe.data.time_slot import TimeSlot
+from sdk_python.hebe.error import NotFoundEntityException
+
+SNAPSHOT_CONCURRENCY: int = 4
+
+
+async def gather_or_cancel(*requests: Awaitable[Any]) -> list[Any]:
+    tasks: list[asyncio.Future] = [
+        asyncio.ensure_future(request) for request in requests
+    ]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class Client:
     def __init__(self, api: API):
         self._api = api
 
+    @property
+    def api(self) -> API:
+        return self._api
+
     @staticmethod
     async def register_certificate(
         certificate: Certificate, token: str, symbol: str, pin: str, **kwargs
@@ -31,7 +53,7 @@ class Client:
         return await Pupil.get_by_id(self._api, pupil_id)
 
     async def get_lucky_number_by_constituent_unit(
-        self, constituent_unit_id: int, day: date = date.today()
+        self, constituent_unit_id: int, day: Optional[date] = None
     ) -> LuckyNumber:
         return await LuckyNumber.get_by_constituent_unit(
             self._api, constituent_unit_id, day
@@ -47,6 +69,13 @@ class Client:
             self._api, pupil_id, period_id, behaviour, **kwargs
         )
 
+    def iter_grades_by_pupil_and_period(
+        self, pupil_id: int, period_id: int, behaviour: bool = False, **kwargs
+    ) -> AsyncIterator[list[Grade]]:
+        return Grade.iter_by_pupil_and_period(
+            self._api, pupil_id, period_id, behaviour, **kwargs
+        )
+
     async def get_grade_by_pupil_period_and_id(
         self, pupil_id: int, period_id: int, grade_id: int
     ) -> Grade:
@@ -74,6 +103,9 @@ class Client:
     async def get_notes_by_pupil(self, pupil_id: int, **kwargs) -> list[Note]:
         return await Note.get_by_pupil(self._api, pupil_id, **kwargs)
 
+    def iter_notes_by_pupil(self, pupil_id: int, **kwargs) -> AsyncIterator[list[Note]]:
+        return Note.iter_by_pupil(self._api, pupil_id, **kwargs)
+
     async def get_note_by_pupil_and_id(self, pupil_id: int, note_id: int) -> Note:
         return await Note.get_by_pupil_and_id(self._api, pupil_id, note_id)
 
@@ -96,6 +128,9 @@ class Client:
     async def get_exams_by_pupil(self, pupil_id: int, **kwargs) -> list[Exam]:
         return await Exam.get_by_pupil(self._api, pupil_id, **kwargs)
 
+    def iter_exams_by_pupil(self, pupil_id: int, **kwargs) -> AsyncIterator[list[Exam]]:
+        return Exam.iter_by_pupil(self._api, pupil_id, **kwargs)
+
     async def get_exam_by_pupil_and_id(self, pupil_id: int, exam_id: int) -> Exam:
         return await Exam.get_by_pupil_and_id(self._api, pupil_id, exam_id)
 
@@ -108,6 +143,11 @@ class Client:
     async def get_homework_by_pupil(self, pupil_id: int, **kwargs) -> list[Homework]:
         return await Homework.get_by_pupil(self._api, pupil_id, **kwargs)
 
+    def iter_homework_by_pupil(
+        self, pupil_id: int, **kwargs
+    ) -> AsyncIterator[list[Homework]]:
+        return Homework.iter_by_pupil(self._api, pupil_id, **kwargs)
+
     async def get_deleted_homework(self, **kwargs) -> list[int]:
         return await Homework.get_deleted(self._api, **kwargs)
 
@@ -119,6 +159,11 @@ class Client:
     ) -> list[ScheduleEntry]:
         return await ScheduleEntry.get_by_pupil(self._api, pupil_id, **kwargs)
 
+    def iter_schedule_by_pupil(
+        self, pupil_id: int, **kwargs
+    ) -> AsyncIterator[list[ScheduleEntry]]:
+        return ScheduleEntry.iter_by_pupil(self._api, pupil_id, **kwargs)
+
     async def get_deleted_schedule_entries_by_pupil(
         self, pupil_id: int, **kwargs
     ) -> list[int]:
@@ -129,6 +174,11 @@ class Client:
     ) -> list[ScheduleChange]:
         return await ScheduleChange.get_by_pupil(self._api, pupil_id, **kwargs)
 
+    def iter_schedule_changes_by_pupil(
+        self, pupil_id: int, **kwargs
+    ) -> AsyncIterator[list[ScheduleChange]]:
+        return ScheduleChange.iter_by_pupil(self._api, pupil_id, **kwargs)
+
     async def get_deleted_schedule_changes(self, **kwargs) -> list[int]:
         return await ScheduleChange.get_deleted(self._api, **kwargs)
 
@@ -138,3 +188,86 @@ class Client:
         return await Teacher.get_by_pupil_and_period(
             self._api, pupil_id, period_id, **kwargs
         )
+
+    async def get_pupil_snapshot(
+        self,
+        pupil_info: PupilInfo,
+        date_from: date = None,
+        date_to: date = None,
+        concurrency: int = SNAPSHOT_CONCURRENCY,
+    ) -> PupilSnapshot:
+        date_from = date_from or date.today()
+        date_to = date_to or date_from
+        pupil_id: int = pupil_info.pupil.id
+        period: Period = PupilSnapshot.get_current_period(pupil_info)
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(request: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await request
+
+        async def get_lucky_number() -> Optional[LuckyNumber]:
+            try:
+                return await self.get_lucky_number_by_constituent_unit(
+                    pupil_info.constituent_unit.id, date_from
+                )
+            except NotFoundEntityException:
+                return None
+
+        (
+            grades,
+            grades_summary,
+            exams,
+            homework,
+            notes,
+            meetings,
+            schedule,
+            schedule_changes,
+            teachers,
+            lucky_number,
+        ) = await gather_or_cancel(
+            *map(
+                bounded,
+                (
+                    self.get_grades_by_pupil_and_period(pupil_id, period.id),
+                    self.get_grades_summary_by_pupil_and_period(pupil_id, period.id),
+                    self.get_exams_by_pupil(pupil_id),
+                    self.get_homework_by_pupil(pupil_id),
+                    self.get_notes_by_pupil(pupil_id),
+                    self.get_meetings_by_pupil(pupil_id, date_from),
+                    self.get_schedule_by_pupil(
+                        pupil_id, date_from=date_from, date_to=date_to
+                    ),
+                    self.get_schedule_changes_by_pupil(
+                        pupil_id, date_from=date_from, date_to=date_to
+                    ),
+                    self.get_teachers_by_pupil_and_period(pupil_id, period.id),
+                    get_lucky_number(),
+                ),
+            )
+        )
+        return PupilSnapshot.construct(
+            pupil_info=pupil_info,
+            period=period,
+            date_from=date_from,
+            date_to=date_to,
+            grades=grades,
+            grades_summary=grades_summary,
+            exams=exams,
+            homework=homework,
+            notes=notes,
+            meetings=meetings,
+            schedule=schedule,
+            schedule_changes=schedule_changes,
+            teachers=teachers,
+            lucky_number=lucky_number,
+        )
+
+    async def close(self) -> None:
+        await self._api.close()
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
@@ -0,0 +1,92 @@
+from datetime import date, datetime, time
+from enum import Enum
+from types import GenericAlias
+from typing import Any, Callable, Optional, Type
+from uuid import UUID
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+from sdk_python.hebe.interning import InternPool
+
+ValueConverter = Callable[[Any], Any]
+ModelConverter = Callable[[Any, Optional[InternPool]], Any]
+DefaultFactory = Callable[[], Any]
+
+IMMUTABLE_DEFAULTS: tuple[type, ...] = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    Enum,
+    UUID,
+    date,
+    time,
+    frozenset,
+)
+
+
+def convert_uuid(value: Any) -> Any:
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+def convert_float(value: Any) -> Any:
+    return float(value) if isinstance(value, int) else value
+
+
+def is_class(type_: Any) -> bool:
+    return isinstance(type_, type) and not isinstance(type_, GenericAlias)
+
+
+def is_model(type_: Any) -> bool:
+    return is_class(type_) and issubclass(type_, BaseModel)
+
+
+def get_value_converter(
+    type_: Any,
+    convert_date: Optional[ValueConverter],
+    convert_datetime: Optional[ValueConverter],
+) -> Optional[ValueConverter]:
+    if not is_class(type_):
+        return None
+    if issubclass(type_, Enum):
+        return lambda value: value if isinstance(value, type_) else type_(value)
+    if issubclass(type_, UUID):
+        return convert_uuid
+    if issubclass(type_, datetime):
+        return convert_datetime
+    if issubclass(type_, date):
+        return convert_date
+    if type_ is float:
+        return convert_float
+    return None
+
+
+def get_field_converter(
+    field: ModelField,
+    get_model_converter: Callable[[Type[BaseModel]], ModelConverter],
+    convert_date: Optional[ValueConverter],
+    convert_datetime: Optional[ValueConverter],
+) -> tuple[Optional[Callable], bool]:
+    if is_model(field.type_):
+        converter: Optional[Callable] = get_model_converter(field.type_)
+        pooled: bool = True
+    else:
+        converter = get_value_converter(field.type_, convert_date, convert_datetime)
+        pooled = False
+    if not converter or field.shape == SHAPE_SINGLETON:
+        return converter, pooled
+    if field.shape != SHAPE_LIST:
+        return None, False
+    if pooled:
+        return (lambda values, pool: [converter(value, pool) for value in values]), True
+    return (lambda values: [converter(value) for value in values]), False
+
+
+def get_default(field: ModelField) -> tuple[Any, Optional[DefaultFactory]]:
+    if field.required:
+        return None, None
+    if field.default_factory is None and isinstance(field.default, IMMUTABLE_DEFAULTS):
+        return field.default, None
+    return None, field.get_default
@@ -1,9 +1,11 @@
 from datetime import datetime
 from enum import Enum
 from uuid import UUID
+from typing import AsyncIterator
 from pydantic import BaseModel, Field, root_validator
 
 from sdk_python.hebe.api import API
+from sdk_python.hebe.timestamps import to_datetime
 from sdk_python.hebe.error import (
     InvalidResponseEnvelopeTypeException,
     NotFoundEntityException,
@@ -32,26 +34,30 @@ class Exam(BaseModel):
 
     @root_validator(pre=True)
     def root_validator(cls, values):
-        values["Deadline"] = datetime.fromtimestamp(
-            values["Deadline"]["Timestamp"] / 1000
-        )
-        values["DateCreated"] = datetime.fromtimestamp(
-            values["DateCreated"]["Timestamp"] / 1000
-        )
-        values["DateModify"] = datetime.fromtimestamp(
-            values["DateModify"]["Timestamp"] / 1000
-        )
+        values["Deadline"] = to_datetime(values["Deadline"])
+        values["DateCreated"] = to_datetime(values["DateCreated"])
+        values["DateModify"] = to_datetime(values["DateModify"])
         return values
 
     @staticmethod
-    async def get_by_pupil(
+    def iter_by_pupil(
         api: API, pupil_id: int, last_sync_date: datetime = datetime.min
-    ) -> list["Exam"]:
-        envelope = await api.get_all(
+    ) -> AsyncIterator[list["Exam"]]:
+        return api.iter_models(
             "exam/byPupil",
             {"pupilId": pupil_id, "lastSyncDate": last_sync_date.isoformat()},
+            Exam,
         )
-        return list(map(Exam.parse_obj, envelope))
+
+    @staticmethod
+    async def get_by_pupil(
+        api: API, pupil_id: int, last_sync_date: datetime = datetime.min
+    ) -> list["Exam"]:
+        return [
+            exam
+            async for page in Exam.iter_by_pupil(api, pupil_id, last_sync_date)
+            for exam in page
+        ]
 
     @staticmethod
     async def get_by_pupil_and_id(api: API, pupil_id: int, exam_id: int) -> "Exam":
@@ -62,7 +68,7 @@ class Exam(BaseModel):
             raise InvalidResponseEnvelopeTypeException()
         if not envelope:
             raise NotFoundEntityException()
-        return Exam.parse_obj(envelope)
+        return api.parse(Exam, envelope)
 
     @staticmethod
     async def get_deleted(
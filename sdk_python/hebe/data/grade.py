@@ -1,10 +1,12 @@
 from pydantic import BaseModel, Field, root_validator
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 from enum import Enum
 from uuid import UUID
 
 from sdk_python.hebe.api import API
+from sdk_python.hebe.interning import InternedModel
+from sdk_python.hebe.timestamps import to_datetime
 from sdk_python.hebe.error import (
     InvalidResponseEnvelopeTypeException,
     NotFoundEntityException,
@@ -27,7 +29,7 @@ class GradeColumnCategory(BaseModel):
     name: str = Field(alias="Name")
 
 
-class GradeColumn(BaseModel):
+class GradeColumn(InternedModel):
     id: int = Field(alias="Id")
     key: UUID = Field(alias="Key")
     number: int = Field(alias="Number")
@@ -45,6 +47,9 @@ class GradeColumn(BaseModel):
         values["Key"] = UUID(values["Key"])
         return values
 
+    class Config:
+        intern_key = "Id"
+
 
 class Grade(BaseModel):
     id: int = Field(alias="Id")
@@ -65,31 +70,43 @@ class Grade(BaseModel):
     @root_validator(pre=True)
     def root_validator(cls, values):
         values["Key"] = UUID(values["Key"])
-        values["DateCreated"] = datetime.fromtimestamp(
-            values["DateCreated"]["Timestamp"] / 1000
-        )
-        values["DateModify"] = datetime.fromtimestamp(
-            values["DateModify"]["Timestamp"] / 1000
-        )
+        values["DateCreated"] = to_datetime(values["DateCreated"])
+        values["DateModify"] = to_datetime(values["DateModify"])
         return values
 
     @staticmethod
-    async def get_by_pupil_and_period(
+    def iter_by_pupil_and_period(
         api: API,
         pupil_id: int,
         period_id: int,
         behaviour: bool = False,
         last_sync_date: datetime = datetime.min,
-    ) -> list["Grade"]:
-        envelope = await api.get_all(
+    ) -> AsyncIterator[list["Grade"]]:
+        return api.iter_models(
             f'grade/{"behaviour" if behaviour else ""}/byPupil',
             {
                 "pupilId": pupil_id,
                 "periodId": period_id,
                 "lastSyncDate": last_sync_date.isoformat(),
             },
+            Grade,
         )
-        return list(map(Grade.parse_obj, envelope))
+
+    @staticmethod
+    async def get_by_pupil_and_period(
+        api: API,
+        pupil_id: int,
+        period_id: int,
+        behaviour: bool = False,
+        last_sync_date: datetime = datetime.min,
+    ) -> list["Grade"]:
+        return [
+            grade
+            async for page in Grade.iter_by_pupil_and_period(
+                api, pupil_id, period_id, behaviour, last_sync_date
+            )
+            for grade in page
+        ]
 
     @staticmethod
     async def get_by_pupil_period_and_id(
@@ -103,7 +120,7 @@ class Grade(BaseModel):
             raise InvalidResponseEnvelopeTypeException()
         if not envelope:
             raise NotFoundEntityException()
-        return Grade.parse_obj(envelope)
+        return api.parse(Grade, envelope)
 
     @staticmethod
     async def get_deleted_by_pupil_and_period(
@@ -147,23 +164,33 @@ class GradesSummary(BaseModel):
     @root_validator(pre=True)
     def root_validator(cls, values):
         try:
-            values["DateModify"] = datetime.fromtimestamp(
-                values["DateModify"]["Timestamp"] / 1000
-            )
-        except:
+            values["DateModify"] = to_datetime(values.get("DateModify"))
+        except (KeyError, TypeError, ValueError, OverflowError, OSError):
             values["DateModify"] = None
         return values
 
     @staticmethod
-    async def get_by_pupil_and_period(
+    def iter_by_pupil_and_period(
         api: API, pupil_id: int, period_id: int, last_sync_date: datetime = datetime.min
-    ) -> list["GradesSummary"]:
-        envelope = await api.get_all(
+    ) -> AsyncIterator[list["GradesSummary"]]:
+        return api.iter_models(
             "grade/summary/byPupil",
             {
                 "pupilId": pupil_id,
                 "periodId": period_id,
                 "lastSyncDate": last_sync_date.isoformat(),
             },
+            GradesSummary,
         )
-        return list(map(GradesSummary.parse_obj, envelope))
+
+    @staticmethod
+    async def get_by_pupil_and_period(
+        api: API, pupil_id: int, period_id: int, last_sync_date: datetime = datetime.min
+    ) -> list["GradesSummary"]:
+        return [
+            summary
+            async for page in GradesSummary.iter_by_pupil_and_period(
+                api, pupil_id, period_id, last_sync_date
+            )
+            for summary in page
+        ]
@@ -0,0 +1,250 @@
+import pickle
+from array import array
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from sdk_python.hebe.api import API
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+COLUMNS: dict[str, str] = {
+    "id": "q",
+    "pupil_id": "q",
+    "period_id": "q",
+    "subject": "i",
+    "column": "i",
+    "value": "d",
+    "weight": "d",
+    "nominator": "d",
+    "denominator": "d",
+    "date_created": "d",
+    "date_modify": "d",
+}
+
+Row = tuple[int, int, int, int, int, float, float, float, float, float, float]
+
+
+def _get_float(value: Any) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def _get_timestamp(value: Any) -> float:
+    if value is None:
+        return float("nan")
+    if isinstance(value, datetime):
+        return value.timestamp() * 1000
+    return float(value["Timestamp"])
+
+
+def get_row(grade: dict) -> Row:
+    column: dict = grade["Column"]
+    return (
+        grade["Id"],
+        grade["PupilId"],
+        column["PeriodId"],
+        column["Subject"]["Id"],
+        column["Id"],
+        _get_float(grade.get("Value")),
+        _get_float(column.get("Weight")),
+        _get_float(grade.get("Nominator")),
+        _get_float(grade.get("Denominator")),
+        _get_timestamp(grade.get("DateCreated")),
+        _get_timestamp(grade["DateModify"]),
+    )
+
+
+def _restore(
+    columns: dict[str, tuple[str, Any]],
+    subject_ids: list[int],
+    column_ids: list[int],
+    is_sorted: bool = False,
+) -> "GradeTable":
+    return GradeTable(
+        {
+            name: memoryview(buffer).cast("B").cast(type_code)
+            for name, (type_code, buffer) in columns.items()
+        },
+        subject_ids,
+        column_ids,
+        is_sorted,
+    )
+
+
+class GradeTable:
+    def __init__(
+        self,
+        columns: dict[str, memoryview],
+        subject_ids: list[int],
+        column_ids: list[int],
+        is_sorted: bool = False,
+    ):
+        self.columns = columns
+        self.subject_ids = subject_ids
+        self.column_ids = column_ids
+        self.is_sorted = is_sorted
+        self._ranges: Optional[dict[tuple[int, int], tuple[int, int]]] = None
+
+    @staticmethod
+    def from_rows(rows: Iterable[Row]) -> "GradeTable":
+        rows = sorted(rows, key=lambda row: (row[2], row[3], row[0]))
+        subject_codes: dict[int, int] = {}
+        column_codes: dict[int, int] = {}
+        encoded: list[tuple] = [
+            (
+                *row[:3],
+                subject_codes.setdefault(row[3], len(subject_codes)),
+                column_codes.setdefault(row[4], len(column_codes)),
+                *row[5:],
+            )
+            for row in rows
+        ]
+        return GradeTable(
+            {
+                name: memoryview(array(type_code, (row[index] for row in encoded)))
+                for index, (name, type_code) in enumerate(COLUMNS.items())
+            },
+            list(subject_codes),
+            list(column_codes),
+            True,
+        )
+
+    @staticmethod
+    def from_envelopes(envelopes: Iterable[dict]) -> "GradeTable":
+        return GradeTable.from_rows(map(get_row, envelopes))
+
+    @staticmethod
+    def concat(tables: Iterable["GradeTable"]) -> "GradeTable":
+        return GradeTable.from_rows(row for table in tables for row in table.rows())
+
+    @staticmethod
+    async def get_by_pupil_and_period(
+        api: API,
+        pupil_id: int,
+        period_id: int,
+        behaviour: bool = False,
+        last_sync_date: datetime = datetime.min,
+    ) -> "GradeTable":
+        rows: list[Row] = []
+        async for envelope in api.iter_all(
+            f'grade/{"behaviour" if behaviour else ""}/byPupil',
+            {
+                "pupilId": pupil_id,
+                "periodId": period_id,
+                "lastSyncDate": last_sync_date.isoformat(),
+            },
+        ):
+            rows.extend(map(get_row, envelope))
+        return GradeTable.from_rows(rows)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __reduce_ex__(self, protocol: int):
+        return _restore, (
+            {
+                name: (
+                    column.format,
+                    pickle.PickleBuffer(column) if protocol >= 5 else column.tobytes(),
+                )
+                for name, column in self.columns.items()
+            },
+            self.subject_ids,
+            self.column_ids,
+            self.is_sorted,
+        )
+
+    def __getitem__(self, key: Union[str, slice]) -> Any:
+        if isinstance(key, str):
+            return self.columns[key]
+        if key.step not in (None, 1):
+            return self.take(range(len(self))[key])
+        return GradeTable(
+            {name: column[key] for name, column in self.columns.items()},
+            self.subject_ids,
+            self.column_ids,
+            self.is_sorted,
+        )
+
+    def get_subject_ids(self) -> list[int]:
+        return [self.subject_ids[code] for code in self.columns["subject"]]
+
+    def get_column_ids(self) -> list[int]:
+        return [self.column_ids[code] for code in self.columns["column"]]
+
+    def get_datetimes(self, name: str = "date_modify") -> list[Optional[datetime]]:
+        return [
+            datetime.fromtimestamp(value / 1000) if value == value else None
+            for value in self.columns[name]
+        ]
+
+    def rows(self) -> Iterator[Row]:
+        for row in zip(*self.columns.values()):
+            yield (
+                *row[:3],
+                self.subject_ids[row[3]],
+                self.column_ids[row[4]],
+                *row[5:],
+            )
+
+    def _get_ranges(self) -> dict[tuple[int, int], tuple[int, int]]:
+        if not self.is_sorted:
+            raise ValueError("GradeTable rows are not sorted")
+        if self._ranges is None:
+            ranges: dict[tuple[int, int], tuple[int, int]] = {}
+            for index, key in enumerate(
+                zip(self.columns["period_id"], self.columns["subject"])
+            ):
+                start, _ = ranges.get(key, (index, index))
+                ranges[key] = (start, index + 1)
+            self._ranges = ranges
+        return self._ranges
+
+    def take(self, indices: Iterable[int]) -> "GradeTable":
+        indices = list(indices)
+        return GradeTable(
+            {
+                name: memoryview(array(column.format, (column[i] for i in indices)))
+                for name, column in self.columns.items()
+            },
+            self.subject_ids,
+            self.column_ids,
+            self.is_sorted
+            and all(left < right for left, right in zip(indices, indices[1:])),
+        )
+
+    def filter(self, subject_id: int = None, period_id: int = None) -> "GradeTable":
+        if subject_id is None and period_id is None:
+            return self
+        subject: Optional[int] = None
+        if subject_id is not None:
+            if subject_id not in self.subject_ids:
+                return self[0:0]
+            subject = self.subject_ids.index(subject_id)
+        if period_id is None or not self.is_sorted:
+            return self.take(
+                index
+                for index, key in enumerate(
+                    zip(self.columns["period_id"], self.columns["subject"])
+                )
+                if (period_id is None or key[0] == period_id)
+                and (subject is None or key[1] == subject)
+            )
+        ranges: list[tuple[int, int]] = [
+            value
+            for key, value in self._get_ranges().items()
+            if key[0] == period_id and (subject is None or key[1] == subject)
+        ]
+        if not ranges:
+            return self[0:0]
+        return self[min(start for start, _ in ranges) : max(stop for _, stop in ranges)]
+
+    def to_numpy(self) -> dict[str, Any]:
+        if not numpy:
+            raise ImportError("numpy is required to convert a GradeTable")
+        return {
+            name: numpy.frombuffer(column, dtype=column.format)
+            for name, column in self.columns.items()
+        }
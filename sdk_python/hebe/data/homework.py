@@ -1,10 +1,11 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Optional, AsyncIterator
 from uuid import UUID
 
 from pydantic import BaseModel, Field, root_validator
 
 from sdk_python.hebe import API
+from sdk_python.hebe.timestamps import to_date, to_datetime
 from sdk_python.hebe.error import InvalidResponseEnvelopeTypeException
 from sdk_python.hebe.models.employee import Employee
 from sdk_python.hebe.models.attachment import Attachment
@@ -28,29 +29,31 @@ class Homework(BaseModel):
 
     @root_validator(pre=True)
     def root_validator(cls, values):
-        values["Deadline"] = datetime.fromtimestamp(
-            values["Deadline"]["Timestamp"] / 1000
-        )
-        values["DateCreated"] = datetime.fromtimestamp(
-            values["DateCreated"]["Timestamp"] / 1000
-        )
-        values["Date"] = date.fromtimestamp(values["Date"]["Timestamp"] / 1000)
-        values["AnswerDate"] = (
-            datetime.fromtimestamp(values["AnswerDate"]["Timestamp"] / 1000)
-            if values["AnswerDate"]
-            else None
-        )
+        values["Deadline"] = to_datetime(values["Deadline"])
+        values["DateCreated"] = to_datetime(values["DateCreated"])
+        values["Date"] = to_date(values["Date"])
+        values["AnswerDate"] = to_datetime(values["AnswerDate"])
         return values
 
     @staticmethod
-    async def get_by_pupil(
+    def iter_by_pupil(
         api: API, pupil_id: int, last_sync_date: datetime = datetime.min
-    ) -> list["Homework"]:
-        envelope = await api.get_all(
+    ) -> AsyncIterator[list["Homework"]]:
+        return api.iter_models(
             "homework/byPupil",
             {"pupilId": pupil_id, "lastSyncDate": last_sync_date.isoformat()},
+            Homework,
         )
-        return list(map(Homework.parse_obj, envelope))
+
+    @staticmethod
+    async def get_by_pupil(
+        api: API, pupil_id: int, last_sync_date: datetime = datetime.min
+    ) -> list["Homework"]:
+        return [
+            homework
+            async for page in Homework.iter_by_pupil(api, pupil_id, last_sync_date)
+            for homework in page
+        ]
 
     @staticmethod
     async def get_deleted_by_pupil(
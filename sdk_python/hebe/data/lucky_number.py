@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, root_validator
 from datetime import date
+from typing import Optional
 
 from sdk_python.hebe.api import API
 from sdk_python.hebe.error import InvalidResponseEnvelopeTypeException
@@ -16,12 +17,15 @@ class LuckyNumber(BaseModel):
 
     @staticmethod
     async def get_by_constituent_unit(
-        api: API, constituent_unit_id: int, day: date = date.today()
+        api: API, constituent_unit_id: int, day: Optional[date] = None
     ) -> "LuckyNumber":
         envelope, envelope_type = await api.get(
             "school/lucky",
-            params={"constituentId": constituent_unit_id, "day": day.isoformat()},
+            params={
+                "constituentId": constituent_unit_id,
+                "day": (day or date.today()).isoformat(),
+            },
         )
         if envelope_type != "LuckyNumberPayload":
             raise InvalidResponseEnvelopeTypeException()
-        return LuckyNumber.parse_obj(envelope)
+        return api.parse(LuckyNumber, envelope)
@@ -1,8 +1,9 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Optional, AsyncIterator
 from pydantic import BaseModel, Field, root_validator
 
 from sdk_python.hebe.api import API
+from sdk_python.hebe.timestamps import to_datetime
 from sdk_python.hebe.error import (
     InvalidResponseEnvelopeTypeException,
     NotFoundEntityException,
@@ -20,25 +21,40 @@ class Meeting(BaseModel):
 
     @root_validator(pre=True)
     def root_validator(cls, values):
-        values["When"] = datetime.fromtimestamp(values["When"]["Timestamp"] / 1000)
+        values["When"] = to_datetime(values["When"])
         return values
 
     @staticmethod
-    async def get_by_pupil(
+    def iter_by_pupil(
         api: API,
         pupil_id: int,
-        from_date: date = datetime.now(),
+        from_date: Optional["date"] = None,
         last_sync_date: datetime = datetime.min,
-    ) -> list["Meeting"]:
-        envelope = await api.get_all(
+    ) -> AsyncIterator[list["Meeting"]]:
+        return api.iter_models(
             "meetings/byPupil",
             {
                 "pupilId": pupil_id,
-                "from": from_date.isoformat(),
+                "from": (from_date or date.today()).isoformat(),
                 "lastSyncDate": last_sync_date.isoformat(),
             },
+            Meeting,
         )
-        return list(map(Meeting.parse_obj, envelope))
+
+    @staticmethod
+    async def get_by_pupil(
+        api: API,
+        pupil_id: int,
+        from_date: Optional["date"] = None,
+        last_sync_date: datetime = datetime.min,
+    ) -> list["Meeting"]:
+        return [
+            meeting
+            async for page in Meeting.iter_by_pupil(
+                api, pupil_id, from_date, last_sync_date
+            )
+            for meeting in page
+        ]
 
     @staticmethod
     async def get_by_pupil_and_id(
@@ -51,7 +67,7 @@ class Meeting(BaseModel):
             raise InvalidResponseEnvelopeTypeException()
         if not envelope:
             raise NotFoundEntityException()
-        return Meeting.parse_obj(envelope)
+        return api.parse(Meeting, envelope)
 
     @staticmethod
     async def get_deleted_by_pupil(
@@ -2,10 +2,11 @@ import json
 from uuid import UUID
 from pydantic import BaseModel, Field, root_validator
 from datetime import datetime
-from typing import Optional
+from typing import Optional, AsyncIterator
 from enum import Enum
 
 from sdk_python.hebe.api import API
+from sdk_python.hebe.timestamps import to_datetime
 from sdk_python.hebe.error import (
     InvalidResponseEnvelopeTypeException,
     NotFoundEntityException,
@@ -39,23 +40,29 @@ class Note(BaseModel):
     @root_validator(pre=True)
     def root_validator(cls, values):
         values["Key"] = UUID(values["Key"])
-        values["DateValid"] = datetime.fromtimestamp(
-            values["DateValid"]["Timestamp"] / 1000
-        )
-        values["DateModify"] = datetime.fromtimestamp(
-            values["DateModify"]["Timestamp"] / 1000
-        )
+        values["DateValid"] = to_datetime(values["DateValid"])
+        values["DateModify"] = to_datetime(values["DateModify"])
         return values
 
     @staticmethod
-    async def get_by_pupil(
+    def iter_by_pupil(
         api: API, pupil_id: int, last_sync_date: datetime = datetime.min
-    ) -> list["Note"]:
-        envelope = await api.get_all(
+    ) -> AsyncIterator[list["Note"]]:
+        return api.iter_models(
             "note/byPupil",
-            params={"pupilId": pupil_id, "lastSyncDate": last_sync_date.isoformat()},
+            {"pupilId": pupil_id, "lastSyncDate": last_sync_date.isoformat()},
+            Note,
         )
-        return list(map(Note.parse_obj, envelope))
+
+    @staticmethod
+    async def get_by_pupil(
+        api: API, pupil_id: int, last_sync_date: datetime = datetime.min
+    ) -> list["Note"]:
+        return [
+            note
+            async for page in Note.iter_by_pupil(api, pupil_id, last_sync_date)
+            for note in page
+        ]
 
     @staticmethod
     async def get_by_pupil_and_id(api: API, pupil_id: int, note_id: int) -> "Note":
@@ -66,7 +73,7 @@ class Note(BaseModel):
             raise InvalidResponseEnvelopeTypeException()
         if not envelope:
             raise NotFoundEntityException()
-        return Note.parse_obj(envelope)
+        return api.parse(Note, envelope)
 
     @staticmethod
     async def get_deleted_by_pupil(
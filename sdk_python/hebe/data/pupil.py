@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field, root_validator
 from enum import Enum
 
 from sdk_python.hebe.api import API
+from sdk_python.hebe.timestamps import to_datetime
 from sdk_python.hebe.error import InvalidResponseEnvelopeTypeException
 
 
@@ -72,7 +73,7 @@ class Pupil(BaseModel):
         envelope, envelope_type = await api.get("pupil", params={"id": pupil_id})
         if envelope_type != "PupilPayload":
             raise InvalidResponseEnvelopeTypeException()
-        return Pupil.parse_obj(envelope)
+        return api.parse(Pupil, envelope)
 
 
 class Period(BaseModel):
@@ -87,8 +88,8 @@ class Period(BaseModel):
 
     @root_validator(pre=True)
     def root_validator(cls, values):
-        values["Start"] = datetime.fromtimestamp(values["Start"]["Timestamp"] / 1000)
-        values["End"] = datetime.fromtimestamp(values["End"]["Timestamp"] / 1000)
+        values["Start"] = to_datetime(values["Start"])
+        values["End"] = to_datetime(values["End"])
         return values
 
 
@@ -100,12 +101,8 @@ class Journal(BaseModel):
 
     @root_validator(pre=True)
     def root_validator(cls, values):
-        values["YearStart"] = datetime.fromtimestamp(
-            values["YearStart"]["Timestamp"] / 1000
-        )
-        values["YearEnd"] = datetime.fromtimestamp(
-            values["YearEnd"]["Timestamp"] / 1000
-        )
+        values["YearStart"] = to_datetime(values["YearStart"])
+        values["YearEnd"] = to_datetime(values["YearEnd"])
         return values
 
 
@@ -139,4 +136,4 @@ class PupilInfo(BaseModel):
         )
         if envelope_type != "IEnumerable`1":
             raise InvalidResponseEnvelopeTypeException()
-        return list(map(PupilInfo.parse_obj, envelope))
+        return api.parse_many(PupilInfo, envelope)
@@ -1,11 +1,12 @@
 from datetime import date, datetime
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, AsyncIterator
 
 from pydantic import BaseModel, Field, root_validator
 
 from sdk_python.hebe import API
 from sdk_python.hebe.data.time_slot import TimeSlot
+from sdk_python.hebe.timestamps import to_date
 from sdk_python.hebe.error import InvalidResponseEnvelopeTypeException
 from sdk_python.hebe.models.distribution import Distribution
 from sdk_python.hebe.models.employee import Employee
@@ -46,27 +47,43 @@ class ScheduleEntry(BaseModel):
 
     @root_validator(pre=True)
     def root_validator(cls, values):
-        values["Date"] = date.fromtimestamp(values["Date"]["Timestamp"] / 1000)
+        values["Date"] = to_date(values["Date"])
         return values
 
     @staticmethod
-    async def get_by_pupil(
+    def iter_by_pupil(
         api: API,
         pupil_id: int,
-        date_from: date.today(),
-        date_to: date = date.today(),
+        date_from: date = None,
+        date_to: date = None,
         last_sync_date: datetime = datetime.min,
-    ) -> list["ScheduleEntry"]:
-        envelope = await api.get_all(
+    ) -> AsyncIterator[list["ScheduleEntry"]]:
+        return api.iter_models(
             "schedule/byPupil",
             {
                 "pupilId": pupil_id,
-                "dateFrom": date_from.isoformat(),
-                "dateTo": date_to.isoformat(),
+                "dateFrom": (date_from or date.today()).isoformat(),
+                "dateTo": (date_to or date.today()).isoformat(),
                 "lastSyncDate": last_sync_date.isoformat(),
             },
+            ScheduleEntry,
         )
-        return list(map(ScheduleEntry.parse_obj, envelope))
+
+    @staticmethod
+    async def get_by_pupil(
+        api: API,
+        pupil_id: int,
+        date_from: date = None,
+        date_to: date = None,
+        last_sync_date: datetime = datetime.min,
+    ) -> list["ScheduleEntry"]:
+        return [
+            entry
+            async for page in ScheduleEntry.iter_by_pupil(
+                api, pupil_id, date_from, date_to, last_sync_date
+            )
+            for entry in page
+        ]
 
     @staticmethod
     async def get_deleted_by_pupil(
@@ -106,34 +123,44 @@ class ScheduleChange(BaseModel):
         values["Type"] = values["Change"]["Type"]
         values["IsMerge"] = values["Change"]["IsMerge"]
         values["Separation"] = values["Change"]["Separation"]
-        values["LessonDate"] = datetime.fromtimestamp(
-            values["LessonDate"]["Timestamp"] / 1000
-        )
-        values["ChangeDate"] = (
-            datetime.fromtimestamp(values["ChangeDate"]["Timestamp"] / 1000)
-            if values["ChangeDate"]
-            else None
-        )
+        values["LessonDate"] = to_date(values["LessonDate"])
+        values["ChangeDate"] = to_date(values["ChangeDate"])
         return values
 
     @staticmethod
-    async def get_by_pupil(
+    def iter_by_pupil(
         api: API,
         pupil_id: int,
-        date_from: date = date.today(),
-        date_to: date = date.today(),
+        date_from: date = None,
+        date_to: date = None,
         last_sync_date: datetime = datetime.min,
-    ) -> list["ScheduleChange"]:
-        envelope = await api.get_all(
+    ) -> AsyncIterator[list["ScheduleChange"]]:
+        return api.iter_models(
             "schedule/changes/byPupil",
             {
                 "pupilId": pupil_id,
-                "dateFrom": date_from.isoformat(),
-                "dateTo": date_to.isoformat(),
+                "dateFrom": (date_from or date.today()).isoformat(),
+                "dateTo": (date_to or date.today()).isoformat(),
                 "lastSyncDate": last_sync_date.isoformat(),
             },
+            ScheduleChange,
         )
-        return list(map(ScheduleChange.parse_obj, envelope))
+
+    @staticmethod
+    async def get_by_pupil(
+        api: API,
+        pupil_id: int,
+        date_from: date = None,
+        date_to: date = None,
+        last_sync_date: datetime = datetime.min,
+    ) -> list["ScheduleChange"]:
+        return [
+            change
+            async for page in ScheduleChange.iter_by_pupil(
+                api, pupil_id, date_from, date_to, last_sync_date
+            )
+            for change in page
+        ]
 
     @staticmethod
     async def get_deleted(
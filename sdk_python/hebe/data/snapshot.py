@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Optional
+from pydantic import BaseModel
+
+from sdk_python.hebe.data.exam import Exam
+from sdk_python.hebe.data.grade import Grade, GradesSummary
+from sdk_python.hebe.data.homework import Homework
+from sdk_python.hebe.data.lucky_number import LuckyNumber
+from sdk_python.hebe.data.meeting import Meeting
+from sdk_python.hebe.data.note import Note
+from sdk_python.hebe.data.pupil import Period, PupilInfo
+from sdk_python.hebe.data.schedule import ScheduleChange, ScheduleEntry
+from sdk_python.hebe.data.teacher import Teacher
+
+
+class PupilSnapshot(BaseModel):
+    pupil_info: PupilInfo
+    period: Period
+    date_from: date
+    date_to: date
+    grades: list[Grade]
+    grades_summary: list[GradesSummary]
+    exams: list[Exam]
+    homework: list[Homework]
+    notes: list[Note]
+    meetings: list[Meeting]
+    schedule: list[ScheduleEntry]
+    schedule_changes: list[ScheduleChange]
+    teachers: list[Teacher]
+    lucky_number: Optional[LuckyNumber]
+
+    @staticmethod
+    def get_current_period(pupil_info: PupilInfo) -> Period:
+        return next(
+            (period for period in pupil_info.periods if period.current),
+            pupil_info.periods[-1],
+        )
@@ -29,12 +29,10 @@ class Teacher(BaseModel):
                 "lastSyncDate": last_sync_date.isoformat(),
             },
         )
-        return list(
-            map(
-                Teacher.parse_obj,
-                filter(
-                    lambda teacher: teacher["Position"] == 1 or return_other_employees,
-                    envelope,
-                ),
-            )
+        return api.parse_many(
+            Teacher,
+            filter(
+                lambda teacher: teacher["Position"] == 1 or return_other_employees,
+                envelope,
+            ),
         )
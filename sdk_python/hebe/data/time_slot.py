@@ -1,11 +1,13 @@
 from datetime import time
-from pydantic import BaseModel, Field, root_validator
+from pydantic import Field, root_validator
 
 from sdk_python.hebe.api import API
+from sdk_python.hebe.interning import InternedModel
+from sdk_python.hebe.timestamps import to_time
 from sdk_python.hebe.error import InvalidResponseEnvelopeTypeException
 
 
-class TimeSlot(BaseModel):
+class TimeSlot(InternedModel):
     id: int = Field(alias="Id")
     position: int = Field(alias="Position")
     start: time = Field(alias="Start")
@@ -13,13 +15,24 @@ class TimeSlot(BaseModel):
 
     @root_validator(pre=True)
     def root_validator(cls, values):
-        values["Start"] = time(*map(int, values["Start"].split(":")))
-        values["End"] = time(*map(int, values["End"].split(":")))
+        values["Start"] = to_time(values["Start"])
+        values["End"] = to_time(values["End"])
         return values
 
     @staticmethod
     async def get(api: API) -> list["TimeSlot"]:
+        return await api.dictionary_cache.get(
+            api, "dictionary/timeslot", TimeSlot.fetch
+        )
+
+    @staticmethod
+    async def fetch(api: API) -> list["TimeSlot"]:
         envelope, envelope_type = await api.get("dictionary/timeslot")
         if envelope_type != "IEnumerable`1":
             raise InvalidResponseEnvelopeTypeException()
-        return list(map(TimeSlot.parse_obj, envelope))
+        return api.parse_many(TimeSlot, envelope)
+
+    class Config:
+        intern_key = "Id"
+        intern_shared = True
+        copy_on_model_validation = "none"
@@ -0,0 +1,192 @@
+import asyncio
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterable, Optional, Union
+from pydantic import BaseModel
+
+from sdk_python.hebe.api import API
+from sdk_python.hebe.data.schedule import (
+    ScheduleChange,
+    ScheduleChangeType,
+    ScheduleEntry,
+)
+from sdk_python.hebe.data.time_slot import TimeSlot
+from sdk_python.hebe.models.employee import Employee
+from sdk_python.hebe.models.room import Room
+from sdk_python.hebe.models.subject import Subject
+
+CANCELLING_CHANGES: set[ScheduleChangeType] = {
+    ScheduleChangeType.EXEMPTION,
+    ScheduleChangeType.RESCHEDULED,
+    ScheduleChangeType.CLASS_ABSENCE,
+}
+
+
+def _has_target(change: ScheduleChange) -> bool:
+    return bool(change.change_date or change.time_slot)
+
+
+def _is_cancelling(change: ScheduleChange) -> bool:
+    if change.type != ScheduleChangeType.RESCHEDULED:
+        return change.type in CANCELLING_CHANGES
+    return _has_target(change)
+
+
+class Lesson(BaseModel):
+    date_: date
+    time_slot: TimeSlot
+    start: datetime
+    end: datetime
+    entry: Optional[ScheduleEntry]
+    change: Optional[ScheduleChange]
+    subject: Optional[Subject]
+    teacher_primary: Optional[Employee]
+    teacher_secondary: Optional[Employee]
+    room: Optional[Room]
+    cancelled: bool
+    rescheduled: bool
+
+    @staticmethod
+    def create(
+        entry: Optional[ScheduleEntry],
+        change: Optional[ScheduleChange] = None,
+        rescheduled: bool = False,
+        merged: bool = False,
+    ) -> "Lesson":
+        lesson_date: date = entry.date_ if entry else change.lesson_date
+        time_slot: TimeSlot = entry.time_slot if entry else change.time_slot
+        if rescheduled:
+            lesson_date = change.change_date or lesson_date
+            time_slot = change.time_slot or time_slot
+        fields: dict[str, Any] = {
+            name: getattr(entry, name, None)
+            for name in ("subject", "teacher_primary", "teacher_secondary", "room")
+        }
+        applied: bool = bool(change) and not merged
+        cancelled: bool = applied and not rescheduled and _is_cancelling(change)
+        if applied and not cancelled:
+            for name in fields:
+                fields[name] = getattr(change, name) or fields[name]
+        return Lesson.construct(
+            date_=lesson_date,
+            time_slot=time_slot,
+            start=datetime.combine(lesson_date, time_slot.start),
+            end=datetime.combine(lesson_date, time_slot.end),
+            entry=entry,
+            change=change,
+            cancelled=cancelled,
+            rescheduled=rescheduled,
+            **fields,
+        )
+
+
+class Timeline:
+    def __init__(self, lessons: Iterable[Lesson]):
+        self.lessons: list[Lesson] = sorted(
+            lessons, key=lambda lesson: (lesson.start, lesson.time_slot.position)
+        )
+        self._starts: list[datetime] = [lesson.start for lesson in self.lessons]
+        self._dates: list[date] = [lesson.date_ for lesson in self.lessons]
+        self._max_duration: timedelta = max(
+            (lesson.end - lesson.start for lesson in self.lessons),
+            default=timedelta(0),
+        )
+
+    @staticmethod
+    def build(
+        entries: Iterable[ScheduleEntry], changes: Iterable[ScheduleChange] = ()
+    ) -> "Timeline":
+        entries = list(entries)
+        changes_by_entry: dict[int, list[ScheduleChange]] = {}
+        changes_by_id: dict[int, ScheduleChange] = {}
+        for change in changes:
+            changes_by_entry.setdefault(change.schedule_entry_id, []).append(change)
+            changes_by_id[change.id] = change
+        lessons: list[Lesson] = []
+        for entry in entries:
+            entry_changes: list[ScheduleChange] = changes_by_entry.pop(entry.id, [])
+            if entry.merge_change_id is not None:
+                lessons.append(
+                    Lesson.create(
+                        entry, changes_by_id.get(entry.merge_change_id), merged=True
+                    )
+                )
+            elif not entry_changes:
+                lessons.append(Lesson.create(entry))
+            for change in entry_changes:
+                lessons.extend(Timeline._apply(entry, change))
+        for entry_changes in changes_by_entry.values():
+            for change in entry_changes:
+                if change.type == ScheduleChangeType.RESCHEDULED and change.time_slot:
+                    lessons.append(Lesson.create(None, change, rescheduled=True))
+        return Timeline(lessons)
+
+    @staticmethod
+    def _apply(entry: ScheduleEntry, change: ScheduleChange) -> list[Lesson]:
+        if change.type != ScheduleChangeType.RESCHEDULED or not _has_target(change):
+            return [Lesson.create(entry, change)]
+        return [
+            Lesson.create(entry, change),
+            Lesson.create(entry, change, rescheduled=True),
+        ]
+
+    @staticmethod
+    async def get_by_pupil(
+        api: API,
+        pupil_id: int,
+        date_from: date = None,
+        date_to: date = None,
+    ) -> "Timeline":
+        date_from = date_from or date.today()
+        date_to = date_to or date_from
+        entries, changes = await asyncio.gather(
+            ScheduleEntry.get_by_pupil(api, pupil_id, date_from, date_to),
+            ScheduleChange.get_by_pupil(api, pupil_id, date_from, date_to),
+        )
+        return Timeline.build(entries, changes)
+
+    def __len__(self) -> int:
+        return len(self.lessons)
+
+    def get_at(self, moment: datetime, cancelled: bool = False) -> list[Lesson]:
+        stop: int = bisect_right(self._starts, moment)
+        start: int = bisect_left(self._starts, moment - self._max_duration)
+        return [
+            lesson
+            for lesson in self.lessons[start:stop]
+            if lesson.end > moment and (cancelled or not lesson.cancelled)
+        ]
+
+    def get_range(
+        self,
+        date_from: Union[date, datetime],
+        date_to: Union[date, datetime],
+        cancelled: bool = True,
+    ) -> list[Lesson]:
+        if not isinstance(date_from, datetime):
+            date_from = datetime.combine(date_from, time.min)
+        if not isinstance(date_to, datetime):
+            date_to = datetime.combine(date_to + timedelta(days=1), time.min)
+        start: int = bisect_left(self._starts, date_from)
+        stop: int = bisect_left(self._starts, date_to)
+        return [
+            lesson
+            for lesson in self.lessons[start:stop]
+            if cancelled or not lesson.cancelled
+        ]
+
+    def get_day(self, day: date, cancelled: bool = True) -> list[Lesson]:
+        start: int = bisect_left(self._dates, day)
+        stop: int = bisect_right(self._dates, day)
+        return [
+            lesson
+            for lesson in self.lessons[start:stop]
+            if cancelled or not lesson.cancelled
+        ]
+
+    def get_lesson(self, day: date, position: int) -> list[Lesson]:
+        return [
+            lesson
+            for lesson in self.get_day(day)
+            if lesson.time_slot.position == position
+        ]
@@ -0,0 +1,59 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, Type
+from pydantic import BaseModel
+
+DICTIONARY_TTL: float = 24 * 60 * 60
+
+
+class DictionaryCache:
+    def __init__(self, ttl: float = DICTIONARY_TTL):
+        self.ttl = ttl
+        self._items: dict[tuple[str, str], tuple[float, list[Any]]] = {}
+        self._tasks: dict[tuple[str, str], asyncio.Task] = {}
+        self._shared: dict[
+            str, tuple[float, dict[Type[BaseModel], dict[Any, BaseModel]]]
+        ] = {}
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at < self.ttl
+
+    def get_shared(self, rest_url: str) -> dict[Type[BaseModel], dict[Any, BaseModel]]:
+        entry: Optional[tuple[float, dict]] = self._shared.get(rest_url)
+        if not entry or not self._is_fresh(entry[0]):
+            entry = self._shared[rest_url] = (time.time(), {})
+        return entry[1]
+
+    async def _fetch(
+        self, key: tuple[str, str], api, fetch: Callable[[Any], Awaitable[list[Any]]]
+    ) -> list[Any]:
+        items: list[Any] = await fetch(api)
+        self._items[key] = (time.time(), items)
+        return items
+
+    async def get(
+        self, api, endpoint: str, fetch: Callable[[Any], Awaitable[list[Any]]]
+    ) -> list[Any]:
+        key: tuple[str, str] = (api.rest_url, endpoint)
+        entry: Optional[tuple[float, list[Any]]] = self._items.get(key)
+        if entry and self._is_fresh(entry[0]):
+            return entry[1]
+        task: Optional[asyncio.Task] = self._tasks.get(key)
+        if not task or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._tasks[key] = asyncio.ensure_future(
+                self._fetch(key, api, fetch)
+            )
+        return await asyncio.shield(task)
+
+    def invalidate(self, rest_url: str = None) -> None:
+        for mapping in (self._items, self._tasks):
+            for key in list(mapping):
+                if rest_url is None or key[0] == rest_url:
+                    del mapping[key]
+        if rest_url is None:
+            self._shared.clear()
+        else:
+            self._shared.pop(rest_url, None)
+
+
+default_dictionary_cache: DictionaryCache = DictionaryCache()
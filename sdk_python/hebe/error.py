@@ -60,3 +60,19 @@ class InvalidPINException(SDKException):
 
 class ExpiredTokenException(SDKException):
     pass
+
+
+class InvalidSnapshotException(SDKException):
+    pass
+
+
+class SnapshotVersionException(SDKException):
+    pass
+
+
+class StoreVersionException(SDKException):
+    pass
+
+
+class FleetWorkerException(SDKException):
+    pass
@@ -0,0 +1,256 @@
+import asyncio
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional
+from pydantic import BaseModel
+
+from sdk_python.hebe.api import API
+from sdk_python.hebe.certificate import Certificate
+from sdk_python.hebe.client import Client
+from sdk_python.hebe.error import FleetWorkerException
+from sdk_python.hebe.session import SessionRegistry
+
+DEFAULT_WORKER_CONCURRENCY: int = 32
+POLL_INTERVAL: float = 0.5
+
+FleetTask = Callable[[Client], Awaitable[Any]]
+
+
+class FleetResult(BaseModel):
+    worker: int
+    fingerprint: str
+    result: Any = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    elapsed: float
+
+
+class WorkerStats(BaseModel):
+    worker: int
+    pid: Optional[int]
+    accounts: int
+    errors: int
+    elapsed: float
+    exit_code: Optional[int] = None
+
+    @property
+    def throughput(self) -> float:
+        return self.accounts / self.elapsed if self.elapsed else 0
+
+
+async def _run_account(
+    worker: int,
+    certificate: Certificate,
+    task: FleetTask,
+    registry: SessionRegistry,
+    api_options: dict,
+) -> FleetResult:
+    start: float = time.perf_counter()
+    try:
+        async with API(
+            certificate, session_registry=registry, **api_options
+        ) as api, Client(api) as client:
+            result: Any = await task(client)
+        return FleetResult(
+            worker=worker,
+            fingerprint=certificate.fingerprint,
+            result=result,
+            elapsed=time.perf_counter() - start,
+        )
+    except Exception as exception:
+        return FleetResult(
+            worker=worker,
+            fingerprint=certificate.fingerprint,
+            error=str(exception),
+            error_type=type(exception).__name__,
+            elapsed=time.perf_counter() - start,
+        )
+
+
+def _encode(result: FleetResult) -> bytes:
+    try:
+        return pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    except Exception as exception:
+        return pickle.dumps(
+            result.copy(
+                update={
+                    "result": None,
+                    "error": str(exception),
+                    "error_type": type(exception).__name__,
+                }
+            ),
+            pickle.HIGHEST_PROTOCOL,
+        )
+
+
+async def _run_shard(
+    worker: int,
+    certificates: list[Certificate],
+    task: FleetTask,
+    results: multiprocessing.Queue,
+    concurrency: int,
+    api_options: dict,
+) -> WorkerStats:
+    start: float = time.perf_counter()
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+    errors: int = 0
+
+    async def run(certificate: Certificate) -> None:
+        nonlocal errors
+        async with semaphore:
+            result: FleetResult = await _run_account(
+                worker, certificate, task, registry, api_options
+            )
+        if result.error_type:
+            errors += 1
+        results.put(_encode(result))
+
+    async with SessionRegistry() as registry:
+        await asyncio.gather(*map(run, certificates))
+    return WorkerStats(
+        worker=worker,
+        pid=os.getpid(),
+        accounts=len(certificates),
+        errors=errors,
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def _run_worker(
+    worker: int,
+    certificates: list[Certificate],
+    task: FleetTask,
+    results: multiprocessing.Queue,
+    concurrency: int,
+    api_options: dict,
+) -> None:
+    stats: WorkerStats = asyncio.run(
+        _run_shard(worker, certificates, task, results, concurrency, api_options)
+    )
+    results.put(pickle.dumps(stats, pickle.HIGHEST_PROTOCOL))
+
+
+class FleetRunner:
+    def __init__(
+        self,
+        certificates: Iterable[Certificate],
+        task: FleetTask,
+        workers: int = None,
+        concurrency: int = DEFAULT_WORKER_CONCURRENCY,
+        context: multiprocessing.context.BaseContext = None,
+        **api_options,
+    ):
+        self.certificates: list[Certificate] = list(certificates)
+        self.task = task
+        self.workers = max(
+            1, min(workers or os.cpu_count() or 1, len(self.certificates))
+        )
+        self.concurrency = concurrency
+        self.api_options = api_options
+        self.stats: dict[int, WorkerStats] = {}
+        self._context = context or multiprocessing.get_context()
+
+    def get_shards(self) -> list[list[Certificate]]:
+        return [
+            self.certificates[index :: self.workers] for index in range(self.workers)
+        ]
+
+    def run(self) -> Iterator[FleetResult]:
+        return self._run(threading.Event())
+
+    def _run(self, stop: threading.Event) -> Iterator[FleetResult]:
+        if not self.certificates:
+            return
+        results: multiprocessing.Queue = self._context.Queue()
+        shards: dict[int, list[Certificate]] = dict(enumerate(self.get_shards()))
+        pending: dict[int, list[str]] = {
+            worker: [certificate.fingerprint for certificate in shard]
+            for worker, shard in shards.items()
+        }
+        processes: dict[int, multiprocessing.Process] = {
+            worker: self._context.Process(
+                target=_run_worker,
+                args=(
+                    worker,
+                    shard,
+                    self.task,
+                    results,
+                    self.concurrency,
+                    self.api_options,
+                ),
+                daemon=True,
+            )
+            for worker, shard in shards.items()
+        }
+        self.stats = {}
+        for process in processes.values():
+            process.start()
+        try:
+            while len(self.stats) < len(processes) and not stop.is_set():
+                try:
+                    message: Any = pickle.loads(results.get(timeout=POLL_INTERVAL))
+                except queue.Empty:
+                    yield from self._check_processes(processes, pending)
+                    continue
+                if isinstance(message, WorkerStats):
+                    message.exit_code = 0
+                    self.stats[message.worker] = message
+                elif message.worker in pending:
+                    pending[message.worker].remove(message.fingerprint)
+                    yield message
+        finally:
+            for process in processes.values():
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+    def _check_processes(
+        self,
+        processes: dict[int, multiprocessing.Process],
+        pending: dict[int, list[str]],
+    ) -> Iterator[FleetResult]:
+        for worker, process in processes.items():
+            if worker in self.stats or process.is_alive() or process.exitcode == 0:
+                continue
+            exception: FleetWorkerException = FleetWorkerException(
+                f"Worker {worker} exited with code {process.exitcode}"
+            )
+            self.stats[worker] = WorkerStats(
+                worker=worker,
+                pid=process.pid,
+                accounts=0,
+                errors=len(pending[worker]),
+                elapsed=0,
+                exit_code=process.exitcode,
+            )
+            for fingerprint in pending.pop(worker):
+                yield FleetResult(
+                    worker=worker,
+                    fingerprint=fingerprint,
+                    error=str(exception),
+                    error_type=type(exception).__name__,
+                    elapsed=0,
+                )
+
+    async def run_async(self) -> AsyncIterator[FleetResult]:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        stop: threading.Event = threading.Event()
+        results: Iterator[FleetResult] = self._run(stop)
+        sentinel: object = object()
+        request: Optional[asyncio.Future] = None
+        try:
+            while True:
+                request = loop.run_in_executor(None, next, results, sentinel)
+                result: Any = await asyncio.shield(request)
+                if result is sentinel:
+                    return
+                yield result
+        finally:
+            stop.set()
+            if request and not request.done():
+                await asyncio.wait([request])
+            await loop.run_in_executor(None, results.close)
@@ -0,0 +1,60 @@
+from typing import Any, Optional, Type
+from pydantic import BaseModel, PrivateAttr
+
+
+def get_intern_key(model: Type[BaseModel]) -> Optional[str]:
+    return getattr(model.__config__, "intern_key", None)
+
+
+def is_intern_shared(model: Type[BaseModel]) -> bool:
+    return getattr(getattr(model, "__config__", None), "intern_shared", False)
+
+
+class InternedModel(BaseModel):
+    _interned: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._interned and name in self.__fields__:
+            raise TypeError(
+                f'"{type(self).__name__}" is interned and does not support item assignment'
+            )
+        super().__setattr__(name, value)
+
+    def copy(self, **kwargs) -> "InternedModel":
+        copied: InternedModel = super().copy(**kwargs)
+        object.__setattr__(copied, "_interned", False)
+        return copied
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        object.__setattr__(self, "_interned", False)
+
+
+class InternPool:
+    def __init__(self, shared: dict[Type[BaseModel], dict[Any, BaseModel]] = None):
+        self._entries: dict[Type[BaseModel], dict[Any, BaseModel]] = {}
+        self._shared = shared
+
+    def __len__(self) -> int:
+        return sum(map(len, self._entries.values()))
+
+    def get_entries(self, model: Type[BaseModel]) -> dict[Any, BaseModel]:
+        entries: Optional[dict[Any, BaseModel]] = self._entries.get(model)
+        if entries is None:
+            if self._shared is not None and is_intern_shared(model):
+                entries = self._shared.setdefault(model, {})
+            else:
+                entries = {}
+            self._entries[model] = entries
+        return entries
+
+    def get(self, model: Type[BaseModel], key: Any) -> Optional[BaseModel]:
+        return self.get_entries(model).get(key)
+
+    def add(self, model: Type[BaseModel], key: Any, instance: BaseModel) -> None:
+        if hasattr(instance, "_interned"):
+            object.__setattr__(instance, "_interned", True)
+        self.get_entries(model)[key] = instance
+
+    def clear(self) -> None:
+        self._entries.clear()
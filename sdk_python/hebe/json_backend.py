@@ -0,0 +1,38 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONBackend:
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any], bytes],
+    ):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+
+STDLIB_BACKEND: JSONBackend = JSONBackend(
+    "json", json.loads, lambda obj: json.dumps(obj).encode("utf-8")
+)
+ORJSON_BACKEND: Optional[JSONBackend] = (
+    JSONBackend("orjson", orjson.loads, orjson.dumps) if orjson else None
+)
+
+_backend: JSONBackend = ORJSON_BACKEND or STDLIB_BACKEND
+
+
+def get_json_backend() -> JSONBackend:
+    return _backend
+
+
+def set_json_backend(backend: JSONBackend) -> None:
+    global _backend
+    _backend = backend
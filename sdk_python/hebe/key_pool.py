@@ -0,0 +1,113 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import Executor
+from typing import Callable, Optional
+from uonet_request_signer_hebe import generate_key_pair
+
+DEFAULT_KEY_POOL_DEPTH: int = 8
+PUT_TIMEOUT: float = 0.5
+
+KeyPair = tuple[str, str, str]
+
+
+class KeyPairPool:
+    def __init__(
+        self,
+        depth: int = DEFAULT_KEY_POOL_DEPTH,
+        executor: Executor = None,
+        generate: Callable[[], KeyPair] = generate_key_pair,
+    ):
+        self.depth = depth
+        self._executor = executor
+        self._generate = generate
+        self._queue: queue.Queue[KeyPair] = queue.Queue(maxsize=depth)
+        self._slots: threading.Semaphore = threading.Semaphore(depth)
+        self._closed: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[Exception] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread or self._closed.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._fill, name="KeyPairPool", daemon=True
+            )
+            self._thread.start()
+
+    def _generate_key_pair(self) -> KeyPair:
+        if self._executor:
+            return self._executor.submit(self._generate).result()
+        return self._generate()
+
+    def _fill(self) -> None:
+        while not self._closed.is_set():
+            if not self._slots.acquire(timeout=PUT_TIMEOUT):
+                continue
+            if self._closed.is_set():
+                return
+            try:
+                key_pair: KeyPair = self._generate_key_pair()
+            except Exception as error:
+                self._slots.release()
+                with self._lock:
+                    self._error = error
+                    if self._thread is threading.current_thread():
+                        self._thread = None
+                return
+            self._queue.put_nowait(key_pair)
+
+    def _take(self) -> KeyPair:
+        key_pair: KeyPair = self._queue.get_nowait()
+        self._slots.release()
+        return key_pair
+
+    def _raise_error(self) -> None:
+        with self._lock:
+            error: Optional[Exception] = self._error
+            self._error = None
+        if error:
+            raise error
+
+    def _take_or_start(self) -> Optional[KeyPair]:
+        if self._closed.is_set():
+            return None
+        try:
+            return self._take()
+        except queue.Empty:
+            self._raise_error()
+            self.start()
+            return None
+
+    def get(self) -> KeyPair:
+        key_pair: Optional[KeyPair] = self._take_or_start()
+        return key_pair or self._generate_key_pair()
+
+    async def get_async(self) -> KeyPair:
+        key_pair: Optional[KeyPair] = self._take_or_start()
+        if key_pair:
+            return key_pair
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._generate_key_pair
+        )
+
+    def close(self) -> None:
+        self._closed.set()
+        self._slots.release()
+        with self._lock:
+            thread: Optional[threading.Thread] = self._thread
+            self._thread = None
+        if thread:
+            thread.join()
+
+    def __enter__(self) -> "KeyPairPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
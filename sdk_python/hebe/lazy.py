@@ -0,0 +1,136 @@
+from datetime import date
+from typing import Any, Callable, Iterable, Optional, Type
+from pydantic import BaseModel
+
+from sdk_python.hebe.converters import (
+    DefaultFactory,
+    ModelConverter,
+    get_default,
+    get_field_converter,
+)
+from sdk_python.hebe.interning import InternPool, get_intern_key
+from sdk_python.hebe.parsing import get_parser
+from sdk_python.hebe.timestamps import to_date, to_datetime
+
+LazyField = tuple[str, Optional[Callable], bool, Any, Optional[DefaultFactory]]
+
+
+def _convert_date(value: Any) -> Any:
+    return date.fromisoformat(value) if isinstance(value, str) else to_date(value)
+
+
+def _get_model_converter(model: Type[BaseModel]) -> ModelConverter:
+    lazy_model: Type[LazyModel] = get_lazy_model(model)
+    return lambda value, pool: (
+        value
+        if isinstance(value, (BaseModel, LazyModel))
+        else lazy_model.parse(value, pool)
+    )
+
+
+class LazyModel:
+    __model__: Type[BaseModel]
+    __lazy_fields__: dict[str, LazyField]
+    __intern_key__: Optional[str]
+    _interned: bool = False
+
+    def __init__(self, raw: dict, pool: InternPool = None):
+        self._raw = raw
+        self._pool = pool
+        self._values: Optional[dict] = None
+
+    @classmethod
+    def parse(cls, raw: dict, pool: InternPool = None) -> "LazyModel":
+        if pool is None or not cls.__intern_key__:
+            return cls(raw, pool)
+        key: Any = raw.get(cls.__intern_key__)
+        if key is None:
+            return cls(raw, pool)
+        instance: Optional[LazyModel] = pool.get(cls, key)
+        if instance is None:
+            instance = cls(raw, pool)
+            pool.add(cls, key, instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            alias, converter, pooled, default, factory = self.__lazy_fields__[name]
+        except KeyError:
+            raise AttributeError(name)
+        values: dict = self._raw if alias in self._raw else self._get_values()
+        if alias in values:
+            value: Any = values[alias]
+        else:
+            value = factory() if factory else default
+        if converter and value is not None:
+            value = converter(value, self._pool) if pooled else converter(value)
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._interned and name in self.__lazy_fields__:
+            raise TypeError(
+                f'"{type(self).__name__}" is interned and does not support item assignment'
+            )
+        object.__setattr__(self, name, value)
+
+    def _get_values(self) -> dict:
+        if self._values is None:
+            values: dict = dict(self._raw)
+            for validator in self.__model__.__pre_root_validators__:
+                values = validator(self.__model__, values)
+            self._values = values
+        return self._values
+
+    def __reduce__(self):
+        return _restore, (self.__model__, self._raw)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._raw!r})"
+
+    def materialize(self) -> BaseModel:
+        return get_parser(self.__model__).parse(self._raw, self._pool)
+
+
+def _restore(model: Type[BaseModel], raw: dict) -> LazyModel:
+    return get_lazy_model(model)(raw)
+
+
+_lazy_models: dict[Type[BaseModel], Type[LazyModel]] = {}
+
+
+def get_lazy_model(model: Type[BaseModel]) -> Type[LazyModel]:
+    lazy_model: Optional[Type[LazyModel]] = _lazy_models.get(model)
+    if lazy_model:
+        return lazy_model
+    lazy_model = _lazy_models[model] = type(
+        f"Lazy{model.__name__}",
+        (LazyModel,),
+        {
+            "__module__": __name__,
+            "__model__": model,
+            "__lazy_fields__": {},
+            "__intern_key__": get_intern_key(model),
+        },
+    )
+    lazy_model.__lazy_fields__.update(
+        (
+            name,
+            (
+                field.alias,
+                *get_field_converter(
+                    field, _get_model_converter, _convert_date, to_datetime
+                ),
+                *get_default(field),
+            ),
+        )
+        for name, field in model.__fields__.items()
+    )
+    return lazy_model
+
+
+def parse_lazy(
+    model: Type[BaseModel], items: Iterable[dict], pool: InternPool = None
+) -> list[LazyModel]:
+    lazy_model: Type[LazyModel] = get_lazy_model(model)
+    return [lazy_model.parse(item, pool) for item in items]
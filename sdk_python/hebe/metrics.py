@@ -0,0 +1,233 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Iterator, Mapping, Optional
+from aiohttp import TraceConfig, web
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+DEFAULT_METRICS_PORT: int = 9464
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4"
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def get_labels(labels: Optional[dict[str, Any]]) -> Labels:
+    if not labels:
+        return ()
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: Labels, extra: tuple[str, str] = None) -> str:
+    if extra:
+        labels = (*labels, extra)
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{key}="{escape_label_value(value)}"' for key, value in labels)
+        + "}"
+    )
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricsSink:
+    def observe(self, name: str, value: float, labels: dict[str, Any] = None) -> None:
+        pass
+
+    def increment(
+        self, name: str, value: float = 1, labels: dict[str, Any] = None
+    ) -> None:
+        pass
+
+    @contextmanager
+    def time(self, name: str, labels: dict[str, Any] = None) -> Iterator[None]:
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, labels)
+
+    def trace_config(self) -> TraceConfig:
+        return create_trace_config(self)
+
+
+NULL_SINK: MetricsSink = MetricsSink()
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.sum: float = 0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry(MetricsSink):
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.histograms: dict[str, dict[Labels, Histogram]] = {}
+        self.counters: dict[str, dict[Labels, float]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def observe(self, name: str, value: float, labels: dict[str, Any] = None) -> None:
+        key: Labels = get_labels(labels)
+        with self._lock:
+            histograms: dict[Labels, Histogram] = self.histograms.setdefault(name, {})
+            histogram: Optional[Histogram] = histograms.get(key)
+            if not histogram:
+                histogram = histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def increment(
+        self, name: str, value: float = 1, labels: dict[str, Any] = None
+    ) -> None:
+        key: Labels = get_labels(labels)
+        with self._lock:
+            counters: dict[Labels, float] = self.counters.setdefault(name, {})
+            counters[key] = counters.get(key, 0) + value
+
+    def clear(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            return self._render()
+
+    def _render(self) -> str:
+        lines: list[str] = []
+        for name, histograms in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in histograms.items():
+                cumulative: int = 0
+                for bound, count in zip(
+                    (*histogram.buckets, float("inf")), histogram.counts
+                ):
+                    cumulative += count
+                    lines.append(
+                        f"{name}_bucket"
+                        f"{format_labels(labels, ('le', format_value(bound)))}"
+                        f" {cumulative}"
+                    )
+                lines.append(
+                    f"{name}_sum{format_labels(labels)} {format_value(histogram.sum)}"
+                )
+                lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+        for name, counters in sorted(self.counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in counters.items():
+                lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def create_app(self) -> web.Application:
+        async def handle(request: web.Request) -> web.Response:
+            return web.Response(
+                body=self.render().encode("utf-8"),
+                headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+            )
+
+        app: web.Application = web.Application()
+        app.router.add_get("/metrics", handle)
+        return app
+
+    async def serve(
+        self, host: str = "127.0.0.1", port: int = DEFAULT_METRICS_PORT
+    ) -> web.AppRunner:
+        runner: web.AppRunner = web.AppRunner(self.create_app())
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner
+
+
+def create_trace_config(sink: MetricsSink) -> TraceConfig:
+    trace_config: TraceConfig = TraceConfig()
+
+    async def on_request_start(session, context, params) -> None:
+        request_context: Any = context.trace_request_ctx
+        endpoint: Optional[str] = (
+            request_context.get("endpoint")
+            if isinstance(request_context, Mapping)
+            else None
+        )
+        context.start = time.perf_counter()
+        context.host = params.url.host
+        context.labels = {"endpoint": endpoint or params.url.path}
+
+    async def on_dns_resolvehost_start(session, context, params) -> None:
+        context.dns_start = time.perf_counter()
+
+    async def on_dns_resolvehost_end(session, context, params) -> None:
+        sink.observe(
+            "hebe_dns_duration_seconds",
+            time.perf_counter() - context.dns_start,
+            {"host": params.host},
+        )
+
+    async def on_connection_create_start(session, context, params) -> None:
+        context.connect_start = time.perf_counter()
+
+    async def on_connection_create_end(session, context, params) -> None:
+        sink.observe(
+            "hebe_connect_duration_seconds",
+            time.perf_counter() - context.connect_start,
+            {"host": context.host},
+        )
+
+    async def on_request_chunk_sent(session, context, params) -> None:
+        sink.increment("hebe_request_bytes_total", len(params.chunk), context.labels)
+
+    async def on_request_end(session, context, params) -> None:
+        sink.observe(
+            "hebe_time_to_first_byte_seconds",
+            time.perf_counter() - context.start,
+            context.labels,
+        )
+
+    async def on_response_chunk_received(session, context, params) -> None:
+        sink.increment("hebe_response_bytes_total", len(params.chunk), context.labels)
+
+    async def on_request_exception(session, context, params) -> None:
+        sink.increment(
+            "hebe_network_errors_total",
+            labels={**context.labels, "error": type(params.exception).__name__},
+        )
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_response_chunk_received.append(on_response_chunk_received)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
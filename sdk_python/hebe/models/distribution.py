@@ -1,10 +1,15 @@
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from sdk_python.hebe.interning import InternedModel
 
-class Distribution(BaseModel):
+
+class Distribution(InternedModel):
     id: int = Field(alias="Id")
     key: UUID = Field(alias="Key")
     short: str = Field(alias="Shortcut")
     name: str = Field(alias="Name")
     part_type: str = Field(alias="PartType")
+
+    class Config:
+        intern_key = "Id"
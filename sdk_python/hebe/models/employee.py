@@ -1,8 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from sdk_python.hebe.interning import InternedModel
 
-class Employee(BaseModel):
+
+class Employee(InternedModel):
     id: int = Field(alias="Id")
     name: str = Field(alias="Name")
     last_name: str = Field(alias="Surname")
     full_name: str = Field(alias="DisplayName")
+
+    class Config:
+        intern_key = "Id"
@@ -1,13 +1,14 @@
 from pydantic import BaseModel, Field
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 import uuid
 from datetime import datetime, timezone
-from uonet_request_signer_hebe import get_signature_values
+from functools import lru_cache
 
 APPLICATION_NAME: str = "DzienniczekPlus 2.0"
 APPLICATION_VERSION: str = "1.4.2"
 API_VERSION: int = 1
 USER_AGENT = "Dart/2.10 (dart:io)"
+HEADERS_TEMPLATES_CACHE_SIZE: int = 256
 
 
 class RequestPayload(BaseModel):
@@ -15,7 +16,9 @@ class RequestPayload(BaseModel):
     application_version: str = Field(default=APPLICATION_VERSION, alias="AppVersion")
     envelope: Any = Field(alias="Envelope")
     api: int = Field(default=API_VERSION, alias="API")
-    request_id: str = Field(alias="RequestId", default=str(uuid.uuid4()))
+    request_id: str = Field(
+        alias="RequestId", default_factory=lambda: str(uuid.uuid4())
+    )
     timestamp: str = Field(alias="Timestamp")
     timestamp_formatted: str = Field(alias="TimestampFormatted")
     firebase_token: Optional[str] = Field(alias="FirebaseToken")
@@ -30,6 +33,9 @@ class RequestPayload(BaseModel):
             firebase_token=firebase_token,
         )
 
+    def serialize(self, dumps: Callable[[Any], bytes]) -> bytes:
+        return dumps(self.dict(by_alias=True, exclude_none=True))
+
     class Config:
         allow_population_by_field_name = True
 
@@ -46,11 +52,50 @@ class RequestHeaders(BaseModel):
     content_type: Optional[str] = Field(alias="ContentType")
 
     @staticmethod
-    def build(certificate, url: str, payload: Any = None):
+    def build(certificate, url: str, payload: Any = None) -> "RequestHeaders":
+        now: datetime = datetime.now(timezone.utc)
+        return RequestHeaders._from_signature(
+            certificate, now, certificate.signer.sign(url, payload, now)
+        )
+
+    @staticmethod
+    async def build_async(
+        certificate, url: str, payload: Any = None
+    ) -> "RequestHeaders":
         now: datetime = datetime.now(timezone.utc)
-        digest, canonical_url, signature = get_signature_values(
-            certificate.fingerprint, certificate.private_key, payload, url, now
+        return RequestHeaders._from_signature(
+            certificate, now, await certificate.signer.sign_async(url, payload, now)
         )
+
+    @staticmethod
+    def render(certificate, now: datetime, signature_values: tuple) -> dict[str, str]:
+        digest, canonical_url, signature = signature_values
+        headers: dict[str, str] = {
+            **get_headers_template(certificate.os, certificate.name),
+            "vDate": now.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+            "vCanonicalUrl": canonical_url,
+            "Signature": signature,
+        }
+        if digest:
+            headers["Digest"] = digest
+            headers["ContentType"] = "application/json"
+            headers["Content-Type"] = "application/json"
+        return headers
+
+    @staticmethod
+    async def render_async(
+        certificate, url: str, body: Optional[bytes] = None
+    ) -> dict[str, str]:
+        now: datetime = datetime.now(timezone.utc)
+        return RequestHeaders.render(
+            certificate, now, await certificate.signer.sign_async(url, body, now)
+        )
+
+    @staticmethod
+    def _from_signature(
+        certificate, now: datetime, signature_values: tuple
+    ) -> "RequestHeaders":
+        digest, canonical_url, signature = signature_values
         return RequestHeaders(
             certificate_os=certificate.os,
             certificate_name=certificate.name,
@@ -63,3 +108,13 @@ class RequestHeaders(BaseModel):
 
     class Config:
         allow_population_by_field_name = True
+
+
+@lru_cache(maxsize=HEADERS_TEMPLATES_CACHE_SIZE)
+def get_headers_template(certificate_os: str, certificate_name: str) -> dict[str, str]:
+    return {
+        "UserAgent": USER_AGENT,
+        "vOS": certificate_os,
+        "vDeviceModel": certificate_name,
+        "vAPI": str(API_VERSION),
+    }
@@ -1,6 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from sdk_python.hebe.interning import InternedModel
 
-class Room(BaseModel):
+
+class Room(InternedModel):
     id: int = Field(alias="Id")
     code: str = Field(alias="Code")
+
+    class Config:
+        intern_key = "Id"
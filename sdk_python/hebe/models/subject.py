@@ -1,8 +1,10 @@
 from uuid import UUID
-from pydantic import BaseModel, Field, root_validator
+from pydantic import Field, root_validator
 
+from sdk_python.hebe.interning import InternedModel
 
-class Subject(BaseModel):
+
+class Subject(InternedModel):
     id: int = Field(alias="Id")
     key: UUID = Field(alias="Key")
     position: int = Field(alias="Position")
@@ -13,3 +15,6 @@ class Subject(BaseModel):
     def root_validator(cls, values):
         values["Key"] = UUID(values["Key"])
         return values
+
+    class Config:
+        intern_key = "Id"
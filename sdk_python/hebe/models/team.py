@@ -1,9 +1,14 @@
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from sdk_python.hebe.interning import InternedModel
 
-class Team(BaseModel):
+
+class Team(InternedModel):
     id: int = Field(alias="Id")
     key: UUID = Field(alias="Key")
     symbol: str = Field(alias="Symbol")
     full_name: str = Field(alias="DisplayName")
+
+    class Config:
+        intern_key = "Id"
@@ -0,0 +1,168 @@
+import random
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional, Type
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_SINGLETON
+
+from sdk_python.hebe.converters import (
+    DefaultFactory,
+    ModelConverter,
+    get_default,
+    get_field_converter,
+    is_model,
+)
+from sdk_python.hebe.interning import InternPool, get_intern_key, is_intern_shared
+from sdk_python.hebe.timestamps import convert_timestamps, get_timestamp_fields
+
+ParsedField = tuple[str, str, Optional[Callable], bool, Any]
+DefaultField = tuple[str, str, DefaultFactory]
+
+
+def _convert_date(value: Any) -> Any:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _get_model_converter(model: Type[BaseModel]) -> ModelConverter:
+    parser: ModelParser = get_parser(model)
+    return lambda value, pool: (
+        value if isinstance(value, BaseModel) else parser.parse(value, pool)
+    )
+
+
+class ModelParser:
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self._pre_validators: list[Callable] = list(model.__pre_root_validators__)
+        self._intern_key: Optional[str] = get_intern_key(model)
+        self._fields: Optional[list[ParsedField]] = None
+        self._default_factories: list[DefaultField] = []
+
+    def _get_fields(self) -> list[ParsedField]:
+        if self._fields is None:
+            fields: list[ParsedField] = []
+            for name, field in self.model.__fields__.items():
+                default, factory = get_default(field)
+                fields.append(
+                    (
+                        name,
+                        field.alias,
+                        *get_field_converter(
+                            field, _get_model_converter, _convert_date, None
+                        ),
+                        default,
+                    )
+                )
+                if factory:
+                    self._default_factories.append((name, field.alias, factory))
+            self._fields = fields
+        return self._fields
+
+    def parse(self, item: dict, pool: InternPool = None) -> BaseModel:
+        if pool is None or not self._intern_key:
+            return self._parse(item, pool)
+        key: Any = item.get(self._intern_key)
+        if key is None:
+            return self._parse(item, pool)
+        instance: Optional[BaseModel] = pool.get(self.model, key)
+        if instance is None:
+            instance = self._parse(item, pool)
+            pool.add(self.model, key, instance)
+        return instance
+
+    def _parse(self, item: dict, pool: Optional[InternPool]) -> BaseModel:
+        values: dict = dict(item)
+        for validator in self._pre_validators:
+            values = validator(self.model, values)
+        fields: dict[str, Any] = {}
+        for name, alias, converter, pooled, default in self._get_fields():
+            value: Any = values.get(alias, default)
+            if converter and value is not None:
+                value = converter(value, pool) if pooled else converter(value)
+            fields[name] = value
+        for name, alias, factory in self._default_factories:
+            if alias not in values:
+                fields[name] = factory()
+        instance: BaseModel = self.model.__new__(self.model)
+        object.__setattr__(instance, "__dict__", fields)
+        object.__setattr__(instance, "__fields_set__", set(fields))
+        instance._init_private_attributes()
+        return instance
+
+
+_parsers: dict[Type[BaseModel], ModelParser] = {}
+_shared_fields: dict[Type[BaseModel], dict[str, Type[BaseModel]]] = {}
+
+
+def get_parser(model: Type[BaseModel]) -> ModelParser:
+    parser: Optional[ModelParser] = _parsers.get(model)
+    if not parser:
+        parser = _parsers[model] = ModelParser(model)
+    return parser
+
+
+def get_shared_fields(model: Type[BaseModel]) -> dict[str, Type[BaseModel]]:
+    fields: Optional[dict[str, Type[BaseModel]]] = _shared_fields.get(model)
+    if fields is None:
+        fields = _shared_fields[model] = {
+            field.alias: field.type_
+            for field in model.__fields__.values()
+            if field.shape == SHAPE_SINGLETON
+            and is_model(field.type_)
+            and is_intern_shared(field.type_)
+            and get_intern_key(field.type_)
+        }
+    return fields
+
+
+def get_interned(model: Type[BaseModel], item: dict, pool: InternPool) -> BaseModel:
+    key: Any = item.get(get_intern_key(model))
+    if key is None:
+        return model.parse_obj(item)
+    instance: Optional[BaseModel] = pool.get(model, key)
+    if instance is None:
+        instance = model.parse_obj(item)
+        pool.add(model, key, instance)
+    return instance
+
+
+def intern_shared_fields(
+    items: list[dict], fields: dict[str, Type[BaseModel]], pool: InternPool
+) -> None:
+    for item in items:
+        for alias, type_ in fields.items():
+            value: Any = item.get(alias)
+            if isinstance(value, dict):
+                item[alias] = get_interned(type_, value, pool)
+
+
+def parse_many(
+    model: Type[BaseModel],
+    items: Iterable[dict],
+    trusted: bool = False,
+    validation_sample_rate: float = 0,
+    pool: InternPool = None,
+) -> list[Any]:
+    timestamp_fields: dict[str, type] = get_timestamp_fields(model)
+    shared_fields: dict[str, Type[BaseModel]] = (
+        {} if trusted else get_shared_fields(model)
+    )
+    if timestamp_fields or shared_fields:
+        items = [dict(item) for item in items]
+    else:
+        items = list(items)
+    convert_timestamps(items, timestamp_fields)
+    pool = pool if pool is not None else InternPool()
+    if not trusted:
+        intern_shared_fields(items, shared_fields, pool)
+        if is_intern_shared(model) and get_intern_key(model):
+            return [get_interned(model, item, pool) for item in items]
+        return list(map(model.parse_obj, items))
+    parser: ModelParser = get_parser(model)
+    return [
+        (
+            model.parse_obj(item)
+            if validation_sample_rate and random.random() < validation_sample_rate
+            else parser.parse(item, pool)
+        )
+        for item in items
+    ]
@@ -0,0 +1,134 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional
+
+from sdk_python.hebe.error import FailedRequestException
+
+DEFAULT_ATTEMPTS: int = 3
+DEFAULT_BACKOFF: float = 0.1
+DEFAULT_MAX_BACKOFF: float = 2.0
+DEFAULT_HEDGE_PERCENTILE: float = 0.95
+DEFAULT_LATENCY_WINDOW: int = 200
+DEFAULT_MIN_SAMPLES: int = 20
+
+
+class RetryBudget:
+    def __init__(
+        self, ratio: float = 0.1, min_tokens: float = 10, max_tokens: float = 100
+    ):
+        self.ratio = ratio
+        self.min_tokens = min_tokens
+        self.max_tokens = max_tokens
+        self._tokens: float = min_tokens
+
+    def deposit(self) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class LatencyTracker:
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        samples: list[float] = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percentile))]
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        attempts: int = DEFAULT_ATTEMPTS,
+        timeout: float = None,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        budget: RetryBudget = None,
+        hedge: bool = False,
+        hedge_delay: float = None,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+    ):
+        self.attempts = attempts
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.budget = budget or RetryBudget()
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.latency = LatencyTracker()
+
+    def get_backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    def get_hedge_delay(self) -> Optional[float]:
+        if not self.hedge:
+            return None
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        if len(self.latency) < self.min_samples:
+            return None
+        return self.latency.percentile(self.hedge_percentile)
+
+    async def run(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        self.budget.deposit()
+        attempt: int = 0
+        while True:
+            try:
+                return await self._send_hedged(send)
+            except FailedRequestException:
+                attempt += 1
+                if attempt >= self.attempts or not self.budget.withdraw():
+                    raise
+            await asyncio.sleep(self.get_backoff(attempt))
+
+    async def _send(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        start: float = time.monotonic()
+        try:
+            result: Any = await asyncio.wait_for(send(), self.timeout)
+        except asyncio.TimeoutError:
+            self.latency.add(
+                self.timeout if self.timeout is not None else time.monotonic() - start
+            )
+            raise FailedRequestException()
+        self.latency.add(time.monotonic() - start)
+        return result
+
+    async def _send_hedged(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        hedge_delay: Optional[float] = self.get_hedge_delay()
+        if hedge_delay is None:
+            return await self._send(send)
+        pending: set[asyncio.Task] = {asyncio.ensure_future(self._send(send))}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+            if done or not self.budget.withdraw():
+                return await next(iter(pending))
+            pending.add(asyncio.ensure_future(self._send(send)))
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if not isinstance(task.exception(), FailedRequestException):
+                        return task.result()
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
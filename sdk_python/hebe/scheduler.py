@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from sdk_python.hebe.session import get_host_key
+
+DEFAULT_CONCURRENCY: int = 10
+DEFAULT_RATE: float = 0
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self._tokens: float = self.burst
+        self._updated: float = time.monotonic()
+
+    def _refill(self) -> None:
+        now: float = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def get_delay(self) -> float:
+        if not self.rate:
+            return 0
+        self._refill()
+        if self._tokens >= 1:
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    def consume(self) -> None:
+        if self.rate:
+            self._tokens -= 1
+
+
+class HostScheduler:
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate: float = DEFAULT_RATE,
+        burst: float = None,
+    ):
+        self.concurrency = concurrency
+        self._bucket: TokenBucket = TokenBucket(rate, burst)
+        self._queues: dict[Any, deque[asyncio.Future]] = {}
+        self._active: int = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return sum(map(len, self._queues.values()))
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._queues and self._active < self.concurrency:
+            delay: float = self._bucket.get_delay()
+            if delay:
+                if not self._timer:
+                    self._timer = asyncio.get_running_loop().call_later(
+                        delay, self._on_timer
+                    )
+                return
+            account: Any = next(iter(self._queues))
+            queue: deque[asyncio.Future] = self._queues.pop(account)
+            waiter: asyncio.Future = queue.popleft()
+            if queue:
+                self._queues[account] = queue
+            if waiter.done():
+                continue
+            self._bucket.consume()
+            self._active += 1
+            waiter.set_result(None)
+
+    async def acquire(self, account: Any = None) -> None:
+        waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(account, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._remove(account, waiter)
+            raise
+
+    def _remove(self, account: Any, waiter: asyncio.Future) -> None:
+        queue: Optional[deque[asyncio.Future]] = self._queues.get(account)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        if not queue:
+            del self._queues[account]
+
+    def release(self) -> None:
+        self._active -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, account: Any = None) -> AsyncIterator[None]:
+        await self.acquire(account)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class RequestScheduler:
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate: float = DEFAULT_RATE,
+        burst: float = None,
+    ):
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self._hosts: dict[str, HostScheduler] = {}
+
+    def configure(
+        self, url: str, concurrency: int = None, rate: float = None, burst: float = None
+    ) -> HostScheduler:
+        scheduler: HostScheduler = HostScheduler(
+            concurrency or self.concurrency,
+            self.rate if rate is None else rate,
+            burst or self.burst,
+        )
+        self._hosts[get_host_key(url)] = scheduler
+        return scheduler
+
+    def get(self, url: str) -> HostScheduler:
+        scheduler: Optional[HostScheduler] = self._hosts.get(get_host_key(url))
+        return scheduler or self.configure(url)
+
+    def slot(self, url: str, account: Any = None):
+        return self.get(url).slot(account)
@@ -0,0 +1,119 @@
+import asyncio
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
+
+DEFAULT_LIMIT: int = 100
+DEFAULT_LIMIT_PER_HOST: int = 0
+DEFAULT_KEEPALIVE_TIMEOUT: float = 30
+DEFAULT_DNS_CACHE_TTL: int = 300
+DEFAULT_TIMEOUT: float = 60
+
+
+def get_host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class SessionRegistry:
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+        close_idle: bool = False,
+        trace_configs: Iterable[TraceConfig] = None,
+    ):
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._timeout = timeout
+        self._close_idle = close_idle
+        self._trace_configs: list[TraceConfig] = list(trace_configs or ())
+        self._sessions: dict[str, ClientSession] = {}
+        self._references: dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create_session(self) -> ClientSession:
+        connector: TCPConnector = TCPConnector(
+            limit=self._limit,
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            ttl_dns_cache=self._dns_cache_ttl,
+            use_dns_cache=True,
+        )
+        return ClientSession(
+            connector=connector,
+            timeout=ClientTimeout(total=self._timeout),
+            trace_configs=self._trace_configs or None,
+        )
+
+    async def _check_loop(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        previous_loop: Optional[asyncio.AbstractEventLoop] = self._loop
+        sessions: list[ClientSession] = list(self._sessions.values())
+        self._loop = loop
+        self._sessions.clear()
+        self._references.clear()
+        for session in sessions:
+            await self._close_foreign(previous_loop, session)
+
+    @staticmethod
+    async def _close_foreign(
+        loop: asyncio.AbstractEventLoop, session: ClientSession
+    ) -> None:
+        if session.closed:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        try:
+            await session.close()
+        except RuntimeError:
+            pass
+
+    async def acquire(self, url: str) -> ClientSession:
+        await self._check_loop()
+        key: str = get_host_key(url)
+        session: Optional[ClientSession] = self._sessions.get(key)
+        if not session or session.closed:
+            session = self._create_session()
+            self._sessions[key] = session
+            self._references[key] = 0
+        self._references[key] += 1
+        return session
+
+    async def release(self, url: str, session: ClientSession = None) -> None:
+        await self._check_loop()
+        key: str = get_host_key(url)
+        if key not in self._references:
+            return
+        if session is not None and self._sessions.get(key) is not session:
+            return
+        self._references[key] -= 1
+        if self._references[key] > 0 or not self._close_idle:
+            return
+        del self._references[key]
+        await self._sessions.pop(key).close()
+
+    async def close(self) -> None:
+        await self._check_loop()
+        sessions: list[ClientSession] = list(self._sessions.values())
+        self._sessions.clear()
+        self._references.clear()
+        for session in sessions:
+            await session.close()
+
+    async def __aenter__(self) -> "SessionRegistry":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+
+default_session_registry: SessionRegistry = SessionRegistry()
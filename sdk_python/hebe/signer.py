@@ -0,0 +1,84 @@
+import asyncio
+import base64
+import hashlib
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, Union
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+from uonet_request_signer_hebe.signer import get_encoded_path, get_headers_list
+
+PRIVATE_KEYS_CACHE_SIZE: int = 1024
+
+
+@lru_cache(maxsize=PRIVATE_KEYS_CACHE_SIZE)
+def load_private_key(private_key: str):
+    return serialization.load_der_private_key(
+        base64.b64decode(private_key), password=None
+    )
+
+
+def get_digest(body: Union[str, bytes, None]) -> Optional[str]:
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return base64.b64encode(hashlib.sha256(body).digest()).decode("utf-8")
+
+
+def sign(
+    fingerprint: str,
+    private_key: str,
+    url: str,
+    body: Union[str, bytes, None],
+    now: datetime,
+) -> tuple[Optional[str], str, str]:
+    canonical_url: str = get_encoded_path(url)
+    digest: Optional[str] = get_digest(body)
+    headers, values = get_headers_list(body, digest, canonical_url, now)
+    signature: bytes = load_private_key(private_key).sign(
+        values.encode("utf-8"), padding.PKCS1v15(), hashes.SHA256()
+    )
+    return (
+        f"SHA-256={digest}" if digest else None,
+        canonical_url,
+        f'keyId="{fingerprint}",headers="{headers}",algorithm="sha256withrsa",'
+        f"signature=Base64(SHA256withRSA({base64.b64encode(signature).decode()}))",
+    )
+
+
+class Signer:
+    def __init__(self, fingerprint: str, private_key: str, executor: Executor = None):
+        self.fingerprint = fingerprint
+        self.private_key = private_key
+        self.executor = executor
+
+    def sign(
+        self, url: str, body: Union[str, bytes, None] = None, now: datetime = None
+    ) -> tuple[Optional[str], str, str]:
+        return sign(
+            self.fingerprint,
+            self.private_key,
+            url,
+            body,
+            now or datetime.now(timezone.utc),
+        )
+
+    async def sign_async(
+        self, url: str, body: Union[str, bytes, None] = None, now: datetime = None
+    ) -> tuple[Optional[str], str, str]:
+        if not self.executor:
+            return self.sign(url, body, now)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            sign,
+            self.fingerprint,
+            self.private_key,
+            url,
+            body,
+            now or datetime.now(timezone.utc),
+        )
+
+    def __getstate__(self) -> dict:
+        return {**self.__dict__, "executor": None}
@@ -0,0 +1,196 @@
+from typing import Any, Iterable, Optional
+from pydantic import BaseModel
+
+from sdk_python.hebe.sync import SyncResult
+
+Contribution = tuple[int, float, float, float, float, int, int]
+GradeKey = tuple[int, bool, int]
+
+
+class GradeStats(BaseModel):
+    count: int
+    weight_total: float
+    average: Optional[float]
+    points: float
+    points_total: float
+    points_percentage: Optional[float]
+
+
+def get_contribution(grade: Any) -> Contribution:
+    weight: float = grade.column.weight or 0
+    counted: bool = grade.value is not None and weight > 0
+    has_points: bool = grade.nominator is not None and grade.denominator is not None
+    return (
+        1,
+        grade.value * weight if counted else 0,
+        weight if counted else 0,
+        grade.nominator if has_points else 0,
+        grade.denominator if has_points else 0,
+        1 if counted else 0,
+        1 if has_points else 0,
+    )
+
+
+class StatisticsAccumulator:
+    def __init__(self):
+        self.count: int = 0
+        self.weighted_sum: float = 0
+        self.weight_total: float = 0
+        self.points: float = 0
+        self.points_total: float = 0
+        self.averaged: int = 0
+        self.pointed: int = 0
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    def add(self, contribution: Contribution, sign: int = 1) -> None:
+        count, weighted, weight, points, points_total, averaged, pointed = contribution
+        self.count += sign * count
+        self.weighted_sum += sign * weighted
+        self.weight_total += sign * weight
+        self.points += sign * points
+        self.points_total += sign * points_total
+        self.averaged += sign * averaged
+        self.pointed += sign * pointed
+        if not self.averaged:
+            self.weighted_sum = self.weight_total = 0
+        if not self.pointed:
+            self.points = self.points_total = 0
+
+    def remove(self, contribution: Contribution) -> None:
+        self.add(contribution, -1)
+
+    def merge(self, other: "StatisticsAccumulator") -> None:
+        self.add(
+            (
+                other.count,
+                other.weighted_sum,
+                other.weight_total,
+                other.points,
+                other.points_total,
+                other.averaged,
+                other.pointed,
+            )
+        )
+
+    def get_stats(self) -> GradeStats:
+        return GradeStats(
+            count=self.count,
+            weight_total=self.weight_total,
+            average=(
+                self.weighted_sum / self.weight_total if self.weight_total else None
+            ),
+            points=self.points,
+            points_total=self.points_total,
+            points_percentage=(
+                self.points / self.points_total * 100 if self.points_total else None
+            ),
+        )
+
+
+class GradeStatistics:
+    def __init__(self):
+        self._accumulators: dict[tuple[int, int], dict[int, StatisticsAccumulator]] = {}
+        self._grades: dict[GradeKey, tuple[int, int, Contribution]] = {}
+
+    def _add(self, grade: Any, behaviour: bool) -> None:
+        key: GradeKey = (grade.pupil_id, behaviour, grade.id)
+        self._remove(key)
+        period_id: int = grade.column.period_id
+        subject_id: int = grade.column.subject.id
+        contribution: Contribution = get_contribution(grade)
+        accumulators: dict[int, StatisticsAccumulator] = self._accumulators.setdefault(
+            (grade.pupil_id, period_id), {}
+        )
+        accumulators.setdefault(subject_id, StatisticsAccumulator()).add(contribution)
+        self._grades[key] = (period_id, subject_id, contribution)
+
+    def _remove(self, key: GradeKey) -> None:
+        entry: Optional[tuple[int, int, Contribution]] = self._grades.pop(key, None)
+        if not entry:
+            return
+        period_id, subject_id, contribution = entry
+        accumulators: dict[int, StatisticsAccumulator] = self._accumulators[
+            (key[0], period_id)
+        ]
+        accumulator: StatisticsAccumulator = accumulators[subject_id]
+        accumulator.remove(contribution)
+        if not accumulator:
+            del accumulators[subject_id]
+        if not accumulators:
+            del self._accumulators[(key[0], period_id)]
+
+    def apply(
+        self,
+        grades: Iterable[Any] = (),
+        deleted_ids: Iterable[int] = (),
+        pupil_id: int = None,
+        behaviour: bool = False,
+    ) -> None:
+        for grade in grades:
+            self._add(grade, behaviour)
+        if pupil_id is not None:
+            for grade_id in deleted_ids:
+                self._remove((pupil_id, behaviour, grade_id))
+            return
+        deleted: set[int] = set(deleted_ids)
+        if deleted:
+            for key in [
+                key for key in self._grades if key[1] == behaviour and key[2] in deleted
+            ]:
+                self._remove(key)
+
+    def apply_sync(
+        self,
+        result: SyncResult,
+        pupil_id: int,
+        period_id: int = None,
+        behaviour: bool = False,
+    ) -> None:
+        if result.full:
+            self.clear(pupil_id, period_id, behaviour)
+        self.apply(result.updated, result.deleted, pupil_id, behaviour)
+
+    def clear(
+        self, pupil_id: int = None, period_id: int = None, behaviour: bool = None
+    ) -> None:
+        for key, (grade_period_id, _, _) in list(self._grades.items()):
+            if (
+                (pupil_id is None or key[0] == pupil_id)
+                and (period_id is None or grade_period_id == period_id)
+                and (behaviour is None or key[1] == behaviour)
+            ):
+                self._remove(key)
+
+    def get(
+        self, pupil_id: int, period_id: int, subject_id: int
+    ) -> Optional[GradeStats]:
+        accumulator: Optional[StatisticsAccumulator] = self._accumulators.get(
+            (pupil_id, period_id), {}
+        ).get(subject_id)
+        return accumulator.get_stats() if accumulator else None
+
+    def get_by_subject(self, pupil_id: int, period_id: int) -> dict[int, GradeStats]:
+        return {
+            subject_id: accumulator.get_stats()
+            for subject_id, accumulator in self._accumulators.get(
+                (pupil_id, period_id), {}
+            ).items()
+        }
+
+    def get_by_period(self, pupil_id: int, period_id: int) -> Optional[GradeStats]:
+        accumulators: Optional[dict[int, StatisticsAccumulator]] = (
+            self._accumulators.get((pupil_id, period_id))
+        )
+        if not accumulators:
+            return None
+        total: StatisticsAccumulator = StatisticsAccumulator()
+        averages: list[float] = []
+        for accumulator in accumulators.values():
+            total.merge(accumulator)
+            if accumulator.weight_total:
+                averages.append(accumulator.weighted_sum / accumulator.weight_total)
+        stats: GradeStats = total.get_stats()
+        stats.average = sum(averages) / len(averages) if averages else None
+        return stats
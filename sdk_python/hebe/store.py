@@ -0,0 +1,364 @@
+import asyncio
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, Iterable, Optional, Type, Union
+from uuid import UUID
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, ModelField
+
+from sdk_python.hebe.data.exam import Exam
+from sdk_python.hebe.data.grade import Grade, GradesSummary
+from sdk_python.hebe.data.homework import Homework
+from sdk_python.hebe.data.meeting import Meeting
+from sdk_python.hebe.data.note import Note
+from sdk_python.hebe.data.pupil import PupilInfo
+from sdk_python.hebe.data.schedule import ScheduleChange, ScheduleEntry
+from sdk_python.hebe.data.teacher import Teacher
+from sdk_python.hebe.error import StoreVersionException
+from sdk_python.hebe.lazy import LazyModel
+from sdk_python.hebe.sync import SyncResult
+
+STORE_VERSION: int = 1
+
+
+class StoreTable:
+    def __init__(
+        self,
+        name: str,
+        get_id: Callable[[Any], int] = lambda item: item.id,
+        get_period_id: Callable[[Any], Optional[int]] = None,
+        get_date: Callable[[Any], Union[date, datetime, None]] = None,
+    ):
+        self.name = name
+        self.get_id = get_id
+        self.get_period_id = get_period_id
+        self.get_date = get_date
+
+
+TABLES: dict[Type[BaseModel], StoreTable] = {
+    Grade: StoreTable(
+        "grades",
+        get_period_id=lambda grade: grade.column.period_id,
+        get_date=lambda grade: grade.date_modify,
+    ),
+    GradesSummary: StoreTable(
+        "grades_summaries",
+        get_period_id=lambda summary: summary.period_id,
+        get_date=lambda summary: summary.date_modify,
+    ),
+    Exam: StoreTable("exams", get_date=lambda exam: exam.deadline),
+    Homework: StoreTable("homework", get_date=lambda homework: homework.date_),
+    Note: StoreTable("notes", get_date=lambda note: note.date_valid),
+    Meeting: StoreTable("meetings", get_date=lambda meeting: meeting.date),
+    ScheduleEntry: StoreTable("schedule_entries", get_date=lambda entry: entry.date_),
+    ScheduleChange: StoreTable(
+        "schedule_changes", get_date=lambda change: change.lesson_date
+    ),
+    Teacher: StoreTable("teachers"),
+    PupilInfo: StoreTable("pupils", get_id=lambda pupil_info: pupil_info.pupil.id),
+}
+
+
+def _load_value(type_: Any, value: Any) -> Any:
+    if value is None or not isinstance(type_, type):
+        return value
+    if issubclass(type_, BaseModel):
+        return load_model(type_, value)
+    if issubclass(type_, Enum):
+        return type_(value)
+    if issubclass(type_, UUID):
+        return UUID(value)
+    if issubclass(type_, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(type_, date):
+        return date.fromisoformat(value)
+    if issubclass(type_, time):
+        return time.fromisoformat(value)
+    return value
+
+
+def _load_field(field: ModelField, value: Any) -> Any:
+    if value is None:
+        return None if field.required else field.get_default()
+    if field.shape == SHAPE_LIST:
+        return [_load_value(field.type_, item) for item in value]
+    return _load_value(field.type_, value)
+
+
+def load_model(model: Type[BaseModel], data: dict) -> BaseModel:
+    return model.construct(
+        **{
+            name: _load_field(field, data.get(name))
+            for name, field in model.__fields__.items()
+        }
+    )
+
+
+def dump_model(item: Any) -> str:
+    if isinstance(item, LazyModel):
+        item = item.materialize()
+    return item.json()
+
+
+def _get_day(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class Store:
+    def __init__(self, path: str = ":memory:"):
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path, check_same_thread=False
+        )
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version not in (0, STORE_VERSION):
+            self._connection.close()
+            raise StoreVersionException(version)
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connection:
+                for table in TABLES.values():
+                    self._create_table(table.name)
+                self._connection.execute(f"PRAGMA user_version = {STORE_VERSION}")
+        except sqlite3.Error:
+            self._connection.close()
+            raise
+        self._lock: threading.RLock = threading.RLock()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+
+    def _create_table(self, name: str) -> None:
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {name} ("
+            "id INTEGER NOT NULL, "
+            "pupil_id INTEGER NOT NULL, "
+            "kind INTEGER NOT NULL, "
+            "period_id INTEGER, "
+            "date TEXT, "
+            "data TEXT NOT NULL, "
+            "PRIMARY KEY (pupil_id, kind, id))"
+        )
+        self._connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {name}_period "
+            f"ON {name} (pupil_id, kind, period_id)"
+        )
+        self._connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {name}_date ON {name} (pupil_id, kind, date)"
+        )
+        self._connection.execute(f"CREATE INDEX IF NOT EXISTS {name}_id ON {name} (id)")
+
+    @staticmethod
+    def _get_table(model: Type[BaseModel]) -> StoreTable:
+        try:
+            return TABLES[model]
+        except KeyError:
+            raise ValueError(f"{model.__name__} can not be stored")
+
+    @staticmethod
+    def _get_row(
+        table: StoreTable, item: Any, pupil_id: int, kind: int, period_id: int
+    ) -> tuple[int, int, int, Optional[int], Optional[str], str]:
+        if table.get_period_id:
+            period_id = table.get_period_id(item)
+        value: Union[date, datetime, None] = (
+            table.get_date(item) if table.get_date else None
+        )
+        return (
+            table.get_id(item),
+            pupil_id,
+            kind,
+            period_id,
+            value.isoformat() if value else None,
+            dump_model(item),
+        )
+
+    def _upsert(
+        self,
+        table: StoreTable,
+        items: Iterable[Any],
+        pupil_id: int,
+        kind: int,
+        period_id: int,
+    ) -> None:
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO {table.name} VALUES (?, ?, ?, ?, ?, ?)",
+            (self._get_row(table, item, pupil_id, kind, period_id) for item in items),
+        )
+
+    def _delete(
+        self, table: StoreTable, ids: Iterable[int], pupil_id: int, kind: int
+    ) -> None:
+        self._connection.executemany(
+            f"DELETE FROM {table.name} WHERE pupil_id = ? AND kind = ? AND id = ?",
+            ((pupil_id, kind, item_id) for item_id in ids),
+        )
+
+    def _clear(
+        self,
+        table: StoreTable,
+        pupil_id: int,
+        kind: int,
+        period_id: int,
+        date_from: Union[date, datetime] = None,
+        date_to: Union[date, datetime] = None,
+    ) -> None:
+        query, parameters = self._get_filter(
+            kind, pupil_id, period_id, date_from, date_to
+        )
+        self._connection.execute(f"DELETE FROM {table.name}{query}", parameters)
+
+    def upsert(
+        self,
+        model: Type[BaseModel],
+        items: Iterable[Any],
+        pupil_id: int,
+        period_id: int = None,
+        behaviour: bool = False,
+    ) -> None:
+        table: StoreTable = self._get_table(model)
+        with self._lock, self._connection:
+            self._upsert(table, items, pupil_id, int(behaviour), period_id)
+
+    def delete(
+        self,
+        model: Type[BaseModel],
+        ids: Iterable[int],
+        pupil_id: int,
+        behaviour: bool = False,
+    ) -> None:
+        table: StoreTable = self._get_table(model)
+        with self._lock, self._connection:
+            self._delete(table, ids, pupil_id, int(behaviour))
+
+    def clear(
+        self,
+        model: Type[BaseModel],
+        pupil_id: int,
+        period_id: int = None,
+        behaviour: bool = False,
+    ) -> None:
+        table: StoreTable = self._get_table(model)
+        with self._lock, self._connection:
+            self._clear(table, pupil_id, int(behaviour), period_id)
+
+    def apply_sync(
+        self,
+        model: Type[BaseModel],
+        result: SyncResult,
+        pupil_id: int,
+        period_id: int = None,
+        date_from: Union[date, datetime] = None,
+        date_to: Union[date, datetime] = None,
+        behaviour: bool = False,
+    ) -> None:
+        table: StoreTable = self._get_table(model)
+        kind: int = int(behaviour)
+        with self._lock, self._connection:
+            if result.full:
+                self._clear(
+                    table,
+                    pupil_id,
+                    kind,
+                    period_id,
+                    date_from if date_from is not None else result.date_from,
+                    date_to if date_to is not None else result.date_to,
+                )
+            self._upsert(table, result.updated, pupil_id, kind, period_id)
+            self._delete(table, result.deleted, pupil_id, kind)
+
+    def get(
+        self,
+        model: Type[BaseModel],
+        item_id: int,
+        pupil_id: int,
+        behaviour: bool = False,
+    ) -> Any:
+        table: StoreTable = self._get_table(model)
+        with self._lock:
+            row: Optional[tuple[str]] = self._connection.execute(
+                f"SELECT data FROM {table.name} "
+                "WHERE pupil_id = ? AND kind = ? AND id = ?",
+                (pupil_id, int(behaviour), item_id),
+            ).fetchone()
+        return load_model(model, json.loads(row[0])) if row else None
+
+    def query(
+        self,
+        model: Type[BaseModel],
+        pupil_id: int = None,
+        period_id: int = None,
+        date_from: Union[date, datetime] = None,
+        date_to: Union[date, datetime] = None,
+        behaviour: bool = False,
+    ) -> list[Any]:
+        table: StoreTable = self._get_table(model)
+        query, parameters = self._get_filter(
+            int(behaviour), pupil_id, period_id, date_from, date_to
+        )
+        with self._lock:
+            rows: list[tuple[str]] = self._connection.execute(
+                f"SELECT data FROM {table.name}{query} ORDER BY date, id", parameters
+            ).fetchall()
+        return [load_model(model, json.loads(row[0])) for row in rows]
+
+    @staticmethod
+    def _get_filter(
+        kind: int,
+        pupil_id: int = None,
+        period_id: int = None,
+        date_from: Union[date, datetime] = None,
+        date_to: Union[date, datetime] = None,
+    ) -> tuple[str, list[Any]]:
+        conditions: list[str] = ["kind = ?"]
+        parameters: list[Any] = [kind]
+        if pupil_id is not None:
+            conditions.append("pupil_id = ?")
+            parameters.append(pupil_id)
+        if period_id is not None:
+            conditions.append("period_id = ?")
+            parameters.append(period_id)
+        if date_from is not None:
+            conditions.append("date >= ?")
+            parameters.append(_get_day(date_from).isoformat())
+        if date_to is not None:
+            conditions.append("date < ?")
+            parameters.append((_get_day(date_to) + timedelta(days=1)).isoformat())
+        return " WHERE " + " AND ".join(conditions), parameters
+
+    async def _run(self, function: Callable, *args, **kwargs) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(function, *args, **kwargs)
+        )
+
+    async def upsert_async(self, *args, **kwargs) -> None:
+        await self._run(self.upsert, *args, **kwargs)
+
+    async def delete_async(self, *args, **kwargs) -> None:
+        await self._run(self.delete, *args, **kwargs)
+
+    async def clear_async(self, *args, **kwargs) -> None:
+        await self._run(self.clear, *args, **kwargs)
+
+    async def apply_sync_async(self, *args, **kwargs) -> None:
+        await self._run(self.apply_sync, *args, **kwargs)
+
+    async def get_async(self, *args, **kwargs) -> Any:
+        return await self._run(self.get, *args, **kwargs)
+
+    async def query_async(self, *args, **kwargs) -> list[Any]:
+        return await self._run(self.query, *args, **kwargs)
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "Store":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,63 @@
+import time
+from typing import Any, AsyncIterator, Optional
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+ENVELOPE_ITEM_PREFIX: str = "Envelope.item"
+CONTAINER_START_EVENTS: set[str] = {"start_map", "start_array"}
+CONTAINER_END_EVENTS: set[str] = {"end_map", "end_array"}
+
+
+class StreamedResponse:
+    def __init__(self):
+        self.status_code: Optional[int] = None
+        self.envelope_type: Optional[str] = None
+        self.read_duration: float = 0
+
+
+class TimedStream:
+    def __init__(self, stream: Any, response: StreamedResponse):
+        self._stream = stream
+        self._response = response
+
+    async def read(self, size: int = -1) -> bytes:
+        start: float = time.perf_counter()
+        try:
+            return await self._stream.read(size)
+        finally:
+            self._response.read_duration += time.perf_counter() - start
+
+
+async def iter_envelope_items(
+    stream: Any, response: StreamedResponse
+) -> AsyncIterator[Any]:
+    if not ijson:
+        raise ImportError("ijson is required to stream responses")
+    builder: Optional[ijson.ObjectBuilder] = None
+    depth: int = 0
+    async for prefix, event, value in ijson.parse_async(
+        TimedStream(stream, response), use_float=True
+    ):
+        if builder:
+            builder.event(event, value)
+            if event in CONTAINER_START_EVENTS:
+                depth += 1
+            elif event in CONTAINER_END_EVENTS:
+                depth -= 1
+                if not depth:
+                    yield builder.value
+                    builder = None
+        elif prefix == ENVELOPE_ITEM_PREFIX:
+            if event in CONTAINER_START_EVENTS:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            else:
+                yield value
+        elif prefix == "Status.Code":
+            response.status_code = value
+        elif prefix == "EnvelopeType":
+            response.envelope_type = value
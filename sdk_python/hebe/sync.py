@@ -0,0 +1,228 @@
+import asyncio
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Awaitable, Callable, Hashable, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from pydantic import BaseModel
+
+from sdk_python.hebe.client import Client
+
+DEFAULT_SYNC_MARGIN: timedelta = timedelta(minutes=5)
+
+try:
+    SERVER_TIMEZONE: Optional[tzinfo] = ZoneInfo("Europe/Warsaw")
+except ZoneInfoNotFoundError:
+    SERVER_TIMEZONE = None
+
+
+def to_server_time(value: datetime) -> datetime:
+    return value.astimezone(SERVER_TIMEZONE).replace(tzinfo=None)
+
+
+class SyncResult(BaseModel):
+    items: list[Any]
+    updated: list[Any]
+    deleted: list[int]
+    full: bool
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+
+class SyncSession:
+    def __init__(
+        self,
+        client: Client,
+        login_id: int = None,
+        margin: timedelta = DEFAULT_SYNC_MARGIN,
+    ):
+        self._client = client
+        self._login_id = (
+            login_id if login_id is not None else client.api.certificate.login_id
+        )
+        self.margin = margin
+        self.watermarks: dict[tuple, datetime] = {}
+        self._states: dict[tuple, dict[int, Any]] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+
+    def _get_key(self, pupil_id: int, resource: str, period: Hashable) -> tuple:
+        return self._login_id, pupil_id, resource, period
+
+    def get_items(
+        self, pupil_id: int, resource: str, period: Hashable = None
+    ) -> list[Any]:
+        key: tuple = self._get_key(pupil_id, resource, period)
+        return list(self._states.get(key, {}).values())
+
+    def reset(self, pupil_id: int = None) -> None:
+        for key in list(self.watermarks):
+            if pupil_id is None or key[1] == pupil_id:
+                del self.watermarks[key]
+                self._states.pop(key, None)
+
+    async def _sync(
+        self,
+        pupil_id: int,
+        resource: str,
+        period: Hashable,
+        fetch: Callable[[datetime], Awaitable[list[Any]]],
+        fetch_deleted: Optional[Callable[[datetime], Awaitable[list[int]]]] = None,
+        date_from: date = None,
+        date_to: date = None,
+    ) -> SyncResult:
+        key: tuple = self._get_key(pupil_id, resource, period)
+        lock: asyncio.Lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            result: SyncResult = await self._sync_locked(key, fetch, fetch_deleted)
+        result.date_from = date_from
+        result.date_to = date_to
+        return result
+
+    async def _sync_locked(
+        self,
+        key: tuple,
+        fetch: Callable[[datetime], Awaitable[list[Any]]],
+        fetch_deleted: Optional[Callable[[datetime], Awaitable[list[int]]]],
+    ) -> SyncResult:
+        since: Optional[datetime] = self.watermarks.get(key)
+        started: datetime = datetime.now(timezone.utc)
+        full: bool = since is None or not fetch_deleted
+        if full:
+            updated: list[Any] = await fetch(datetime.min)
+            deleted: list[int] = []
+            state: dict[int, Any] = {}
+            self._states[key] = state
+        else:
+            server_since: datetime = to_server_time(since)
+            updated, deleted = await asyncio.gather(
+                fetch(server_since), fetch_deleted(server_since)
+            )
+            state = self._states.setdefault(key, {})
+        for item in updated:
+            state[item.id] = item
+        for item_id in deleted:
+            state.pop(item_id, None)
+        self.watermarks[key] = started - self.margin
+        return SyncResult(
+            items=list(state.values()), updated=updated, deleted=deleted, full=full
+        )
+
+    async def sync_grades(
+        self, pupil_id: int, period_id: int, behaviour: bool = False
+    ) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "behaviour_grades" if behaviour else "grades",
+            period_id,
+            lambda since: self._client.get_grades_by_pupil_and_period(
+                pupil_id, period_id, behaviour, last_sync_date=since
+            ),
+            lambda since: self._client.get_deleted_grades_by_pupil_and_period(
+                pupil_id, period_id, last_sync_date=since
+            ),
+        )
+
+    async def sync_exams(self, pupil_id: int) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "exams",
+            None,
+            lambda since: self._client.get_exams_by_pupil(
+                pupil_id, last_sync_date=since
+            ),
+            lambda since: self._client.get_deleted_exams_by_pupil(
+                pupil_id, last_sync_date=since
+            ),
+        )
+
+    async def sync_homework(self, pupil_id: int) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "homework",
+            None,
+            lambda since: self._client.get_homework_by_pupil(
+                pupil_id, last_sync_date=since
+            ),
+            lambda since: self._client.get_deleted_homework_by_pupil(
+                pupil_id, last_sync_date=since
+            ),
+        )
+
+    async def sync_notes(self, pupil_id: int) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "notes",
+            None,
+            lambda since: self._client.get_notes_by_pupil(
+                pupil_id, last_sync_date=since
+            ),
+            lambda since: self._client.get_deleted_notes_by_pupil(
+                pupil_id, last_sync_date=since
+            ),
+        )
+
+    async def sync_meetings(self, pupil_id: int, from_date: date) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "meetings",
+            from_date,
+            lambda since: self._client.get_meetings_by_pupil(
+                pupil_id, from_date, last_sync_date=since
+            ),
+            lambda since: self._client.get_deleted_meetings_by_pupil(
+                pupil_id, last_sync_date=since
+            ),
+            date_from=from_date,
+        )
+
+    async def sync_schedule(
+        self, pupil_id: int, date_from: date, date_to: date
+    ) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "schedule",
+            (date_from, date_to),
+            lambda since: self._client.get_schedule_by_pupil(
+                pupil_id, date_from=date_from, date_to=date_to, last_sync_date=since
+            ),
+            lambda since: self._client.get_deleted_schedule_entries_by_pupil(
+                pupil_id, last_sync_date=since
+            ),
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    async def sync_schedule_changes(
+        self, pupil_id: int, date_from: date, date_to: date
+    ) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "schedule_changes",
+            (date_from, date_to),
+            lambda since: self._client.get_schedule_changes_by_pupil(
+                pupil_id, date_from=date_from, date_to=date_to, last_sync_date=since
+            ),
+            lambda since: self._client.get_deleted_schedule_changes(
+                last_sync_date=since
+            ),
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    async def sync_grades_summary(self, pupil_id: int, period_id: int) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "grades_summary",
+            period_id,
+            lambda since: self._client.get_grades_summary_by_pupil_and_period(
+                pupil_id, period_id
+            ),
+        )
+
+    async def sync_teachers(self, pupil_id: int, period_id: int) -> SyncResult:
+        return await self._sync(
+            pupil_id,
+            "teachers",
+            period_id,
+            lambda since: self._client.get_teachers_by_pupil_and_period(
+                pupil_id, period_id, last_sync_date=since
+            ),
+        )
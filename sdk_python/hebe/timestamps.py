@@ -0,0 +1,86 @@
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Any, Callable, Optional, Type, Union
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_SINGLETON
+
+DATES_CACHE_SIZE: int = 4096
+TIMES_CACHE_SIZE: int = 1024
+DAY_MILLISECONDS: int = 86400000
+
+
+@lru_cache(maxsize=DATES_CACHE_SIZE)
+def _get_day(day: int) -> tuple[float, date, date]:
+    start: int = day * DAY_MILLISECONDS
+    first: date = date.fromtimestamp(start / 1000)
+    last: date = date.fromtimestamp((start + DAY_MILLISECONDS - 1) / 1000)
+    return datetime.combine(last, time.min).timestamp() * 1000, first, last
+
+
+def _date_from_timestamp(timestamp: int) -> date:
+    midnight, first, last = _get_day(timestamp // DAY_MILLISECONDS)
+    return last if timestamp >= midnight else first
+
+
+@lru_cache(maxsize=TIMES_CACHE_SIZE)
+def to_time(value: str) -> time:
+    return time(*map(int, value.split(":")))
+
+
+def to_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromtimestamp(value["Timestamp"] / 1000)
+
+
+def to_date(value: Any) -> Optional[date]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return _date_from_timestamp(value["Timestamp"])
+
+
+_fields: dict[Type[BaseModel], dict[str, type]] = {}
+
+
+def get_timestamp_fields(model: Type[BaseModel]) -> dict[str, type]:
+    fields: Optional[dict[str, type]] = _fields.get(model)
+    if fields is None:
+        fields = _fields[model] = {
+            field.alias: datetime if issubclass(field.type_, datetime) else date
+            for field in model.__fields__.values()
+            if field.shape == SHAPE_SINGLETON
+            and isinstance(field.type_, type)
+            and issubclass(field.type_, date)
+        }
+    return fields
+
+
+def _datetime_from_timestamp(timestamp: int) -> datetime:
+    return datetime.fromtimestamp(timestamp / 1000)
+
+
+def convert_timestamps(items: list[dict], fields: dict[str, type]) -> None:
+    caches: dict[type, dict[int, Union[date, datetime]]] = {date: {}, datetime: {}}
+    for alias, type_ in fields.items():
+        cache: dict[int, Union[date, datetime]] = caches[type_]
+        convert: Callable[[int], Union[date, datetime]] = (
+            _date_from_timestamp if type_ is date else _datetime_from_timestamp
+        )
+        for item in items:
+            value: Any = item.get(alias)
+            if not isinstance(value, dict):
+                continue
+            timestamp: Any = value.get("Timestamp")
+            if not isinstance(timestamp, (int, float)):
+                continue
+            converted: Optional[Union[date, datetime]] = cache.get(timestamp)
+            if converted is None:
+                try:
+                    converted = cache[timestamp] = convert(timestamp)
+                except (ValueError, OverflowError, OSError):
+                    continue
+            item[alias] = converted
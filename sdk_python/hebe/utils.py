@@ -1,25 +1,150 @@
+import asyncio
+import json
+import os
+import time
+from typing import Optional
 from aiohttp import ClientSession
-from sdk_python.hebe.error import NotFoundEntityException
+from sdk_python.hebe.error import (
+    InvalidResponseContentException,
+    NotFoundEntityException,
+)
+from sdk_python.hebe.session import default_session_registry
 
 ROUTING_RULES_URL: str = (
     "http://komponenty.vulcan.net.pl/UonetPlusMobile/RoutingRules.txt"
 )
+ROUTING_RULES_TTL: float = 24 * 60 * 60
+ROUTING_RULES_RETRY_DELAY: float = 60
+ROUTING_RULES_MAX_RETRY_DELAY: float = 60 * 60
+EXTRA_SERVERS: dict[str, str] = {"FK1": "http://api.fakelog.cf"}
+
+
+class RoutingTable:
+    def __init__(self, servers: dict[str, str], fetched_at: float):
+        self.servers = servers
+        self.fetched_at = fetched_at
+        self._prefix_lengths: list[int] = sorted(
+            {len(prefix) for prefix in servers}, reverse=True
+        )
+
+    @staticmethod
+    def parse(text: str, fetched_at: float) -> "RoutingTable":
+        servers: dict[str, str] = {}
+        for line in text.split():
+            prefix, _, url = line.partition(",")
+            if prefix and url.startswith(("http://", "https://")):
+                servers[prefix.upper()] = url
+        if not servers:
+            raise InvalidResponseContentException()
+        servers.update(EXTRA_SERVERS)
+        return RoutingTable(servers, fetched_at)
+
+    def get_server_url(self, token: str) -> Optional[str]:
+        token = token.upper()
+        for length in self._prefix_lengths:
+            server_url: Optional[str] = self.servers.get(token[:length])
+            if server_url:
+                return server_url
+        return None
+
+
+class RoutingRulesCache:
+    def __init__(self, ttl: float = ROUTING_RULES_TTL, path: str = None):
+        self.ttl = ttl
+        self.path = path
+        self._table: Optional[RoutingTable] = None
+        self._refresh: Optional[asyncio.Task] = None
+        self._failures: int = 0
+        self._retry_at: float = 0
+
+    def _is_fresh(self, table: Optional[RoutingTable]) -> bool:
+        return bool(table) and time.time() - table.fetched_at < self.ttl
+
+    def _load(self) -> Optional[RoutingTable]:
+        if not self.path or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data: dict = json.load(file)
+            return RoutingTable(data["servers"], data["fetched_at"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save(self, table: RoutingTable) -> None:
+        if not self.path:
+            return
+        temporary_path: str = f"{self.path}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(
+                    {"fetched_at": table.fetched_at, "servers": table.servers}, file
+                )
+            os.replace(temporary_path, self.path)
+        except OSError:
+            pass
+
+    async def _download(self) -> RoutingTable:
+        session: ClientSession = await default_session_registry.acquire(
+            ROUTING_RULES_URL
+        )
+        try:
+            async with session.get(ROUTING_RULES_URL) as response:
+                response.raise_for_status()
+                text: str = await response.text()
+        finally:
+            await default_session_registry.release(ROUTING_RULES_URL, session)
+        table: RoutingTable = RoutingTable.parse(text, time.time())
+        self._save(table)
+        return table
+
+    async def _update(self) -> RoutingTable:
+        try:
+            self._table = await self._download()
+            self._failures = 0
+        except Exception:
+            if not self._table:
+                raise
+            self._failures += 1
+            self._retry_at = time.time() + min(
+                ROUTING_RULES_RETRY_DELAY * 2 ** (self._failures - 1),
+                ROUTING_RULES_MAX_RETRY_DELAY,
+            )
+        return self._table
+
+    async def get(self) -> RoutingTable:
+        if not self._table:
+            self._table = self._load()
+        if self._is_fresh(self._table) or (
+            self._table and time.time() < self._retry_at
+        ):
+            return self._table
+        refresh: Optional[asyncio.Task] = self._refresh
+        if (
+            not refresh
+            or refresh.done()
+            or refresh.get_loop() is not asyncio.get_running_loop()
+        ):
+            refresh = self._refresh = asyncio.ensure_future(self._update())
+        return await asyncio.shield(refresh)
+
+    def invalidate(self) -> None:
+        self._table = None
+        self._refresh = None
+        self._failures = 0
+        self._retry_at = 0
+
+
+routing_rules_cache: RoutingRulesCache = RoutingRulesCache()
 
 
 async def get_servers_list() -> dict[str, str]:
-    session: ClientSession = ClientSession()
-    response = await session.get(ROUTING_RULES_URL)
-    text: str = await response.text()
-    servers_list: dict = {
-        server.split(",")[0]: server.split(",")[1] for server in text.split()
-    }
-    servers_list.update({"FK1": "http://api.fakelog.cf"})
-    return servers_list
+    table: RoutingTable = await routing_rules_cache.get()
+    return dict(table.servers)
 
 
 async def get_server_url_by_token(token: str) -> str:
-    servers_list: dict[str, str] = await get_servers_list()
-    try:
-        return servers_list[token.upper()[:3]]
-    except:
+    table: RoutingTable = await routing_rules_cache.get()
+    server_url: Optional[str] = table.get_server_url(token)
+    if not server_url:
         raise NotFoundEntityException()
+    return server_url
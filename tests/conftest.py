@@ -0,0 +1,8 @@
+import pytest
+
+from sdk_python.hebe import Certificate
+
+
+@pytest.fixture(scope="session")
+def certificate() -> Certificate:
+    return Certificate.create()
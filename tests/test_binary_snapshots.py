@@ -0,0 +1,55 @@
+import pytest
+
+from benchmarks import generators
+from sdk_python.hebe import binary
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.data.grade_table import GradeTable
+from sdk_python.hebe.error import InvalidSnapshotException, SnapshotVersionException
+from sdk_python.hebe.lazy import parse_lazy
+from sdk_python.hebe.parsing import parse_many
+
+
+def get_page() -> list[dict]:
+    return [generators.grade(grade_id) for grade_id in range(1, 21)]
+
+
+@pytest.mark.parametrize("trusted", (False, True))
+def test_models_round_trip(trusted):
+    grades: list[Grade] = parse_many(Grade, get_page(), trusted)
+    assert binary.loads(binary.dumps(grades)) == grades
+
+
+def test_lazy_models_round_trip():
+    grades: list = parse_lazy(Grade, get_page())
+    restored: list = binary.loads(binary.dumps(grades))
+    assert [grade.materialize() for grade in restored] == [
+        grade.materialize() for grade in grades
+    ]
+
+
+def test_grade_table_round_trips_out_of_band():
+    table: GradeTable = GradeTable.from_envelopes(get_page())
+    restored: GradeTable = binary.loads(binary.dumps(table))
+    assert list(restored["id"]) == list(table["id"])
+    assert restored.get_subject_ids() == table.get_subject_ids()
+
+
+def test_invalid_data_is_rejected():
+    with pytest.raises(InvalidSnapshotException):
+        binary.loads(b"nope")
+    with pytest.raises(InvalidSnapshotException):
+        binary.loads(b"XXXX" + binary.dumps([])[4:])
+
+
+def test_truncated_data_is_rejected():
+    data: bytes = binary.dumps(GradeTable.from_envelopes(get_page()))
+    for length in range(binary.HEADER.size, len(data), 7):
+        with pytest.raises(InvalidSnapshotException):
+            binary.loads(data[:length])
+
+
+def test_schema_change_is_detected(monkeypatch):
+    data: bytes = binary.dumps([])
+    monkeypatch.setattr(binary, "_schema_hash", b"\0" * 8)
+    with pytest.raises(SnapshotVersionException):
+        binary.loads(data)
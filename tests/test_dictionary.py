@@ -0,0 +1,37 @@
+import asyncio
+
+from benchmarks.fake_server import FakeHebeServer
+from sdk_python.hebe import API, Certificate
+from sdk_python.hebe.client import Client
+from sdk_python.hebe.data.time_slot import TimeSlot
+from sdk_python.hebe.dictionary import DictionaryCache
+
+
+def test_time_slots_are_fetched_once(certificate: Certificate):
+    async def main():
+        async with FakeHebeServer({}) as server, API(
+            certificate, server.rest_url, dictionary_cache=DictionaryCache()
+        ) as api, Client(api) as client:
+            first, second = await asyncio.gather(
+                client.get_time_slots(), client.get_time_slots()
+            )
+            assert first is second
+            assert await client.get_time_slots() is first
+            assert server.requests == 1
+            api.dictionary_cache.invalidate(server.rest_url)
+            await client.get_time_slots()
+            assert server.requests == 2
+
+    asyncio.run(main())
+
+
+def test_expired_entries_are_refetched(certificate: Certificate):
+    async def main():
+        async with FakeHebeServer({}) as server, API(
+            certificate, server.rest_url, dictionary_cache=DictionaryCache(ttl=0)
+        ) as api:
+            await TimeSlot.get(api)
+            await TimeSlot.get(api)
+            assert server.requests == 2
+
+    asyncio.run(main())
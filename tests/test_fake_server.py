@@ -0,0 +1,40 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from benchmarks import generators
+from benchmarks.fake_server import FakeHebeServer
+from sdk_python.hebe import API, Certificate
+from sdk_python.hebe.client import Client
+from sdk_python.hebe.data.schedule import ScheduleEntry
+from sdk_python.hebe.error import NoPermissionsException, NotFoundEntityException
+
+
+def test_schedule_honours_date_range(certificate: Certificate):
+    day: date = generators.START.date() + timedelta(days=1)
+
+    async def main():
+        async with FakeHebeServer({"schedule_entry": 40}) as server, API(
+            certificate, server.rest_url
+        ) as api, Client(api) as client:
+            entries: list[ScheduleEntry] = await client.get_schedule_by_pupil(
+                1, date_from=day, date_to=day
+            )
+            assert len(entries) == 8
+            assert {entry.date_ for entry in entries} == {day}
+
+    asyncio.run(main())
+
+
+def test_error_status_is_raised(certificate: Certificate):
+    async def main():
+        async with FakeHebeServer(
+            {"exam": 5}, statuses={"exam/byPupil": 100, "school/lucky": 200}
+        ) as server, API(certificate, server.rest_url) as api, Client(api) as client:
+            with pytest.raises(NoPermissionsException):
+                await client.get_exams_by_pupil(1)
+            with pytest.raises(NotFoundEntityException):
+                await client.get_lucky_number_by_constituent_unit(1, date.today())
+
+    asyncio.run(main())
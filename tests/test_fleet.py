@@ -0,0 +1,87 @@
+import asyncio
+import multiprocessing
+import os
+
+import pytest
+
+from sdk_python.hebe import Certificate
+from sdk_python.hebe.client import Client
+from sdk_python.hebe.fleet import FleetResult, FleetRunner
+
+
+async def get_rest_url(client: Client) -> str:
+    return client.api.rest_url
+
+
+async def fail(client: Client) -> None:
+    raise ValueError(client.api.rest_url)
+
+
+def get_certificates(certificate: Certificate, count: int) -> list[Certificate]:
+    return [
+        certificate.copy(
+            update={
+                "fingerprint": f"fingerprint{index}",
+                "rest_url": f"http://127.0.0.1/symbol{index}/api",
+            }
+        )
+        for index in range(count)
+    ]
+
+
+def test_fleet_runs_every_account_once(certificate: Certificate):
+    certificates: list[Certificate] = get_certificates(certificate, 5)
+    runner: FleetRunner = FleetRunner(certificates, get_rest_url, workers=2)
+    results: list[FleetResult] = list(runner.run())
+    assert sorted(result.result for result in results) == sorted(
+        certificate.rest_url for certificate in certificates
+    )
+    assert {result.worker for result in results} == {0, 1}
+    assert sum(stats.accounts for stats in runner.stats.values()) == 5
+    assert all(stats.exit_code == 0 for stats in runner.stats.values())
+
+
+def test_fleet_reports_task_errors(certificate: Certificate):
+    runner: FleetRunner = FleetRunner(get_certificates(certificate, 2), fail, workers=1)
+    results: list[FleetResult] = list(runner.run())
+    assert [result.error_type for result in results] == ["ValueError", "ValueError"]
+    assert runner.stats[0].errors == 2
+
+
+async def crash_on_second_account(client: Client) -> str:
+    if client.api.certificate.fingerprint == "fingerprint1":
+        await asyncio.sleep(0.5)
+        os._exit(3)
+    return client.api.rest_url
+
+
+async def wait_forever(client: Client) -> None:
+    await asyncio.sleep(60)
+
+
+def test_crashed_worker_reports_unfinished_accounts(certificate: Certificate):
+    runner: FleetRunner = FleetRunner(
+        get_certificates(certificate, 2), crash_on_second_account, workers=1
+    )
+    results: dict[str, FleetResult] = {
+        result.fingerprint: result for result in runner.run()
+    }
+    assert results["fingerprint0"].error is None
+    assert results["fingerprint1"].error_type == "FleetWorkerException"
+    assert runner.stats[0].exit_code == 3
+    assert runner.stats[0].errors == 1
+
+
+def test_closing_run_async_stops_workers(certificate: Certificate):
+    runner: FleetRunner = FleetRunner(
+        get_certificates(certificate, 2), wait_forever, workers=2
+    )
+
+    async def main():
+        results = runner.run_async()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(results.__anext__(), 0.5)
+        await results.aclose()
+        assert multiprocessing.active_children() == []
+
+    asyncio.run(main())
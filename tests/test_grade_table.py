@@ -0,0 +1,66 @@
+import pickle
+
+import pytest
+
+from benchmarks import generators
+from sdk_python.hebe.data.grade_table import GradeTable
+
+
+def get_table(count: int = 30) -> GradeTable:
+    return GradeTable.from_envelopes(
+        generators.grade(grade_id) for grade_id in range(1, count + 1)
+    )
+
+
+def test_rows_are_sorted_by_period_and_subject():
+    table: GradeTable = get_table()
+    keys: list[tuple[int, int]] = [(row[2], row[3]) for row in table.rows()]
+    assert len(table) == 30
+    assert keys == sorted(keys)
+
+
+def test_filter_by_subject_and_period():
+    table: GradeTable = get_table()
+    subject_id: int = table.get_subject_ids()[0]
+    filtered: GradeTable = table.filter(subject_id=subject_id, period_id=1)
+    assert len(filtered) == 2
+    assert set(filtered.get_subject_ids()) == {subject_id}
+    assert len(table.filter(subject_id=-1)) == 0
+
+
+@pytest.mark.parametrize("step", (2, -1))
+def test_stepped_slices_are_contiguous(step):
+    table: GradeTable = get_table()
+    sliced: GradeTable = table[::step]
+    assert list(sliced["id"]) == list(table["id"])[::step]
+    assert all(column.contiguous for column in sliced.columns.values())
+    restored: GradeTable = pickle.loads(pickle.dumps(sliced, protocol=5))
+    assert list(restored["id"]) == list(sliced["id"])
+    assert sliced["value"].cast("B").nbytes == len(sliced) * 8
+
+
+def test_to_numpy_accepts_stepped_slices():
+    pytest.importorskip("numpy")
+    table: GradeTable = get_table()
+    assert list(table[::3].to_numpy()["id"]) == list(table["id"])[::3]
+
+
+def test_filter_after_unsorted_take():
+    table: GradeTable = get_table()
+    shuffled: GradeTable = table.take(
+        [*range(0, len(table), 2), *range(1, len(table), 2)]
+    )
+    assert not shuffled.is_sorted
+    for subject_id in set(table.get_subject_ids()):
+        for period_id in (1, 2):
+            expected: list[int] = list(
+                table.filter(subject_id=subject_id, period_id=period_id)["id"]
+            )
+            filtered: GradeTable = shuffled.filter(
+                subject_id=subject_id, period_id=period_id
+            )
+            assert sorted(filtered["id"]) == expected
+    assert sorted(shuffled.filter(period_id=1)["id"]) == sorted(
+        table.filter(period_id=1)["id"]
+    )
+    assert table.take(range(0, len(table), 2)).is_sorted
@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from benchmarks import generators
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.data.schedule import ScheduleEntry
+from sdk_python.hebe.interning import InternPool
+from sdk_python.hebe.lazy import parse_lazy
+from sdk_python.hebe.models.subject import Subject
+from sdk_python.hebe.parsing import parse_many
+
+
+def test_interned_models_are_immutable():
+    grades: list[Grade] = parse_many(
+        Grade, [generators.grade(1), generators.grade(61)], True, pool=InternPool()
+    )
+    assert grades[0].column is grades[1].column
+    with pytest.raises(TypeError):
+        grades[0].column.name = "changed"
+    with pytest.raises(TypeError):
+        grades[0].column.subject.name = "changed"
+    assert grades[1].column.name != "changed"
+
+
+def test_shared_models_are_immutable_in_validated_mode():
+    entries: list[ScheduleEntry] = parse_many(
+        ScheduleEntry, [generators.schedule_entry(1)], pool=InternPool()
+    )
+    with pytest.raises(TypeError):
+        entries[0].time_slot.position = 0
+
+
+def test_models_outside_the_pool_stay_mutable():
+    grade: Grade = parse_many(Grade, [generators.grade(1)])[0]
+    grade.column.name = "changed"
+    grade.column.subject.name = "changed"
+    assert grade.column.name == grade.column.subject.name == "changed"
+    subject: Subject = Subject.parse_obj(generators.grade(1)["Column"]["Subject"])
+    subject.name = "changed"
+    assert subject.name == "changed"
+
+
+def test_copies_of_interned_models_are_mutable():
+    grade: Grade = parse_many(Grade, [generators.grade(1)], True, pool=InternPool())[0]
+    for column in (grade.column.copy(), pickle.loads(pickle.dumps(grade.column))):
+        column.name = "changed"
+        assert column.name == "changed"
+    assert grade.column.name != "changed"
+
+
+def test_interned_lazy_models_are_immutable():
+    grades: list = parse_lazy(
+        Grade, [generators.grade(1), generators.grade(61)], InternPool()
+    )
+    assert grades[0].column is grades[1].column
+    with pytest.raises(TypeError):
+        grades[0].column.name = "changed"
+
+
+def test_grades_stay_mutable():
+    grade: Grade = parse_many(Grade, [generators.grade(1)])[0]
+    grade.value = 5
+    assert grade.value == 5
@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Union
+
+import pytest
+
+from benchmarks.fake_server import FakeHebeServer
+from sdk_python.hebe import API, Certificate
+from sdk_python.hebe.json_backend import (
+    ORJSON_BACKEND,
+    STDLIB_BACKEND,
+    JSONBackend,
+    get_json_backend,
+    set_json_backend,
+)
+
+DOCUMENT: dict = {"Envelope": [{"Id": 1, "Name": "zażółć", "Weight": 1.5}]}
+
+
+@pytest.mark.skipif(ORJSON_BACKEND is None, reason="orjson is not installed")
+def test_backends_round_trip_the_same_document():
+    for backend in (STDLIB_BACKEND, ORJSON_BACKEND):
+        assert isinstance(backend.dumps(DOCUMENT), bytes)
+        assert backend.loads(backend.dumps(DOCUMENT)) == DOCUMENT
+    assert ORJSON_BACKEND.loads(STDLIB_BACKEND.dumps(DOCUMENT)) == DOCUMENT
+
+
+def test_api_decodes_with_configured_backend(certificate: Certificate):
+    decoded: list[Union[bytes, str]] = []
+
+    def loads(data: Union[bytes, str]) -> Any:
+        decoded.append(data)
+        return STDLIB_BACKEND.loads(data)
+
+    backend: JSONBackend = JSONBackend("counting", loads, STDLIB_BACKEND.dumps)
+
+    async def main():
+        async with FakeHebeServer({"exam": 3}) as server, API(
+            certificate, server.rest_url
+        ) as api:
+            envelope, _ = await api.get("exam/byPupil")
+            assert len(envelope) == 3
+
+    previous: JSONBackend = get_json_backend()
+    set_json_backend(backend)
+    try:
+        asyncio.run(main())
+    finally:
+        set_json_backend(previous)
+    assert len(decoded) == 1
+    assert isinstance(decoded[0], bytes)
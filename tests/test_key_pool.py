@@ -0,0 +1,122 @@
+import asyncio
+import itertools
+import threading
+import time
+
+import pytest
+
+from sdk_python.hebe import Certificate
+from sdk_python.hebe.certificate import DEFAULT_TYPE
+from sdk_python.hebe.key_pool import KeyPair, KeyPairPool
+
+
+class FakeGenerator:
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.count: int = 0
+        self._counter = itertools.count()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __call__(self) -> KeyPair:
+        time.sleep(self.delay)
+        with self._lock:
+            self.count += 1
+            number: int = next(self._counter)
+        return f"pem{number}", f"fingerprint{number}", f"key{number}"
+
+
+def wait_for(condition, timeout: float = 2) -> None:
+    deadline: float = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_pool_generates_only_up_to_depth():
+    generate: FakeGenerator = FakeGenerator()
+    with KeyPairPool(depth=2, generate=generate) as pool:
+        wait_for(lambda: len(pool) == 2)
+        time.sleep(0.1)
+        assert generate.count == 2
+        assert pool.get() == ("pem0", "fingerprint0", "key0")
+        wait_for(lambda: generate.count == 3)
+        assert len(pool) == 2
+
+
+def test_close_does_not_wait_for_generation_when_full():
+    generate: FakeGenerator = FakeGenerator(delay=0.05)
+    pool: KeyPairPool = KeyPairPool(depth=1, generate=generate)
+    pool.start()
+    wait_for(lambda: len(pool) == 1)
+    generate.delay = 5
+    start: float = time.monotonic()
+    pool.close()
+    assert time.monotonic() - start < 1
+    assert generate.count == 1
+
+
+def test_get_after_close_generates_directly():
+    generate: FakeGenerator = FakeGenerator()
+    pool: KeyPairPool = KeyPairPool(depth=1, generate=generate)
+    pool.close()
+    assert pool.get() == ("pem0", "fingerprint0", "key0")
+
+
+def in_fill_thread() -> bool:
+    return threading.current_thread().name == "KeyPairPool"
+
+
+def test_get_generates_inline_when_pool_is_empty():
+    release: threading.Event = threading.Event()
+
+    def generate() -> KeyPair:
+        if in_fill_thread():
+            release.wait(2)
+        return "pem", "fingerprint", "key"
+
+    with KeyPairPool(depth=1, generate=generate) as pool:
+        start: float = time.monotonic()
+        assert pool.get() == ("pem", "fingerprint", "key")
+        assert not release.is_set()
+        assert time.monotonic() - start < 1
+        release.set()
+
+
+def test_generator_errors_are_raised_from_get():
+    failed: threading.Event = threading.Event()
+
+    def generate() -> KeyPair:
+        if in_fill_thread() and not failed.is_set():
+            failed.set()
+            raise RuntimeError("broken")
+        return "pem", "fingerprint", "key"
+
+    with KeyPairPool(depth=1, generate=generate) as pool:
+        failed.wait(2)
+        wait_for(
+            lambda: not any(
+                thread.name == "KeyPairPool" for thread in threading.enumerate()
+            )
+        )
+        with pytest.raises(RuntimeError, match="broken"):
+            pool.get()
+        assert pool.get() == ("pem", "fingerprint", "key")
+        wait_for(lambda: len(pool) == 1)
+        assert len(pool) == 1
+
+
+def test_create_async_resets_type_like_create():
+    generate: FakeGenerator = FakeGenerator()
+
+    async def main():
+        with KeyPairPool(depth=1, generate=generate) as pool:
+            created: Certificate = await Certificate.create_async(
+                type="custom", key_pool=pool
+            )
+        assert created.type == DEFAULT_TYPE
+        assert created.type == Certificate.create(type="custom", key_pool=pool).type
+        kept: Certificate = await Certificate.create_async(
+            "pem", "fingerprint", "key", type="custom"
+        )
+        assert kept.type == "custom"
+
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+import pickle
+from copy import deepcopy
+
+import pytest
+
+from benchmarks import generators
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.data.schedule import ScheduleEntry
+from sdk_python.hebe.interning import InternPool
+from sdk_python.hebe.lazy import LazyModel, parse_lazy
+from sdk_python.hebe.parsing import parse_many
+
+
+def materialize(value):
+    if isinstance(value, LazyModel):
+        return value.materialize()
+    if isinstance(value, list):
+        return [materialize(item) for item in value]
+    return value
+
+
+@pytest.mark.parametrize(
+    "model, generate",
+    ((Grade, generators.grade), (ScheduleEntry, generators.schedule_entry)),
+)
+def test_lazy_fields_match_validated_models(model, generate):
+    items: list[dict] = [generate(id) for id in range(1, 11)]
+    validated: list = [model.parse_obj(item) for item in deepcopy(items)]
+    lazy: list[LazyModel] = parse_lazy(model, deepcopy(items), InternPool())
+    for expected, actual in zip(validated, lazy):
+        for name in model.__fields__:
+            assert materialize(getattr(actual, name)) == getattr(expected, name), name
+        assert actual.materialize() == expected
+
+
+def test_lazy_models_share_interned_fields():
+    items: list[dict] = [generators.grade(id) for id in (1, 61)]
+    first, second = parse_lazy(Grade, items, InternPool())
+    assert first.column is second.column
+    assert first.column.subject is second.column.subject
+
+
+def test_lazy_models_pickle_to_equal_models():
+    items: list[dict] = [generators.grade(id) for id in range(1, 4)]
+    lazy: list[LazyModel] = parse_lazy(Grade, deepcopy(items), InternPool())
+    restored: list[LazyModel] = pickle.loads(pickle.dumps(lazy))
+    expected: list[Grade] = parse_many(Grade, deepcopy(items), trusted=False)
+    assert [grade.materialize() for grade in restored] == expected
+
+
+def test_interned_lazy_models_are_immutable():
+    grade: LazyModel = parse_lazy(Grade, [generators.grade(1)], InternPool())[0]
+    with pytest.raises(TypeError):
+        grade.column.name = "changed"
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+
+import pytest
+from aiohttp import TraceConfig
+
+from benchmarks.fake_server import FakeHebeServer
+from sdk_python.hebe import API, Certificate
+from sdk_python.hebe import api as api_module
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.error import NotFoundEndpointException
+from sdk_python.hebe.session import SessionRegistry
+from sdk_python.hebe.metrics import Histogram, MetricsRegistry, get_labels
+
+ENDPOINT_LABELS = get_labels({"endpoint": "grade//byPupil"})
+REQUEST_LABELS = get_labels({"endpoint": "grade//byPupil", "method": "GET"})
+
+
+def get_histogram(metrics: MetricsRegistry, name: str, labels) -> Histogram:
+    return metrics.histograms[name][labels]
+
+
+@pytest.mark.parametrize("streaming", (False, True))
+def test_requests_record_duration_and_decode_time(
+    certificate: Certificate, streaming: bool
+):
+    metrics: MetricsRegistry = MetricsRegistry()
+
+    async def main():
+        async with FakeHebeServer({"grade": 5}) as server, API(
+            certificate, server.rest_url, metrics=metrics
+        ) as api:
+            if streaming:
+                items: list = [
+                    item async for item in api.stream_page("grade//byPupil", {})
+                ]
+            else:
+                items, _ = await api.get("grade//byPupil")
+            assert len(items) == 5
+
+    asyncio.run(main())
+    request: Histogram = get_histogram(
+        metrics, "hebe_request_duration_seconds", REQUEST_LABELS
+    )
+    assert request.count == 1
+    assert (
+        get_histogram(metrics, "hebe_decode_duration_seconds", ENDPOINT_LABELS).count
+        == 1
+    )
+    assert "hebe_request_duration_seconds" in metrics.render()
+
+
+@pytest.mark.parametrize("streaming", (False, True))
+def test_failed_requests_are_counted(certificate: Certificate, streaming: bool):
+    metrics: MetricsRegistry = MetricsRegistry()
+
+    async def main():
+        async with FakeHebeServer({"grade": 5}) as server, API(
+            certificate, server.rest_url, metrics=metrics
+        ) as api:
+            with pytest.raises(NotFoundEndpointException):
+                if streaming:
+                    async for _ in api.stream_page("missing", {}):
+                        pass
+                else:
+                    await api.get("missing")
+
+    asyncio.run(main())
+    errors: dict = metrics.counters["hebe_errors_total"]
+    assert errors == {
+        get_labels({"endpoint": "missing", "error": "NotFoundEndpointException"}): 1
+    }
+
+
+def test_streamed_pages_are_parsed_in_chunks(certificate: Certificate, monkeypatch):
+    monkeypatch.setattr(api_module, "STREAM_PARSE_CHUNK_SIZE", 10)
+    metrics: MetricsRegistry = MetricsRegistry()
+
+    async def main():
+        async with FakeHebeServer({"grade": 25}) as server, API(
+            certificate, server.rest_url, streaming=True, metrics=metrics
+        ) as api:
+            pages: list[list[Grade]] = [
+                page async for page in api.iter_models("grade//byPupil", {}, Grade)
+            ]
+            assert [grade.id for grade in pages[0]] == list(range(1, 26))
+
+    asyncio.run(main())
+    parse: Histogram = get_histogram(
+        metrics, "hebe_parse_duration_seconds", get_labels({"model": "Grade"})
+    )
+    assert parse.count == 3
+
+
+def test_registry_counts_observations_from_threads():
+    metrics: MetricsRegistry = MetricsRegistry()
+
+    def record() -> None:
+        for _ in range(10000):
+            metrics.observe("parse", 0.01, {"model": "Grade"})
+            metrics.increment("items", labels={"model": "Grade"})
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=record) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    labels = get_labels({"model": "Grade"})
+    assert get_histogram(metrics, "parse", labels).count == 40000
+    assert metrics.counters["items"][labels] == 40000
+
+
+@pytest.mark.parametrize("streaming", (False, True))
+def test_caller_trace_context_is_kept(certificate: Certificate, streaming: bool):
+    metrics: MetricsRegistry = MetricsRegistry()
+    contexts: list = []
+    trace_config: TraceConfig = TraceConfig()
+
+    async def on_request_start(session, context, params) -> None:
+        contexts.append(context.trace_request_ctx)
+
+    trace_config.on_request_start.append(on_request_start)
+    registry: SessionRegistry = SessionRegistry(
+        trace_configs=[trace_config, metrics.trace_config()]
+    )
+
+    async def main():
+        async with FakeHebeServer({"grade": 5}) as server, API(
+            certificate, server.rest_url, session_registry=registry
+        ) as api:
+            if streaming:
+                async for _ in api.stream_page(
+                    "grade//byPupil", {}, trace_request_ctx={"caller": 1}
+                ):
+                    pass
+            else:
+                await api.get("grade//byPupil", trace_request_ctx={"caller": 1})
+        await registry.close()
+
+    asyncio.run(main())
+    assert contexts == [{"caller": 1, "endpoint": "grade//byPupil"}]
+    assert ENDPOINT_LABELS in metrics.histograms["hebe_time_to_first_byte_seconds"]
@@ -0,0 +1,82 @@
+import asyncio
+import inspect
+import time
+
+from aiohttp import web
+
+from benchmarks.fake_server import FakeHebeServer
+from sdk_python.hebe import API, Certificate
+from sdk_python.hebe import api as api_module
+from sdk_python.hebe.client import Client
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.data.lucky_number import LuckyNumber
+from sdk_python.hebe.data.meeting import Meeting
+
+PARSE_TIME: float = 0.2
+
+
+class RecordingServer(FakeHebeServer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events: list[str] = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.events.append("request")
+        return await super().handle(request)
+
+
+def test_get_all_follows_last_id(certificate: Certificate, monkeypatch):
+    monkeypatch.setattr(api_module, "PAGE_SIZE", 10)
+
+    async def main():
+        async with FakeHebeServer({"grade": 25}) as server, API(
+            certificate, server.rest_url
+        ) as api:
+            grades: list[dict] = await api.get_all("grade//byPupil", {"pupilId": 1})
+            assert [grade["Id"] for grade in grades] == list(range(1, 26))
+            assert server.requests == 3
+
+    asyncio.run(main())
+
+
+def test_next_page_is_fetched_while_parsing(certificate: Certificate, monkeypatch):
+    monkeypatch.setattr(api_module, "PAGE_SIZE", 10)
+    monkeypatch.setattr(api_module, "THREADED_PARSE_MIN_ITEMS", 1)
+    parse_many = API.parse_many
+    events: list[str] = []
+
+    def slow_parse_many(self, *args, **kwargs):
+        time.sleep(PARSE_TIME)
+        models: list = parse_many(self, *args, **kwargs)
+        events.append("parsed")
+        return models
+
+    monkeypatch.setattr(API, "parse_many", slow_parse_many)
+
+    async def main():
+        async with RecordingServer({"grade": 40}) as server, API(
+            certificate, server.rest_url, trusted=True
+        ) as api:
+            server.events = events
+            pages: list[list[Grade]] = [
+                page async for page in api.iter_models("grade//byPupil", {}, Grade)
+            ]
+            assert [len(page) for page in pages] == [10, 10, 10, 10, 0]
+
+    asyncio.run(main())
+    requested: list[int] = [
+        events[:index].count("request")
+        for index, event in enumerate(events)
+        if event == "parsed"
+    ]
+    assert requested[:4] == [2, 3, 4, 5]
+
+
+def test_date_defaults_are_resolved_per_call():
+    for function, name in (
+        (Meeting.iter_by_pupil, "from_date"),
+        (Meeting.get_by_pupil, "from_date"),
+        (LuckyNumber.get_by_constituent_unit, "day"),
+        (Client.get_lucky_number_by_constituent_unit, "day"),
+    ):
+        assert inspect.signature(function).parameters[name].default is None
@@ -0,0 +1,43 @@
+import copy
+
+import pytest
+from pydantic import BaseModel, Field
+
+from benchmarks import generators
+from benchmarks.parsing import MODELS
+from sdk_python.hebe.lazy import parse_lazy
+from sdk_python.hebe.parsing import parse_many
+
+
+@pytest.mark.parametrize("name", sorted(MODELS))
+def test_trusted_parsing_matches_validated_parsing(name):
+    page: list[dict] = [generators.GENERATORS[name](item_id) for item_id in range(20)]
+    validated: list = parse_many(MODELS[name], page)
+    trusted: list = parse_many(MODELS[name], page, trusted=True)
+    assert trusted == validated
+
+
+@pytest.mark.parametrize("trusted", (False, True))
+@pytest.mark.parametrize("name", sorted(MODELS))
+def test_parsing_leaves_raw_items_untouched(name, trusted):
+    page: list[dict] = [generators.GENERATORS[name](item_id) for item_id in range(20)]
+    original: list[dict] = copy.deepcopy(page)
+    parse_many(MODELS[name], page, trusted=trusted)
+    assert page == original
+
+
+class Tagged(BaseModel):
+    id: int = Field(alias="Id")
+    tags: list[str] = Field(default=[], alias="Tags")
+    labels: dict[str, str] = Field(default_factory=dict, alias="Labels")
+
+
+def test_mutable_defaults_are_not_shared():
+    first, second = parse_many(Tagged, [{"Id": 1}, {"Id": 2}], trusted=True)
+    first.tags.append("changed")
+    first.labels["key"] = "changed"
+    assert second.tags == [] and second.labels == {}
+    lazy_first, lazy_second = parse_lazy(Tagged, [{"Id": 1}, {"Id": 2}])
+    lazy_first.tags.append("changed")
+    assert lazy_second.tags == []
+    assert Tagged.__fields__["tags"].default == []
@@ -0,0 +1,50 @@
+import asyncio
+import base64
+import hashlib
+import json
+
+from aiohttp import web
+
+from benchmarks import generators
+from sdk_python.hebe import API, Certificate
+
+
+class RecordingServer:
+    def __init__(self):
+        self.requests: list[tuple[dict, bytes]] = []
+        self._runner: web.AppRunner = None
+        self.port: int = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append((dict(request.headers), await request.read()))
+        return web.json_response(generators.response({}, "Payload"))
+
+    async def __aenter__(self) -> "RecordingServer":
+        app: web.Application = web.Application()
+        app.router.add_post("/{path:.+}", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site: web.TCPSite = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self._runner.cleanup()
+
+
+def test_post_signs_the_exact_bytes_sent(certificate: Certificate):
+    async def main():
+        async with RecordingServer() as server, API(
+            certificate, f"http://127.0.0.1:{server.port}/symbol/api"
+        ) as api:
+            await api.post("register/hebe", {"Name": "zażółć"})
+            ((headers, body),) = server.requests
+            digest: str = base64.b64encode(hashlib.sha256(body).digest()).decode()
+            assert headers["Digest"] == f"SHA-256={digest}"
+            assert headers["Content-Type"] == "application/json"
+            payload: dict = json.loads(body)
+            assert payload["Envelope"] == {"Name": "zażółć"}
+            assert "FirebaseToken" not in payload
+
+    asyncio.run(main())
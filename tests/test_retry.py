@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from sdk_python.hebe.error import FailedRequestException
+from sdk_python.hebe.retry import LatencyTracker, RetryBudget, RetryPolicy
+
+
+def test_percentile():
+    tracker: LatencyTracker = LatencyTracker()
+    for latency in range(1, 101):
+        tracker.add(latency / 100)
+    assert tracker.percentile(0.95) == 0.96
+    assert LatencyTracker().percentile(0.95) is None
+
+
+def test_failed_requests_are_retried():
+    calls: list[int] = []
+
+    async def send() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise FailedRequestException()
+        return "ok"
+
+    policy: RetryPolicy = RetryPolicy(attempts=3, backoff=0)
+    assert asyncio.run(policy.run(send)) == "ok"
+    assert len(calls) == 3
+
+
+def test_retries_stop_when_budget_is_empty():
+    calls: list[int] = []
+
+    async def send() -> Any:
+        calls.append(1)
+        raise FailedRequestException()
+
+    policy: RetryPolicy = RetryPolicy(
+        attempts=10, backoff=0, budget=RetryBudget(ratio=0, min_tokens=1)
+    )
+    with pytest.raises(FailedRequestException):
+        asyncio.run(policy.run(send))
+    assert len(calls) == 2
+
+
+def test_timeouts_are_recorded_as_latency_samples():
+    async def send() -> Any:
+        await asyncio.sleep(1)
+
+    policy: RetryPolicy = RetryPolicy(attempts=1, timeout=0.01)
+    with pytest.raises(FailedRequestException):
+        asyncio.run(policy.run(send))
+    assert len(policy.latency) == 1
+    assert policy.latency.percentile(0.95) == 0.01
+
+
+def test_hedged_request_returns_faster_response():
+    delays: list[float] = [1, 0]
+
+    async def send() -> float:
+        delay: float = delays.pop(0)
+        await asyncio.sleep(delay)
+        return delay
+
+    policy: RetryPolicy = RetryPolicy(hedge=True, hedge_delay=0.01)
+    assert asyncio.run(policy.run(send)) == 0
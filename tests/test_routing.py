@@ -0,0 +1,101 @@
+import asyncio
+import os
+import time
+
+import pytest
+from aiohttp import ClientResponseError, web
+
+from sdk_python.hebe import utils
+from sdk_python.hebe.error import InvalidResponseContentException
+from sdk_python.hebe.utils import EXTRA_SERVERS, RoutingRulesCache, RoutingTable
+
+RULES: str = "3S0,https://lekcjaplus.vulcan.net.pl\n3S01,https://uonetplus.example\n"
+
+
+class RulesServer:
+    def __init__(self, status: int = 200, text: str = RULES):
+        self.status = status
+        self.text = text
+        self.requests: int = 0
+        self._runner: web.AppRunner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.Response(status=self.status, text=self.text)
+
+    async def __aenter__(self) -> "RulesServer":
+        app: web.Application = web.Application()
+        app.router.add_get("/RoutingRules.txt", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        return self
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._runner.addresses[0][1]}/RoutingRules.txt"
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self._runner.cleanup()
+
+
+def test_longest_prefix_wins():
+    table: RoutingTable = RoutingTable.parse(RULES, time.time())
+    assert table.get_server_url("3s01abc") == "https://uonetplus.example"
+    assert table.get_server_url("3S0XYZ") == "https://lekcjaplus.vulcan.net.pl"
+    assert table.get_server_url("FK1ABC") == EXTRA_SERVERS["FK1"]
+    assert table.get_server_url("ZZZ") is None
+
+
+def test_table_without_rules_is_rejected():
+    with pytest.raises(InvalidResponseContentException):
+        RoutingTable.parse("<html><body>Log in, please</body></html>", time.time())
+
+
+def test_rules_are_downloaded_and_persisted(tmp_path, monkeypatch):
+    path: str = str(tmp_path / "rules.json")
+
+    async def main():
+        async with RulesServer() as server:
+            monkeypatch.setattr(utils, "ROUTING_RULES_URL", server.url)
+            cache: RoutingRulesCache = RoutingRulesCache(path=path)
+            await cache.get()
+            await cache.get()
+            assert server.requests == 1
+        loaded: RoutingTable = await RoutingRulesCache(path=path).get()
+        assert loaded.get_server_url("3S0") == "https://lekcjaplus.vulcan.net.pl"
+
+    asyncio.run(main())
+
+
+def test_server_error_keeps_stale_table_with_backoff(tmp_path, monkeypatch):
+    path: str = str(tmp_path / "rules.json")
+
+    async def main():
+        async with RulesServer(status=503) as server:
+            monkeypatch.setattr(utils, "ROUTING_RULES_URL", server.url)
+            cache: RoutingRulesCache = RoutingRulesCache(ttl=0, path=path)
+            with pytest.raises(ClientResponseError):
+                await cache.get()
+            assert not os.path.exists(path)
+            stale: RoutingTable = RoutingTable.parse(RULES, 0)
+            cache._table = stale
+            assert await cache.get() is stale
+            assert await cache.get() is stale
+            assert server.requests == 2
+            assert not os.path.exists(path)
+
+    asyncio.run(main())
+
+
+def test_servers_list_is_a_copy(monkeypatch):
+    cache: RoutingRulesCache = RoutingRulesCache()
+    cache._table = RoutingTable.parse(RULES, time.time())
+    monkeypatch.setattr(utils, "routing_rules_cache", cache)
+
+    async def main():
+        servers: dict[str, str] = await utils.get_servers_list()
+        servers.clear()
+        assert await utils.get_servers_list()
+
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+from sdk_python.hebe.scheduler import HostScheduler, RequestScheduler
+
+
+def test_concurrency_is_limited():
+    scheduler: HostScheduler = HostScheduler(concurrency=2)
+    peak: int = 0
+
+    async def request():
+        nonlocal peak
+        async with scheduler.slot():
+            peak = max(peak, scheduler.active)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(10)))
+        assert scheduler.active == 0
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_accounts_are_served_round_robin():
+    scheduler: HostScheduler = HostScheduler(concurrency=1)
+    order: list[str] = []
+
+    async def request(account: str):
+        async with scheduler.slot(account):
+            order.append(account)
+            await asyncio.sleep(0)
+
+    async def main():
+        async with scheduler.slot("busy"):
+            tasks: list[asyncio.Task] = [
+                asyncio.ensure_future(request(account))
+                for account in ("a", "a", "a", "b", "b", "b")
+            ]
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == ["a", "b", "a", "b", "a", "b"]
+
+
+def test_rate_limits_request_starts():
+    scheduler: RequestScheduler = RequestScheduler(rate=50, burst=1)
+
+    async def main() -> float:
+        start: float = time.monotonic()
+        for _ in range(6):
+            async with scheduler.slot("https://example.com/api"):
+                pass
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) >= 0.09
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    scheduler: HostScheduler = HostScheduler(concurrency=1)
+
+    async def main():
+        await scheduler.acquire()
+        waiter: asyncio.Task = asyncio.ensure_future(scheduler.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        scheduler.release()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert scheduler.active == 0
+        await asyncio.wait_for(scheduler.acquire(), 1)
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiters_leave_the_queue():
+    scheduler: HostScheduler = HostScheduler(concurrency=1)
+    order: list[str] = []
+
+    async def request(account: str, name: str):
+        async with scheduler.slot(account):
+            order.append(name)
+
+    async def main():
+        async with scheduler.slot("busy"):
+            cancelled: asyncio.Task = asyncio.ensure_future(request("a", "a1"))
+            tasks: list[asyncio.Task] = [
+                asyncio.ensure_future(request("b", "b1")),
+                asyncio.ensure_future(request("a", "a2")),
+            ]
+            await asyncio.sleep(0)
+            assert scheduler.waiting == 3
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            assert scheduler.waiting == 2
+        await asyncio.gather(*tasks)
+        assert scheduler.waiting == 0
+
+    asyncio.run(main())
+    assert order == ["a2", "b1"]
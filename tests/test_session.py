@@ -0,0 +1,87 @@
+import asyncio
+import warnings
+
+from aiohttp import ClientSession
+
+from sdk_python.hebe import API, Certificate, SessionRegistry
+
+URL: str = "http://127.0.0.1:1/powiatwulkanowy/api"
+
+
+def test_sessions_are_shared_per_host(certificate: Certificate):
+    async def main():
+        async with SessionRegistry() as registry:
+            first: API = API(certificate, URL, session_registry=registry)
+            second: API = API(
+                certificate, "http://127.0.0.1:1/other/api", session_registry=registry
+            )
+            assert await first._get_session() is await second._get_session()
+            await first.close()
+            await second.close()
+
+    asyncio.run(main())
+
+
+def test_idle_session_is_closed_after_last_release(certificate: Certificate):
+    async def main():
+        registry: SessionRegistry = SessionRegistry(close_idle=True)
+        first: API = API(certificate, URL, session_registry=registry)
+        second: API = API(certificate, URL, session_registry=registry)
+        session: ClientSession = await first._get_session()
+        await second._get_session()
+        await first.close()
+        assert not session.closed
+        await second.close()
+        assert session.closed
+
+    asyncio.run(main())
+
+
+def test_closed_session_is_released_before_reacquiring(certificate: Certificate):
+    async def main():
+        registry: SessionRegistry = SessionRegistry(close_idle=True)
+        api: API = API(certificate, URL, session_registry=registry)
+        other: API = API(certificate, URL, session_registry=registry)
+        stale: ClientSession = await api._get_session()
+        await other._get_session()
+        await stale.close()
+        session: ClientSession = await api._get_session()
+        assert session is not stale
+        assert await other._get_session() is session
+        await api.close()
+        assert not session.closed
+        await other.close()
+        assert session.closed
+
+    asyncio.run(main())
+
+
+def test_releasing_stale_session_keeps_replacement_open(certificate: Certificate):
+    async def main():
+        registry: SessionRegistry = SessionRegistry(close_idle=True)
+        api: API = API(certificate, URL, session_registry=registry)
+        other: API = API(certificate, URL, session_registry=registry)
+        stale: ClientSession = await api._get_session()
+        await stale.close()
+        session: ClientSession = await other._get_session()
+        await api.close()
+        assert not session.closed
+        await other.close()
+        assert session.closed
+
+    asyncio.run(main())
+
+
+def test_sessions_from_previous_loop_are_closed():
+    registry: SessionRegistry = SessionRegistry()
+
+    async def acquire() -> ClientSession:
+        return await registry.acquire(URL)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        first: ClientSession = asyncio.run(acquire())
+        second: ClientSession = asyncio.run(acquire())
+        assert first.closed
+        assert second is not first
+        asyncio.run(registry.close())
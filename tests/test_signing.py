@@ -0,0 +1,59 @@
+import asyncio
+import base64
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from uonet_request_signer_hebe.signer import (
+    get_digest,
+    get_encoded_path,
+    get_headers_list,
+)
+
+from sdk_python.hebe import Certificate
+from sdk_python.hebe.signer import Signer
+
+URL: str = "https://example.com/powiatwulkanowy/api/mobile/register/hebe"
+NOW: datetime = datetime(2022, 9, 1, 8, tzinfo=timezone.utc)
+
+
+def test_signature_verifies_against_certificate(certificate: Certificate):
+    signer: Signer = Signer(certificate.fingerprint, certificate.private_key)
+    public_key = x509.load_der_x509_certificate(
+        base64.b64decode(certificate.pem)
+    ).public_key()
+    for body in (None, '{"Envelope": {}}'):
+        digest, canonical_url, header = signer.sign(URL, body, NOW)
+        assert canonical_url == get_encoded_path(URL)
+        assert digest == (f"SHA-256={get_digest(body)}" if body else None)
+        headers, values = get_headers_list(body, get_digest(body), canonical_url, NOW)
+        assert f'keyId="{certificate.fingerprint}",headers="{headers}"' in header
+        signature: str = re.search(r"SHA256withRSA\((.+)\)\)", header)[1]
+        public_key.verify(
+            base64.b64decode(signature),
+            values.encode("utf-8"),
+            padding.PKCS1v15(),
+            hashes.SHA256(),
+        )
+
+
+def test_bytes_and_text_bodies_sign_the_same(certificate: Certificate):
+    signer: Signer = Signer(certificate.fingerprint, certificate.private_key)
+    body: str = '{"Envelope": "zażółć"}'
+    assert signer.sign(URL, body, NOW) == signer.sign(URL, body.encode("utf-8"), NOW)
+
+
+def test_sign_async_uses_executor(certificate: Certificate):
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            signer: Signer = Signer(
+                certificate.fingerprint, certificate.private_key, executor
+            )
+            assert await signer.sign_async(URL, "{}", NOW) == signer.sign(
+                URL, "{}", NOW
+            )
+
+    asyncio.run(main())
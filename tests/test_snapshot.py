@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from sdk_python.hebe.client import Client
+from sdk_python.hebe.data.snapshot import PupilSnapshot
+from sdk_python.hebe.error import FailedRequestException, NotFoundEntityException
+
+RESOURCES: tuple[str, ...] = (
+    "get_grades_by_pupil_and_period",
+    "get_grades_summary_by_pupil_and_period",
+    "get_exams_by_pupil",
+    "get_homework_by_pupil",
+    "get_notes_by_pupil",
+    "get_meetings_by_pupil",
+    "get_schedule_by_pupil",
+    "get_schedule_changes_by_pupil",
+    "get_teachers_by_pupil_and_period",
+)
+
+
+class FakeClient(Client):
+    def __init__(self, delay: float = 0):
+        super().__init__(None)
+        self.delay = delay
+        self.cancelled: list[str] = []
+        for name in RESOURCES:
+            setattr(self, name, self._get_resource(name))
+
+    def _get_resource(self, name: str):
+        async def get(*args, **kwargs) -> list:
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(name)
+                raise
+            return [name]
+
+        return get
+
+    async def get_lucky_number_by_constituent_unit(self, *args):
+        raise NotFoundEntityException()
+
+
+def get_pupil_info() -> SimpleNamespace:
+    return SimpleNamespace(
+        pupil=SimpleNamespace(id=1),
+        periods=[SimpleNamespace(id=1, current=True)],
+        constituent_unit=SimpleNamespace(id=1),
+    )
+
+
+def test_missing_lucky_number_maps_to_none():
+    async def main():
+        snapshot: PupilSnapshot = await FakeClient().get_pupil_snapshot(
+            get_pupil_info()
+        )
+        assert snapshot.lucky_number is None
+        assert snapshot.exams == ["get_exams_by_pupil"]
+
+    asyncio.run(main())
+
+
+def test_failed_request_cancels_the_others():
+    client: FakeClient = FakeClient(delay=10)
+
+    async def fail(*args, **kwargs):
+        raise FailedRequestException()
+
+    client.get_exams_by_pupil = fail
+
+    async def main():
+        with pytest.raises(FailedRequestException):
+            await asyncio.wait_for(
+                client.get_pupil_snapshot(get_pupil_info(), concurrency=20), 1
+            )
+        assert "get_grades_by_pupil_and_period" in client.cancelled
+
+    asyncio.run(main())
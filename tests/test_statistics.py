@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sdk_python.hebe.statistics import GradeStatistics, GradeStats
+from sdk_python.hebe.sync import SyncResult
+
+
+def get_grade(
+    grade_id: int, subject_id: int, value: float, weight: float = 1
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=grade_id,
+        pupil_id=1,
+        value=value,
+        nominator=None,
+        denominator=None,
+        column=SimpleNamespace(
+            period_id=1, weight=weight, subject=SimpleNamespace(id=subject_id)
+        ),
+    )
+
+
+def test_incremental_updates_and_deletions():
+    statistics: GradeStatistics = GradeStatistics()
+    statistics.apply([get_grade(1, 1, 5, 2), get_grade(2, 1, 2)], pupil_id=1)
+    assert statistics.get(1, 1, 1).average == pytest.approx(4)
+    statistics.apply([get_grade(2, 1, 5)], [1], pupil_id=1)
+    stats: GradeStats = statistics.get(1, 1, 1)
+    assert stats.count == 1
+    assert stats.average == 5
+
+
+def test_period_average_is_mean_of_subject_averages():
+    statistics: GradeStatistics = GradeStatistics()
+    statistics.apply(
+        [get_grade(1, 1, 6), get_grade(2, 2, 2), get_grade(3, 2, 2), get_grade(4, 2, 2)]
+    )
+    stats: GradeStats = statistics.get_by_period(1, 1)
+    assert stats.count == 4
+    assert stats.average == 4
+
+
+def test_behaviour_grades_do_not_collide_with_regular_grades():
+    statistics: GradeStatistics = GradeStatistics()
+    statistics.apply([get_grade(1, 1, 5)], pupil_id=1)
+    statistics.apply([get_grade(1, 2, 3)], pupil_id=1, behaviour=True)
+    assert statistics.get(1, 1, 1).count == 1
+    assert statistics.get(1, 1, 2).count == 1
+    full: SyncResult = SyncResult(
+        items=[get_grade(2, 2, 4)], updated=[get_grade(2, 2, 4)], deleted=[], full=True
+    )
+    statistics.apply_sync(full, 1, 1, behaviour=True)
+    assert statistics.get(1, 1, 1).count == 1
+    assert statistics.get(1, 1, 2).average == 4
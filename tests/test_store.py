@@ -0,0 +1,146 @@
+import asyncio
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from benchmarks import generators
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.data.schedule import ScheduleChange, ScheduleEntry
+from sdk_python.hebe.error import StoreVersionException
+from sdk_python.hebe.store import STORE_VERSION, Store
+from sdk_python.hebe.sync import SyncResult
+
+
+def get_entries(first_id: int, count: int) -> list[ScheduleEntry]:
+    return [
+        ScheduleEntry.parse_obj(generators.schedule_entry(entry_id))
+        for entry_id in range(first_id, first_id + count)
+    ]
+
+
+def test_models_round_trip_through_json(tmp_path):
+    grade: Grade = Grade.parse_obj(generators.grade(1))
+    change: ScheduleChange = ScheduleChange.parse_obj(generators.schedule_change(3, 3))
+    path: str = str(tmp_path / "store.db")
+    with Store(path) as store:
+        store.upsert(Grade, [grade], pupil_id=grade.pupil_id)
+        store.upsert(ScheduleChange, [change], pupil_id=1)
+    connection: sqlite3.Connection = sqlite3.connect(path)
+    (data,) = connection.execute("SELECT data FROM grades").fetchone()
+    connection.close()
+    assert isinstance(data, str)
+    with Store(path) as store:
+        assert store.get(Grade, grade.id, pupil_id=grade.pupil_id) == grade
+        assert store.get(ScheduleChange, change.id, pupil_id=1) == change
+
+
+def test_full_sync_only_clears_synced_date_range():
+    entries: list[ScheduleEntry] = get_entries(0, 40)
+    first_day: date = entries[0].date_
+    with Store() as store:
+        store.upsert(ScheduleEntry, entries, pupil_id=1)
+        store.upsert(ScheduleEntry, entries, pupil_id=2)
+        result: SyncResult = SyncResult(
+            items=entries[:8],
+            updated=entries[:8],
+            deleted=[],
+            full=True,
+            date_from=first_day,
+            date_to=first_day,
+        )
+        store.apply_sync(ScheduleEntry, result, pupil_id=1)
+        assert len(store.query(ScheduleEntry, pupil_id=1)) == 40
+        assert len(store.query(ScheduleEntry, pupil_id=2)) == 40
+
+
+def test_full_sync_removes_stale_rows_of_pupil():
+    grades: list[Grade] = [
+        Grade.parse_obj(generators.grade(grade_id)) for grade_id in range(1, 6)
+    ]
+    pupil_id: int = grades[0].pupil_id
+    with Store() as store:
+        store.upsert(Grade, grades, pupil_id=pupil_id)
+        result: SyncResult = SyncResult(
+            items=grades[:2], updated=grades[:2], deleted=[], full=True
+        )
+        with pytest.raises(TypeError):
+            store.apply_sync(Grade, result)
+        store.apply_sync(Grade, result, pupil_id=pupil_id)
+        assert store.query(Grade, pupil_id=pupil_id) == grades[:2]
+        assert store.get(Grade, grades[0].id, pupil_id=pupil_id) == grades[0]
+        assert store.get(Grade, grades[4].id, pupil_id=pupil_id) is None
+
+
+def test_query_includes_first_day_of_datetime_range():
+    entries: list[ScheduleEntry] = get_entries(0, 40)
+    first_day: date = entries[0].date_
+    with Store() as store:
+        store.upsert(ScheduleEntry, entries, pupil_id=1)
+        midday: datetime = datetime.combine(first_day, datetime.min.time())
+        midday += timedelta(hours=12)
+        found: list[ScheduleEntry] = store.query(
+            ScheduleEntry, pupil_id=1, date_from=midday, date_to=midday
+        )
+        assert [entry.id for entry in found] == list(range(8))
+
+
+def test_async_wrappers_run_off_the_event_loop():
+    entries: list[ScheduleEntry] = get_entries(0, 8)
+
+    async def main():
+        with Store() as store:
+            await store.upsert_async(ScheduleEntry, entries, pupil_id=1)
+            found: list[ScheduleEntry] = await store.query_async(
+                ScheduleEntry, pupil_id=1
+            )
+            assert found == entries
+
+    asyncio.run(main())
+
+
+def test_opening_never_drops_existing_tables(tmp_path):
+    path: str = str(tmp_path / "store.db")
+    connection: sqlite3.Connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("CREATE TABLE notes (text TEXT)")
+        connection.execute("INSERT INTO notes VALUES ('kept')")
+    connection.close()
+    with pytest.raises(sqlite3.OperationalError):
+        Store(path)
+    connection = sqlite3.connect(path)
+    assert connection.execute("SELECT text FROM notes").fetchall() == [("kept",)]
+    assert connection.execute("PRAGMA user_version").fetchone() == (0,)
+    connection.close()
+
+
+def test_unknown_version_is_rejected(tmp_path):
+    path: str = str(tmp_path / "store.db")
+    connection: sqlite3.Connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA user_version = {STORE_VERSION + 1}")
+    connection.close()
+    with pytest.raises(StoreVersionException):
+        Store(path)
+
+
+def test_reopening_keeps_rows(tmp_path):
+    path: str = str(tmp_path / "store.db")
+    entries: list[ScheduleEntry] = get_entries(0, 8)
+    with Store(path) as store:
+        store.upsert(ScheduleEntry, entries, pupil_id=1)
+    with Store(path) as store:
+        assert store.query(ScheduleEntry, pupil_id=1) == entries
+
+
+def test_behaviour_grades_do_not_replace_grades_with_same_id():
+    grade: Grade = Grade.parse_obj(generators.grade(1))
+    behaviour: Grade = Grade.parse_obj({**generators.grade(1), "Content": "wz"})
+    with Store() as store:
+        store.upsert(Grade, [grade], pupil_id=1)
+        store.upsert(Grade, [behaviour], pupil_id=1, behaviour=True)
+        assert store.get(Grade, grade.id, pupil_id=1) == grade
+        assert store.get(Grade, grade.id, pupil_id=1, behaviour=True) == behaviour
+        result: SyncResult = SyncResult(items=[], updated=[], deleted=[], full=True)
+        store.apply_sync(Grade, result, pupil_id=1, behaviour=True)
+        assert store.query(Grade, pupil_id=1) == [grade]
+        assert store.query(Grade, pupil_id=1, behaviour=True) == []
@@ -0,0 +1,76 @@
+import asyncio
+
+from aiohttp import web
+
+from benchmarks.fake_server import FakeHebeServer
+from sdk_python.hebe import API, Certificate
+from sdk_python.hebe.data.grade import Grade
+from sdk_python.hebe.retry import RetryPolicy
+from sdk_python.hebe.scheduler import RequestScheduler
+
+
+class StallingServer(FakeHebeServer):
+    def __init__(self, *args, stalls: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stalls = stalls
+        self.release: asyncio.Event = asyncio.Event()
+        self.events: list[str] = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if self.stalls:
+            self.stalls -= 1
+            self.requests += 1
+            self.events.append("stalled")
+            await self.release.wait()
+        response: web.Response = await super().handle(request)
+        self.events.append("served")
+        return response
+
+
+def test_streamed_models_match_buffered_models(certificate: Certificate):
+    async def main():
+        async with FakeHebeServer({"grade": 30}) as server:
+            async with API(certificate, server.rest_url, trusted=True) as api:
+                buffered: list[Grade] = [
+                    grade
+                    async for page in api.iter_models("grade//byPupil", {}, Grade)
+                    for grade in page
+                ]
+            async with API(
+                certificate,
+                server.rest_url,
+                trusted=True,
+                streaming=True,
+                scheduler=RequestScheduler(),
+            ) as api:
+                streamed: list[Grade] = [
+                    grade
+                    async for page in api.iter_models("grade//byPupil", {}, Grade)
+                    for grade in page
+                ]
+            assert streamed == buffered
+
+    asyncio.run(main())
+
+
+def test_stream_retries_opening_request(certificate: Certificate):
+    async def main():
+        async with StallingServer({"grade": 5}) as server, API(
+            certificate,
+            server.rest_url,
+            retry_policy=RetryPolicy(timeout=0.2, backoff=0),
+        ) as api:
+
+            async def collect() -> list[dict]:
+                return [item async for item in api.stream_page("grade//byPupil", {})]
+
+            try:
+                items: list[dict] = await asyncio.wait_for(collect(), 10)
+                server.events.append("received")
+            finally:
+                server.release.set()
+            assert len(items) == 5
+            assert server.requests == 2
+            assert server.events[:3] == ["stalled", "served", "received"]
+
+    asyncio.run(main())
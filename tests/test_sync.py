@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+from sdk_python.hebe.sync import SyncResult, SyncSession, to_server_time
+
+
+class FakeClient:
+    def __init__(self):
+        self.items: dict[int, Any] = {
+            1: SimpleNamespace(id=1),
+            2: SimpleNamespace(id=2),
+        }
+        self.deleted: list[int] = []
+        self.since: list[datetime] = []
+
+    async def get_exams_by_pupil(self, pupil_id: int, last_sync_date: datetime):
+        self.since.append(last_sync_date)
+        await asyncio.sleep(0.01)
+        return list(self.items.values())
+
+    async def get_deleted_exams_by_pupil(
+        self, pupil_id: int, last_sync_date: datetime
+    ) -> list[int]:
+        return self.deleted
+
+
+def test_incremental_sync_applies_updates_and_deletions():
+    client: FakeClient = FakeClient()
+    session: SyncSession = SyncSession(client, login_id=1)
+
+    async def main():
+        first: SyncResult = await session.sync_exams(1)
+        assert first.full
+        assert client.since == [datetime.min]
+        client.items = {3: SimpleNamespace(id=3)}
+        client.deleted = [1]
+        second: SyncResult = await session.sync_exams(1)
+        assert not second.full
+        assert sorted(item.id for item in second.items) == [2, 3]
+
+    asyncio.run(main())
+
+
+def test_watermark_is_utc_and_sent_as_server_time():
+    client: FakeClient = FakeClient()
+    session: SyncSession = SyncSession(client, login_id=1, margin=timedelta(0))
+
+    async def main():
+        before: datetime = datetime.now(timezone.utc)
+        await session.sync_exams(1)
+        watermark: datetime = next(iter(session.watermarks.values()))
+        assert watermark.tzinfo is not None
+        assert watermark >= before
+        await session.sync_exams(1)
+        assert client.since[1] == to_server_time(watermark)
+        assert client.since[1].tzinfo is None
+
+    asyncio.run(main())
+
+
+def test_concurrent_syncs_of_one_key_are_serialised():
+    client: FakeClient = FakeClient()
+    session: SyncSession = SyncSession(client, login_id=1)
+
+    async def main() -> list[SyncResult]:
+        return await asyncio.gather(session.sync_exams(1), session.sync_exams(1))
+
+    first, second = asyncio.run(main())
+    assert first.full
+    assert not second.full
+    assert client.since[1] != datetime.min
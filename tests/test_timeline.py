@@ -0,0 +1,74 @@
+from datetime import date, datetime, timedelta
+
+from benchmarks import generators
+from sdk_python.hebe.data.schedule import ScheduleChange, ScheduleEntry
+from sdk_python.hebe.data.timeline import Lesson, Timeline
+
+
+def get_entries() -> list[ScheduleEntry]:
+    return [
+        ScheduleEntry.parse_obj(generators.schedule_entry(entry_id))
+        for entry_id in range(16)
+    ]
+
+
+def get_change(change_id: int, entry_id: int, **fields) -> ScheduleChange:
+    data: dict = generators.schedule_change(change_id, entry_id)
+    data.update(fields)
+    return ScheduleChange.parse_obj(data)
+
+
+def test_cancelling_change_keeps_lesson_fields():
+    entries: list[ScheduleEntry] = get_entries()
+    change: ScheduleChange = get_change(
+        3, 1, TeacherPrimary=generators.employee(200), Room=generators.room(99)
+    )
+    timeline: Timeline = Timeline.build(entries, [change])
+    (lesson,) = [lesson for lesson in timeline.lessons if lesson.change]
+    assert lesson.cancelled
+    assert lesson.teacher_primary == entries[1].teacher_primary
+    assert lesson.room == entries[1].room
+
+
+def test_rescheduled_change_moves_new_fields_to_new_lesson():
+    entries: list[ScheduleEntry] = get_entries()
+    change: ScheduleChange = get_change(2, 1, Room=generators.room(99))
+    timeline: Timeline = Timeline.build(entries, [change])
+    cancelled, moved = sorted(
+        (lesson for lesson in timeline.lessons if lesson.change),
+        key=lambda lesson: lesson.rescheduled,
+    )
+    assert cancelled.cancelled and cancelled.room == entries[1].room
+    assert moved.rescheduled and not moved.cancelled
+    assert moved.room.id == 99
+
+
+def test_substitution_replaces_teacher():
+    entries: list[ScheduleEntry] = get_entries()
+    timeline: Timeline = Timeline.build(entries, [get_change(1, 1)])
+    (lesson,) = [lesson for lesson in timeline.lessons if lesson.change]
+    assert not lesson.cancelled
+    assert lesson.teacher_primary.id == 200
+
+
+def test_get_range_accepts_dates():
+    timeline: Timeline = Timeline.build(get_entries())
+    day: date = timeline.lessons[0].date_
+    by_date: list[Lesson] = timeline.get_range(day, day)
+    start: datetime = datetime.combine(day, datetime.min.time())
+    assert by_date == timeline.get_range(start, start + timedelta(days=1))
+    assert by_date == timeline.get_day(day)
+    assert len(by_date) == 8
+
+
+def test_reschedule_without_target_substitutes_original_slot():
+    entries: list[ScheduleEntry] = get_entries()
+    change: ScheduleChange = get_change(
+        2, 1, TimeSlot=None, ChangeDate=None, Room=generators.room(99)
+    )
+    timeline: Timeline = Timeline.build(entries, [change])
+    (lesson,) = [lesson for lesson in timeline.lessons if lesson.change]
+    assert not lesson.cancelled
+    assert lesson.time_slot == entries[1].time_slot
+    assert lesson.room.id == 99
+    assert len(timeline.get_day(entries[1].date_)) == 8
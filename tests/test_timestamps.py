@@ -0,0 +1,106 @@
+import time as clock
+from datetime import date, datetime, time
+
+import pytest
+
+from benchmarks import generators
+from sdk_python.hebe.data.grade import Grade, GradesSummary
+from sdk_python.hebe.data.schedule import ScheduleEntry
+from sdk_python.hebe.parsing import parse_many
+from sdk_python.hebe.timestamps import (
+    DAY_MILLISECONDS,
+    _get_day,
+    convert_timestamps,
+    get_timestamp_fields,
+    to_date,
+    to_datetime,
+    to_time,
+)
+
+TIMESTAMP: int = 1662019200000
+STAMP: dict = {"Timestamp": TIMESTAMP, "Date": "2022-09-01"}
+
+
+def test_timestamp_fields_follow_model_types():
+    assert get_timestamp_fields(ScheduleEntry) == {"Date": date}
+    assert get_timestamp_fields(Grade) == {
+        "DateCreated": datetime,
+        "DateModify": datetime,
+    }
+
+
+def test_convert_timestamps_matches_validators():
+    items: list[dict] = [
+        {"DateCreated": dict(STAMP), "DateModify": None, "Date": dict(STAMP)}
+        for _ in range(3)
+    ]
+    convert_timestamps(items, {"DateCreated": datetime, "Date": date})
+    for item in items:
+        assert item["DateCreated"] == to_datetime(STAMP)
+        assert item["Date"] == to_date(STAMP)
+        assert type(item["Date"]) is date
+        assert item["DateModify"] is None
+    assert items[0]["DateCreated"] is items[1]["DateCreated"]
+
+
+def test_converters_pass_through_converted_values():
+    moment: datetime = datetime.fromtimestamp(TIMESTAMP / 1000)
+    assert to_datetime(moment) is moment
+    assert to_datetime(None) is None
+    assert to_date(moment) == moment.date()
+    assert to_date(moment.date()) == moment.date()
+    assert to_date(None) is None
+    assert to_time("08:05") == time(8, 5)
+    assert to_time("08:05") is to_time("08:05")
+
+
+@pytest.mark.parametrize("trusted", (False, True))
+def test_malformed_summary_date_becomes_none(trusted):
+    items: list[dict] = [
+        {
+            "Id": summary_id,
+            "Subject": generators.subject(1),
+            "Entry_1": None,
+            "Entry_2": "5",
+            "Entry_3": None,
+            "DateModify": date_modify,
+            "PeriodId": 1,
+            "PupilId": 1,
+        }
+        for summary_id, date_modify in enumerate(
+            (
+                {"Timestamp": None},
+                {"Timestamp": [1]},
+                {"Date": "2022-09-01"},
+                dict(STAMP),
+            )
+        )
+    ]
+    summaries: list[GradesSummary] = parse_many(GradesSummary, items, trusted)
+    assert [summary.date_modify for summary in summaries] == [
+        None,
+        None,
+        None,
+        to_datetime(STAMP),
+    ]
+
+
+@pytest.mark.parametrize("zone", ("UTC", "Europe/Warsaw", "America/New_York"))
+def test_dates_are_cached_per_day(monkeypatch, zone):
+    monkeypatch.setenv("TZ", zone)
+    clock.tzset()
+    _get_day.cache_clear()
+    try:
+        timestamps: list[int] = [
+            TIMESTAMP + offset * 3600000 for offset in range(-30, 30)
+        ]
+        for timestamp in timestamps:
+            assert to_date({"Timestamp": timestamp}) == date.fromtimestamp(
+                timestamp / 1000
+            )
+        days: int = len({timestamp // DAY_MILLISECONDS for timestamp in timestamps})
+        assert _get_day.cache_info().currsize == days
+    finally:
+        monkeypatch.undo()
+        clock.tzset()
+        _get_day.cache_clear()